@@ -0,0 +1,64 @@
+# benchmarks/bench_backtest.py
+"""
+Compares ml.Back_Tests on the walk-forward ridge engine against the previous
+per-year Ridge refit on stats[stats["Year"] < year].
+
+Run from the repository root:
+    python -m benchmarks.bench_backtest [--players N]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+
+from benchmarks.bench_metrics import legacy_add_ranks, legacy_average_precision
+from benchmarks.fixtures import MVP_PREDICTORS, make_mvp_stats
+from src.data_collection.ml import BACKTEST_YEARS, Back_Tests
+
+
+def legacy_back_tests(stats, predictors, years=BACKTEST_YEARS):
+    """The original Back_Tests loop: re-slice and refit Ridge from scratch every year."""
+    average_precision_scores = []
+    all_predictions = []
+    for year in years:
+        train = stats[stats["Year"] < year]
+        test = stats[stats["Year"] == year]
+        reg = Ridge(alpha=.1)
+        reg.fit(train[predictors], train["Share"])
+        predictions = reg.predict(test[predictors])
+        predictions = pd.DataFrame(predictions, columns=["Predictions"], index=test.index)
+        combination = pd.concat([test[["Player", "Share"]], predictions], axis=1)
+        combination = legacy_add_ranks(combination)
+        all_predictions.append(combination)
+        average_precision_scores.append(legacy_average_precision(combination))
+    return (
+        sum(average_precision_scores) / len(average_precision_scores),
+        average_precision_scores,
+        pd.concat(all_predictions),
+    )
+
+
+def seconds(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=450, help="players per season")
+    args = parser.parse_args()
+
+    stats = make_mvp_stats(players_per_season=args.players)
+    legacy, expected = seconds(legacy_back_tests, stats, MVP_PREDICTORS)
+    fast, actual = seconds(Back_Tests, stats, MVP_PREDICTORS)
+    assert actual[1] == expected[1]
+    np.testing.assert_allclose(actual[2]["Predictions"], expected[2]["Predictions"])
+    print(f"{'legacy s':>10}{'walk-forward s':>16}{'speedup':>10}")
+    print(f"{legacy:>10.2f}{fast:>16.2f}{legacy / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
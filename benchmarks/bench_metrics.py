@@ -0,0 +1,57 @@
+# benchmarks/bench_metrics.py
+"""
+Compares scoring every backtest season with the vectorized metrics module
+against the previous per-season Add_Ranks + iterrows Average_Precision.
+
+Run from the repository root:
+    python -m benchmarks.bench_metrics [--players N]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data_collection.metrics import add_ranks, average_precision
+from tests.reference_metrics import (
+    legacy_add_ranks,
+    legacy_average_precision,
+    make_predictions,
+)
+
+
+def legacy_score(combination, seasons):
+    ranked, scores = [], []
+    for year in pd.unique(seasons):
+        season = legacy_add_ranks(combination[seasons == year])
+        ranked.append(season)
+        scores.append(legacy_average_precision(season))
+    return pd.concat(ranked), scores
+
+
+def vectorized_score(combination, seasons):
+    ranked = add_ranks(combination, group=seasons)
+    return ranked, average_precision(combination, group=seasons).tolist()
+
+
+def seconds(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=450, help="players per season")
+    args = parser.parse_args()
+
+    combination, seasons = make_predictions(args.players)
+    legacy, (expected_ranks, expected) = seconds(legacy_score, combination, seasons)
+    fast, (ranks, actual) = seconds(vectorized_score, combination, seasons)
+    pd.testing.assert_frame_equal(ranks, expected_ranks)
+    np.testing.assert_allclose(actual, expected)
+    print(f"{'legacy s':>10}{'vectorized s':>14}{'speedup':>10}")
+    print(f"{legacy:>10.3f}{fast:>14.3f}{legacy / fast:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
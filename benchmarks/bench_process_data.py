@@ -0,0 +1,99 @@
+# benchmarks/bench_process_data.py
+"""
+Compares rows/sec of process_data against the previous row-wise .apply
+derivation of WIN, OPPONENT_TEAM_ID and HOME_GAME on a synthetic game log.
+
+Run from the repository root:
+    python -m benchmarks.bench_process_data [--rows N]
+"""
+import argparse
+import time
+
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from benchmarks.fixtures import make_game_log
+from src.data_collection.process_data import (
+    home_games,
+    opponent_team_ids,
+    process_data,
+)
+
+
+def legacy_features(all_games, team_abbr_to_id):
+    """The original per-row derivation of WIN, OPPONENT_TEAM_ID and HOME_GAME."""
+    all_games["WIN"] = all_games["WL"].apply(lambda x: 1 if x == "W" else 0)
+
+    def get_opponent_team_id(matchup, team_abbr_to_id, team_id):
+        if "@" in matchup:
+            opponent_abbr = matchup.split(" @ ")[-1]
+        else:
+            opponent_abbr = matchup.split(" vs. ")[-1]
+        return team_abbr_to_id.get(opponent_abbr, team_id)
+
+    all_games["OPPONENT_TEAM_ID"] = all_games.apply(
+        lambda row: get_opponent_team_id(
+            row["MATCHUP"], team_abbr_to_id, row["TEAM_ID"]
+        ),
+        axis=1,
+    )
+    all_games["HOME_GAME"] = all_games["MATCHUP"].apply(
+        lambda x: 1 if "vs." in x else 0
+    )
+    return all_games
+
+
+def vectorized_features(all_games, team_abbr_to_id):
+    """The same three columns as process_data derives them now."""
+    all_games["WIN"] = (all_games["WL"] == "W").astype(int)
+    all_games["OPPONENT_TEAM_ID"] = opponent_team_ids(
+        all_games["MATCHUP"], all_games["TEAM_ID"], team_abbr_to_id
+    )
+    all_games["HOME_GAME"] = home_games(all_games["MATCHUP"])
+    return all_games
+
+
+def legacy_process_data(all_games, team_abbr_to_id):
+    """The original process_data, built on `legacy_features`."""
+    all_games["GAME_DATE"] = pd.to_datetime(all_games["GAME_DATE"])
+    all_games = legacy_features(all_games, team_abbr_to_id)
+    all_games["PTS"] = all_games["PTS"].astype(float)
+    all_games["Points_Per_Game"] = all_games.groupby("TEAM_ID")["PTS"].transform("mean")
+    all_games["LAST_GAME_RESULT"] = (
+        all_games.groupby("TEAM_ID")["WIN"].shift(1).fillna(0)
+    )
+    le = LabelEncoder()
+    all_games["TEAM_ID"] = le.fit_transform(all_games["TEAM_ID"])
+    all_games["OPPONENT_TEAM_ID"] = le.fit_transform(all_games["OPPONENT_TEAM_ID"])
+    return all_games
+
+
+CASES = {
+    "features": (legacy_features, vectorized_features),
+    "process_data": (legacy_process_data, process_data),
+}
+
+
+def rows_per_second(func, games, team_abbr_to_id):
+    games = games.copy()
+    start = time.perf_counter()
+    result = func(games, team_abbr_to_id)
+    return len(games) / (time.perf_counter() - start), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="game log rows")
+    args = parser.parse_args()
+
+    games, team_abbr_to_id = make_game_log(args.rows)
+    print(f"{'stage':<14}{'legacy rows/s':>16}{'vectorized rows/s':>20}{'speedup':>10}")
+    for name, (legacy_func, fast_func) in CASES.items():
+        legacy, expected = rows_per_second(legacy_func, games, team_abbr_to_id)
+        fast, actual = rows_per_second(fast_func, games, team_abbr_to_id)
+        pd.testing.assert_frame_equal(actual[expected.columns], expected)
+        print(f"{name:<14}{legacy:>16,.0f}{fast:>20,.0f}{fast / legacy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_tables.py
+"""
+Compares pages/sec of the lxml table extractor against the previous
+BeautifulSoup(html.parser) + str(table) + pd.read_html round trip.
+
+Run from the repository root:
+    python -m benchmarks.bench_tables [--pages N]
+"""
+import argparse
+import time
+from io import StringIO
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from benchmarks.fixtures import make_mvp_page, make_player_page, make_team_page
+from src.data_collection.parsing import (
+    parse_mvp_page,
+    parse_player_page,
+    parse_team_page,
+)
+
+
+def legacy_read(page_content, table_ids, drop_class):
+    """The original parsing path: three parses of the same markup per table."""
+    soup = BeautifulSoup(page_content, "html.parser")
+    row = soup.find("tr", class_=drop_class)
+    if row:
+        row.decompose()
+    dfs = []
+    for table_id in table_ids:
+        table = soup.find(id=table_id)
+        if table:
+            dfs.append(pd.read_html(StringIO(str(table)))[0])
+    return dfs
+
+
+CASES = {
+    "player": (
+        make_player_page,
+        parse_player_page,
+        lambda page: legacy_read(page, ["per_game_stats"], "thead"),
+    ),
+    "mvp": (
+        make_mvp_page,
+        parse_mvp_page,
+        lambda page: legacy_read(page, ["mvp"], "over_header"),
+    ),
+    "team": (
+        make_team_page,
+        parse_team_page,
+        lambda page: legacy_read(
+            page, ["divs_standings_E", "divs_standings_W"], "thead"
+        ),
+    ),
+}
+
+
+def pages_per_second(parse, pages):
+    start = time.perf_counter()
+    for page in pages:
+        parse(page)
+    return len(pages) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20, help="pages per case")
+    args = parser.parse_args()
+
+    print(f"{'page':<8}{'legacy pages/s':>16}{'lxml pages/s':>16}{'speedup':>10}")
+    for name, (make_page, parse_page, legacy_parse) in CASES.items():
+        pages = [make_page(seed=i) for i in range(args.pages)]
+        legacy = pages_per_second(legacy_parse, pages)
+        fast = pages_per_second(lambda page: parse_page(page, 2024), pages)
+        print(f"{name:<8}{legacy:>16.1f}{fast:>16.1f}{fast / legacy:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# benchmarks/fixtures.py
+"""Synthetic basketball-reference style pages and datasets for offline benchmarks."""
+import numpy as np
+import pandas as pd
+
+PLAYER_COLUMNS = [
+    "Rk", "Player", "Age", "Team", "Pos", "G", "GS", "MP", "FG", "FGA", "FG%",
+    "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%", "FT", "FTA", "FT%", "ORB",
+    "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF", "PTS", "Awards",
+]
+TEAMS = ["ATL", "BOS", "CHI", "DAL", "DEN", "LAL", "MIA", "NYK", "PHI", "TOT"]
+POSITIONS = ["PG", "SG", "SF", "PF", "C"]
+
+
+def _page(body):
+    return (
+        "<!DOCTYPE html><html><head><title>Stats</title>"
+        "<style>.x{color:red}</style></head><body>"
+        + "<div id='nav'>" + "<a href='#'>link</a>" * 200 + "</div>"
+        + body
+        + "</body></html>"
+    )
+
+
+def make_player_page(n_rows=600, seed=0):
+    """A per_game_stats page with a header row repeated every 20 rows."""
+    rng = np.random.default_rng(seed)
+    header = "".join(f"<th>{col}</th>" for col in PLAYER_COLUMNS)
+    rows = []
+    for i in range(n_rows):
+        if i and i % 20 == 0:
+            rows.append(f'<tr class="thead">{header}</tr>')
+        stats = "".join(
+            f'<td class="right">{value:.1f}</td>' for value in rng.random(25) * 30
+        )
+        rows.append(
+            f'<tr><th scope="row">{i + 1}</th>'
+            f'<td><a href="/players/p{i}.html">Player {i}</a></td>'
+            f"<td>{rng.integers(19, 40)}</td>"
+            f"<td>{TEAMS[i % len(TEAMS)]}</td>"
+            f"<td>{POSITIONS[i % len(POSITIONS)]}</td>"
+            f"{stats}"
+            f'<td>{"MVP-1,AS,NBA1" if i % 50 == 0 else ""}</td></tr>'
+        )
+    table = (
+        '<table id="per_game_stats"><thead><tr>'
+        + header
+        + "</tr></thead><tbody>"
+        + "".join(rows)
+        + "</tbody></table>"
+    )
+    return _page(table)
+
+
+def make_mvp_page(n_rows=15, seed=0):
+    """An awards page with an over_header row above the MVP voting table."""
+    rng = np.random.default_rng(seed)
+    columns = ["Rank", "Player", "Age", "Tm", "First", "Pts Won", "Pts Max", "Share"]
+    rows = "".join(
+        f"<tr><th>{i + 1}</th><td>Player {i}</td><td>{rng.integers(19, 40)}</td>"
+        f"<td>{TEAMS[i % len(TEAMS)]}</td><td>{rng.integers(0, 100)}</td>"
+        f"<td>{rng.integers(0, 1000):,}</td><td>1,000</td>"
+        f"<td>{rng.random():.3f}</td></tr>"
+        for i in range(n_rows)
+    )
+    table = (
+        '<table id="mvp"><thead>'
+        '<tr class="over_header"><th colspan="4"></th><th colspan="4">Voting</th></tr>'
+        "<tr>" + "".join(f"<th>{col}</th>" for col in columns) + "</tr>"
+        "</thead><tbody>" + rows + "</tbody></table>"
+    )
+    return _page(table)
+
+
+def make_team_page(seed=0):
+    """A standings page with East/West tables containing division header rows."""
+    rng = np.random.default_rng(seed)
+    tables = []
+    for conference in ("E", "W"):
+        rows = []
+        for division in range(3):
+            rows.append(
+                f'<tr class="thead"><th colspan="8">Division {division}</th></tr>'
+            )
+            for team in range(5):
+                wins = int(rng.integers(15, 65))
+                rows.append(
+                    f"<tr><th>Team {conference}{division}{team}*</th>"
+                    f"<td>{wins}</td><td>{82 - wins}</td>"
+                    f"<td>{wins / 82:.3f}</td><td>{'—' if team == 0 else team}</td>"
+                    f"<td>{rng.uniform(95, 120):.1f}</td>"
+                    f"<td>{rng.uniform(95, 120):.1f}</td>"
+                    f"<td>{rng.uniform(-10, 10):.2f}</td></tr>"
+                )
+        header = "".join(
+            f"<th>{col}</th>"
+            for col in [
+                f"{'Eastern' if conference == 'E' else 'Western'} Conference",
+                "W", "L", "W/L%", "GB", "PS/G", "PA/G", "SRS",
+            ]
+        )
+        tables.append(
+            f'<table id="divs_standings_{conference}"><thead><tr>{header}</tr>'
+            f"</thead><tbody>{''.join(rows)}</tbody></table>"
+        )
+    return _page("".join(tables))
+
+
+def make_players(n_players=16_000, seed=0):
+    """
+    A players.csv-style frame in the Tm/TOT layout clean_players expects: one
+    per-game stat line per player and season, except that about one player in
+    ten was traded and has a TOT row followed by a row per team. Names carry a
+    '*' (Hall of Fame marker) on some rows, as on basketball-reference.
+    """
+    rng = np.random.default_rng(seed)
+    teams = np.array(TEAMS[:-1])
+    traded = rng.random(n_players) < 0.1
+    player = np.repeat(np.arange(n_players), np.where(traded, 3, 1))
+    position = np.arange(len(player)) - np.searchsorted(player, player)
+    tm = teams[rng.integers(0, len(teams), len(player))]
+    tm = np.where(traded[player] & (position == 0), "TOT", tm)
+
+    names = np.char.add("Player ", (player // 34).astype(str))
+    names = np.where(player % 97 == 0, np.char.add(names, "*"), names)
+    players = pd.DataFrame(
+        {
+            "Rk": player // 34 + 1,
+            "Player": names,
+            "Age": rng.integers(19, 40, n_players)[player],
+            "Tm": tm,
+            "Pos": np.array(POSITIONS)[player % len(POSITIONS)],
+        }
+    )
+    stats = pd.DataFrame(
+        (rng.random((len(player), 25)) * 30).round(1), columns=PLAYER_COLUMNS[5:-1]
+    )
+    players = pd.concat([players, stats], axis=1)
+    players["Awards"] = np.where(player % 50 == 0, "MVP-1,AS,NBA1", None)
+    players["Year"] = 1991 + player % 34
+    return players
+
+
+# Current franchises plus relocated ones that teams.get_teams() no longer lists
+NBA_TEAMS = [
+    "ATL", "BOS", "BKN", "CHA", "CHI", "CLE", "DAL", "DEN", "DET", "GSW",
+    "HOU", "IND", "LAC", "LAL", "MEM", "MIA", "MIL", "MIN", "NOP", "NYK",
+    "OKC", "ORL", "PHI", "PHX", "POR", "SAC", "SAS", "TOR", "UTA", "WAS",
+]
+LEGACY_TEAMS = ["SEA", "NJN", "VAN"]
+TEAM_ABBR_TO_ID = {abbr: 1610612737 + i for i, abbr in enumerate(NBA_TEAMS)}
+
+
+def make_game_log(n_rows=1_000_000, seed=0):
+    """
+    A LeagueGameFinder-style game log: one row per team per game, so each game
+    appears twice ("HOM vs. AWY" and "AWY @ HOM"). Returns (games, team_abbr_to_id).
+    """
+    rng = np.random.default_rng(seed)
+    abbrs = np.array(NBA_TEAMS + LEGACY_TEAMS)
+    ids = np.array(
+        [TEAM_ABBR_TO_ID.get(abbr, 1610612800 + i) for i, abbr in enumerate(abbrs)]
+    )
+    n_games = n_rows // 2
+    home = rng.integers(0, len(abbrs), n_games)
+    away = (home + rng.integers(1, len(abbrs), n_games)) % len(abbrs)
+    home_pts = rng.integers(80, 140, n_games)
+    away_pts = rng.integers(80, 140, n_games)
+    home_won = home_pts >= away_pts
+    dates = pd.Timestamp("1983-10-28") + pd.to_timedelta(
+        np.sort(rng.integers(0, 40 * 365, n_games)), unit="D"
+    )
+    game_ids = np.arange(n_games) + 20000001
+
+    def side(team, opponent, separator, pts, won):
+        return pd.DataFrame(
+            {
+                "SEASON_ID": "2" + pd.Series(dates.year.astype(str)),
+                "TEAM_ID": ids[team],
+                "TEAM_ABBREVIATION": abbrs[team],
+                "GAME_ID": game_ids.astype(str),
+                "GAME_DATE": dates.strftime("%Y-%m-%d"),
+                "MATCHUP": np.char.add(
+                    np.char.add(abbrs[team], separator), abbrs[opponent]
+                ),
+                "WL": np.where(won, "W", "L"),
+                "PTS": pts,
+            }
+        )
+
+    games = pd.concat(
+        [
+            side(home, away, " vs. ", home_pts, home_won),
+            side(away, home, " @ ", away_pts, ~home_won),
+        ]
+    )
+    games = games.sort_values(["GAME_DATE", "GAME_ID"], kind="mergesort")
+    return games.reset_index(drop=True), dict(TEAM_ABBR_TO_ID)
+
+
+# Predictors used by ml.Clean_Dataset on the merged player/MVP/team stats
+MVP_PREDICTORS = [
+    "Age", "G", "GS", "MP", "FG", "FGA", "FG%", "3P", "3PA", "3P%", "2P", "2PA",
+    "2P%", "eFG%", "FT", "FTA", "FT%", "ORB", "DRB", "TRB", "AST", "STL", "BLK",
+    "TOV", "PF", "PTS", "Year", "W", "L", "W/L%", "GB", "PS/G", "PA/G", "SRS",
+]
+
+
+def make_mvp_stats(years=range(1991, 2022), players_per_season=450, seed=0):
+    """
+    A player_mvp_stats-style frame: one row per player per season with the
+    ml.Clean_Dataset predictors and an MVP vote Share that is zero for all but
+    roughly the top dozen players of each season.
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    for year in years:
+        n = players_per_season
+        stats = pd.DataFrame(
+            rng.random((n, len(MVP_PREDICTORS))) * 30, columns=MVP_PREDICTORS
+        )
+        stats["Year"] = year
+        stats["Player"] = [f"Player {year}-{i}" for i in range(n)]
+        score = stats["PTS"] + stats["AST"] + stats["TRB"] + rng.normal(0, 5, n)
+        top = score.rank(ascending=False) <= 12
+        stats["Share"] = np.where(top, rng.random(n), 0.0).round(3)
+        frames.append(stats)
+    return pd.concat(frames, ignore_index=True)
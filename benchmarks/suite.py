@@ -0,0 +1,254 @@
+# benchmarks/suite.py
+"""
+Benchmark suite for the data pipeline with stored baselines and a regression gate.
+
+Every case runs offline on synthetic fixtures (or a local players.csv), so it
+needs no network access. Run from the repository root:
+    python -m benchmarks.suite run [--cases NAME ...] [--output results.json]
+    python -m benchmarks.suite save      # run and store benchmarks/baselines.json
+    python -m benchmarks.suite compare [results.json] [--threshold 0.25]
+
+`compare` runs the suite (or reads saved results) and exits with status 1 when a
+case's median time exceeds its baseline by more than the threshold.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+from benchmarks.fixtures import (
+    MVP_PREDICTORS,
+    make_game_log,
+    make_mvp_stats,
+    make_player_page,
+    make_players,
+)
+from src.data_collection import parsing
+from src.data_collection.analysis import compute_mvp_score
+from src.data_collection.constants import DIRECTORIES
+from src.data_collection.data_cleaning import DataCleaner
+from src.data_collection.ml import Back_Tests
+from src.data_collection.process_data import process_data
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+PLAYERS_CSV = os.path.join(DIRECTORIES["player"], "data", "players.csv")
+DEFAULT_THRESHOLD = 0.25
+
+
+def load_players():
+    """players.csv in the Tm/TOT layout when present, else a synthetic equivalent."""
+    if not os.path.exists(PLAYERS_CSV):
+        return make_players()
+    players = pd.read_csv(PLAYERS_CSV).rename(columns={"Team": "Tm"})
+    players["Tm"] = players["Tm"].str.replace(r"^\dTM$", "TOT", regex=True)
+    return players
+
+
+def scale_players(players, factor):
+    """`factor` copies of `players`, renamed so every copy is a distinct player."""
+    copies = []
+    for i in range(factor):
+        copy = players.copy()
+        copy["Player"] = copy["Player"].astype(str) + f" {i}"
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+# Each case is set up once outside the timer and returns (setup, run): `setup`
+# is called before every round, untimed, and its result is passed to `run`.
+
+
+@contextlib.contextmanager
+def parse_player_case(pages=34):
+    """parse_player (forced, saving the dataset) over saved synthetic season pages."""
+    with tempfile.TemporaryDirectory() as directory:
+        for kind in ("html", "data"):
+            os.makedirs(os.path.join(directory, kind))
+        years = list(range(1991, 1991 + pages))
+        for year in years:
+            with open(os.path.join(directory, "html", f"{year}.html"), "w") as file:
+                file.write(make_player_page(seed=year))
+        with patch.dict(parsing.DIRECTORIES, {"player": directory}), patch.object(
+            parsing, "YEARS", years
+        ):
+            yield tuple, lambda: parsing.parse_player(force=True)
+
+
+@contextlib.contextmanager
+def clean_players_case(factor):
+    """DataCleaner.clean_players on players.csv scaled `factor` times, read from disk."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "players.csv")
+        scale_players(load_players(), factor).to_csv(path, index=False)
+        cleaner = DataCleaner()
+        yield tuple, lambda: cleaner.clean_players(path)
+
+
+@contextlib.contextmanager
+def process_data_case(rows=1_000_000):
+    """process_data on a synthetic game log (a fresh copy every round)."""
+    games, team_abbr_to_id = make_game_log(rows)
+    yield lambda: (games.copy(),), lambda g: process_data(g, team_abbr_to_id)
+
+
+@contextlib.contextmanager
+def back_tests_case():
+    """ml.Back_Tests over 31 synthetic seasons of 450 players."""
+    stats = make_mvp_stats()
+    yield tuple, lambda: Back_Tests(stats, MVP_PREDICTORS)
+
+
+@contextlib.contextmanager
+def compute_mvp_score_case(factor=100):
+    """analysis.compute_mvp_score on players.csv scaled `factor` times."""
+    players = scale_players(load_players(), factor)
+    yield lambda: (players.copy(),), compute_mvp_score
+
+
+# name -> (case, rounds)
+CASES = {
+    "parse_player": (parse_player_case, 5),
+    "clean_players_10x": (lambda: clean_players_case(10), 5),
+    "clean_players_100x": (lambda: clean_players_case(100), 3),
+    "process_data": (process_data_case, 5),
+    "back_tests": (back_tests_case, 15),
+    "compute_mvp_score": (compute_mvp_score_case, 15),
+}
+
+
+def time_case(name, rounds=None):
+    """Times `rounds` runs of a case; returns its median, min and max seconds."""
+    case, default_rounds = CASES[name]
+    timings = []
+    # The pipeline prints and logs progress; keep it out of the suite's output
+    logging.disable(logging.INFO)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), case() as (setup, run):
+            for _ in range(rounds or default_rounds):
+                args = setup()
+                start = time.perf_counter()
+                run(*args)
+                timings.append(time.perf_counter() - start)
+    finally:
+        logging.disable(logging.NOTSET)
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "max": max(timings),
+        "rounds": len(timings),
+    }
+
+
+def machine():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "pandas": pd.__version__,
+        # The clean_players/compute_mvp_score timings depend on which data they used
+        "players": "players.csv" if os.path.exists(PLAYERS_CSV) else "synthetic",
+    }
+
+
+def run_suite(names=None, rounds=None):
+    """Runs the selected cases (all by default); returns the results document."""
+    results = {}
+    for name in names or CASES:
+        results[name] = time_case(name, rounds)
+        print(f"{name:<22}{results[name]['median']:>10.3f}s median", flush=True)
+    return {"machine": machine(), "cases": results}
+
+
+def compare(results, baselines, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares each case's median with its baseline. Returns a frame with the
+    ratio per case and whether it regressed (ratio above 1 + `threshold`).
+    Cases missing from either side are left out.
+    """
+    rows = []
+    for name, result in results["cases"].items():
+        baseline = baselines["cases"].get(name)
+        if baseline is None:
+            continue
+        ratio = result["median"] / baseline["median"]
+        rows.append((name, baseline["median"], result["median"], ratio))
+    table = pd.DataFrame(rows, columns=["case", "baseline_s", "current_s", "ratio"])
+    table["regressed"] = table["ratio"] > 1 + threshold
+    return table.set_index("case")
+
+
+def write_json(document, path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def read_json(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the suite")
+    save = commands.add_parser("save", help="run the suite and store the baselines")
+    check = commands.add_parser("compare", help="flag regressions against the baselines")
+    check.add_argument("results", nargs="?", help="saved results (default: run now)")
+    check.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})",
+    )
+    for command in (run, save, check):
+        command.add_argument("--cases", nargs="+", choices=list(CASES))
+        command.add_argument("--rounds", type=int, help="rounds per case")
+        command.add_argument("--baselines", default=BASELINES)
+    run.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and args.results:
+        results = read_json(args.results)
+    else:
+        results = run_suite(args.cases, args.rounds)
+
+    if args.command == "run":
+        if args.output:
+            write_json(results, args.output)
+        return 0
+    if args.command == "save":
+        # Keep the baselines of cases that were not re-run
+        if args.cases and os.path.exists(args.baselines):
+            stored = read_json(args.baselines)
+            results["cases"] = {**stored["cases"], **results["cases"]}
+        write_json(results, args.baselines)
+        print(f"Baselines saved to {args.baselines}.")
+        return 0
+
+    baselines = read_json(args.baselines)
+    if baselines["machine"] != results["machine"]:
+        print("Warning: the baselines were recorded on a different machine.")
+    table = compare(results, baselines, args.threshold)
+    print(table.to_string(float_format=lambda x: f"{x:.3f}"))
+    regressed = table.index[table["regressed"]].tolist()
+    if regressed:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    print(f"No case regressed by more than {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
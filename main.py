@@ -1,7 +1,11 @@
 # main.py
+import argparse
 from src.data_collection.scraping import scrape_mvp, scrape_player, scrape_team
 from src.data_collection.parsing import parse_mvp, parse_player, parse_team
 from src.data_collection.data_cleaning import DataCleaner
+from src.data_collection.constants import RUN_REPORT
+from src.data_collection.instrumentation import PROFILERS, configure, write_report
+from src.data_collection.pipeline import run_pipeline
 
 
 def display_menu():
@@ -22,7 +26,49 @@ def display_menu():
     print("0: Exit")
 
 
-def main():
+def parse_args():
+    """Parse command-line options for the data collection pipeline."""
+    parser = argparse.ArgumentParser(description="NBA Data Collection Pipeline")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to parse season HTML files (default: 1).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="append",
+        choices=["cleaned"],
+        default=[],
+        help="Also persist an intermediate stage of option 1 (e.g. cleaned datasets).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run every stage of option 1, even those whose inputs are unchanged.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="STAGE",
+        help="Profile a stage of option 1 (e.g. parse_player), or 'all'. Repeatable.",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        default="cprofile",
+        help="Profiler used for --profile stages (default: cprofile).",
+    )
+    parser.add_argument(
+        "--report",
+        default=RUN_REPORT,
+        help=f"Path of the JSON timing and memory report (default: {RUN_REPORT}).",
+    )
+    return parser.parse_args()
+
+
+def main(workers=1, checkpoints=(), force=False, report_path=RUN_REPORT):
     """Main function to execute the data collection workflow."""
     data_cleaner = DataCleaner()  # Initialize the data cleaner
 
@@ -38,59 +84,39 @@ def main():
 
         if choice == "1":
             print("\nRunning the entire pipeline...")
-            print("\nStep 1: Scraping MVP Data...")
-            scrape_mvp()
-
-            print("\nStep 2: Parsing MVP Data...")
-            parse_mvp()
-
-            print("\nStep 3: Scraping Player Statistics...")
-            scrape_player()
-
-            print("\nStep 4: Parsing Player Statistics...")
-            parse_player()
-
-            print("\nStep 5: Scraping Team Statistics...")
-            scrape_team()
-
-            print("\nStep 6: Parsing Team Statistics...")
-            parse_team()
-
-            print("\nCleaning MVP Data...")
-            data_cleaner.clean_mvp(mvp_file_path)
+            results = run_pipeline(
+                workers=workers,
+                checkpoints=("parsed", *checkpoints),
+                cleaner=data_cleaner,
+                force=force,
+            )
 
-            print("\nCleaning Player Data...")
-            cleaned_players = data_cleaner.clean_players(players_file_path)
             print("\nPreview of Cleaned Player Data:")
-            print(cleaned_players.head())
+            print(results["player"].head() if results["player"] is not None else None)
 
-            print("\nCleaning Team Data...")
-            cleaned_teams = data_cleaner.clean_teams(teams_file_path)
             print("\nPreview of Cleaned Team Data:")
-            print(cleaned_teams.head())
-
-            print("\nCleaning Nicknames...")
-            data_cleaner.clean_nick_names(nicknames_file_path)
+            print(results["team"].head() if results["team"] is not None else None)
 
             print("\nData Collection and Cleaning Pipeline Completed Successfully!")
+            print(f"Stage timings written to {write_report(report_path)}")
         elif choice == "2":
             print("\nStep 1: Scraping MVP Data...")
             scrape_mvp()
         elif choice == "3":
             print("\nStep 2: Parsing MVP Data...")
-            parse_mvp()
+            parse_mvp(workers=workers)
         elif choice == "4":
             print("\nStep 3: Scraping Player Statistics...")
             scrape_player()
         elif choice == "5":
             print("\nStep 4: Parsing Player Statistics...")
-            parse_player()
+            parse_player(workers=workers)
         elif choice == "6":
             print("\nStep 5: Scraping Team Statistics...")
             scrape_team()
         elif choice == "7":
             print("\nStep 6: Parsing Team Statistics...")
-            parse_team()
+            parse_team(workers=workers)
         elif choice == "8":
             print("\nCleaning MVP Data...")
             data_cleaner.clean_mvp(mvp_file_path)
@@ -115,4 +141,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    configure(profile=args.profile, profiler=args.profiler)
+    main(
+        workers=args.workers,
+        checkpoints=args.checkpoint,
+        force=args.force,
+        report_path=args.report,
+    )
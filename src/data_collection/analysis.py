@@ -1,10 +1,13 @@
-import pandas as pd
 import os
 import matplotlib.pyplot as plt
 
+from .schema import PLAYER_SCHEMA, apply_schema, csv_dtypes
+from .storage import dataset_path, load_dataset
+
 # Define file paths
 DATA_DIR = "src/data_collection/player/data"
 INPUT_FILE = os.path.join(DATA_DIR, "players.csv")
+INPUT_DATASET = dataset_path(DATA_DIR, "players")
 OUTPUT_FILE = os.path.join(DATA_DIR, "players_2024-2025.csv")
 PLOT_FILE = os.path.join(DATA_DIR, "mvp_ranking_plot.png")
 
@@ -57,15 +60,19 @@ def rank_players():
     and saves the ranked data to a new CSV file.
     """
     # Load the dataset
-    if not os.path.exists(INPUT_FILE):
+    if not os.path.exists(INPUT_DATASET) and not os.path.exists(INPUT_FILE):
         print(f"Error: Input file {INPUT_FILE} not found.")
         return
 
+    # Filter data for the years 2024 and 2025; the columnar dataset only reads those partitions
     print("Loading player data...")
-    players_df = pd.read_csv(INPUT_FILE)
-
-    # Filter data for the years 2024 and 2025
-    filtered_df = players_df[players_df["Year"].isin([2024, 2025])]
+    filtered_df = load_dataset(
+        DATA_DIR,
+        "players",
+        filters=[("Year", "in", [2024, 2025])],
+        dtype=csv_dtypes(PLAYER_SCHEMA),
+    )
+    filtered_df = apply_schema(filtered_df, PLAYER_SCHEMA)
 
     if filtered_df.empty:
         print("No data found for the years 2024-2025.")
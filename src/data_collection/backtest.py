@@ -0,0 +1,205 @@
+# src/data_collection/backtest.py
+import os
+import tempfile
+import joblib
+import numpy as np
+import pandas as pd
+
+
+def ridge_solve(xtx, xty, alpha):
+    """
+    Solves ridge regression from sufficient statistics of a design matrix whose
+    last column is the intercept, which is left unpenalized.
+    """
+    penalty = np.full(len(xty), float(alpha))
+    penalty[-1] = 0.0
+    return np.linalg.solve(xtx + np.diag(penalty), xty)
+
+
+class RidgeModel:
+    """
+    Ridge regression with an unpenalized intercept (what sklearn's Ridge fits),
+    solved from running sufficient statistics. `update` folds a season's rows
+    into XᵀX and Xᵀy, so adding a season costs O(rows·p²) and each solve
+    O(p³), independent of how many seasons came before.
+    """
+
+    def __init__(self, alpha=1.0):
+        self.alpha = alpha
+        self.shift = None
+        self.xtx = None
+        self.xty = None
+        self.coef_ = None
+
+    def update(self, X, y):
+        """Adds training rows. The coefficients are re-solved on the next predict."""
+        if self.shift is None:
+            # Centering on the first batch keeps the sums well conditioned (Year
+            # is ~2000 on every row); the intercept absorbs the shift exactly
+            self.shift = X.mean(axis=0)
+            size = X.shape[1] + 1
+            self.xtx = np.zeros((size, size))
+            self.xty = np.zeros(size)
+        Z = self._design(X)
+        self.xtx += Z.T @ Z
+        self.xty += Z.T @ y
+        self.coef_ = None
+
+    def predict(self, X):
+        if self.xtx is None:
+            raise ValueError("RidgeModel.predict called before any training rows")
+        if self.coef_ is None:
+            self.coef_ = ridge_solve(self.xtx, self.xty, self.alpha)
+        return self._design(X) @ self.coef_
+
+    def _design(self, X):
+        return np.column_stack([X - self.shift, np.ones(len(X))])
+
+
+class RefitModel:
+    """
+    Adapts any scikit-learn style regressor to the walk-forward interface.
+    Seasons are kept as arrays and the estimator is refit from scratch (on a
+    fresh instance from `factory`) only when new rows arrived since the last fit.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.X = []
+        self.y = []
+        self.estimator = None
+
+    def update(self, X, y):
+        self.X.append(X)
+        self.y.append(y)
+        self.estimator = None
+
+    def predict(self, X):
+        if self.estimator is None:
+            self.estimator = self.factory()
+            self.estimator.fit(np.concatenate(self.X), np.concatenate(self.y))
+        return self.estimator.predict(X)
+
+
+def walk_forward(stats, predictors, model, years, target="Share", labels=("Player",)):
+    """
+    Walk-forward backtest: each test year is predicted by a model trained on
+    every earlier season. The feature matrix and the row indices of each season
+    are extracted once; `model` (anything with `update(X, y)` and `predict(X)`,
+    e.g. RidgeModel or RefitModel) is given each season exactly once, in order,
+    just before the first test year that needs it. Yields (year, combination)
+    where combination holds the test rows' `labels`, `target` and "Predictions".
+    """
+    X = stats[predictors].to_numpy(dtype=float)
+    y = stats[target].to_numpy(dtype=float)
+    season_rows = stats.groupby("Year").indices
+    seasons = sorted(season_rows)
+    trained = 0
+
+    for year in years:
+        while trained < len(seasons) and seasons[trained] < year:
+            rows = season_rows[seasons[trained]]
+            model.update(X[rows], y[rows])
+            trained += 1
+
+        rows = season_rows.get(year)
+        if rows is None:
+            continue
+        combination = stats.iloc[rows][[*labels, target]].copy()
+        combination["Predictions"] = model.predict(X[rows])
+        yield year, combination
+
+
+def _score_season(X, y, grams, start, stop, k, columns, alpha, labels, score):
+    """
+    Scores one (season, alpha, predictor subset) combination in a worker. `X`,
+    `y` and `grams` are memory-mapped; the ridge is solved from the Gram prefix
+    of the seasons before this one, restricted to `columns` plus the intercept.
+    """
+    design = [*columns, X.shape[1]]
+    xtx = grams[k, :-1, :-1][np.ix_(design, design)]
+    xty = grams[k, :-1, -1][design]
+    coef = ridge_solve(xtx, xty, alpha)
+    test = np.column_stack([X[start:stop, columns], np.ones(stop - start)])
+    combination = pd.DataFrame(
+        {"Player": labels, "Share": y[start:stop], "Predictions": test @ coef}
+    )
+    return score(combination)
+
+
+def grid_back_tests(
+    stats, predictor_sets, alphas, years, score, n_jobs=-1, target="Share"
+):
+    """
+    Backtests every (predictor set, alpha, year) combination on a process pool.
+    `predictor_sets` maps a name to a list of columns; `score` turns a season's
+    Player/Share/Predictions frame into a number (e.g. ml.Average_Precision).
+
+    Rows are sorted by Year once so each season is a contiguous slice, and the
+    Gram matrix [X 1 y]ᵀ[X 1 y] of every season is accumulated into prefix sums
+    over all predictors at once. The feature matrix and the prefixes are dumped
+    to a temporary directory and memory-mapped, so workers share them instead
+    of receiving pickled copies. Returns one row per (predictors, alpha) with a
+    column per year and the "Mean" score, best first.
+    """
+    predictors = list(
+        dict.fromkeys(col for columns in predictor_sets.values() for col in columns)
+    )
+    stats = stats.sort_values("Year", kind="mergesort")
+    X = stats[predictors].to_numpy(dtype=float)
+    X -= X.mean(axis=0)  # Numerical centering only; the intercept absorbs it
+    y = stats[target].to_numpy(dtype=float)
+    labels = stats["Player"].to_numpy()
+
+    seasons, starts = np.unique(stats["Year"].to_numpy(), return_index=True)
+    bounds = np.append(starts, len(stats))
+    augmented = np.column_stack([X, np.ones(len(X)), y])
+    grams = np.zeros((len(seasons) + 1, augmented.shape[1], augmented.shape[1]))
+    for k in range(len(seasons)):
+        block = augmented[bounds[k] : bounds[k + 1]]
+        grams[k + 1] = grams[k] + block.T @ block
+
+    tasks = []
+    for name, columns in predictor_sets.items():
+        indices = [predictors.index(col) for col in columns]
+        for alpha in alphas:
+            for year in years:
+                k = np.searchsorted(seasons, year)
+                if k == len(seasons) or seasons[k] != year or k == 0:
+                    continue
+                tasks.append((name, alpha, year, indices, k))
+
+    with tempfile.TemporaryDirectory() as directory:
+        shared = {}
+        for key, array in (("X", X), ("y", y), ("grams", grams)):
+            path = os.path.join(directory, f"{key}.npy")
+            joblib.dump(array, path)
+            shared[key] = joblib.load(path, mmap_mode="r")
+
+        scores = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_score_season)(
+                shared["X"],
+                shared["y"],
+                shared["grams"],
+                bounds[k],
+                bounds[k + 1],
+                k,
+                indices,
+                alpha,
+                labels[bounds[k] : bounds[k + 1]],
+                score,
+            )
+            for _, alpha, _, indices, k in tasks
+        )
+
+    results = pd.DataFrame(
+        [(name, alpha, year) for name, alpha, year, _, _ in tasks],
+        columns=["predictors", "alpha", "Year"],
+    )
+    results["score"] = scores
+    table = results.pivot_table(
+        index=["predictors", "alpha"], columns="Year", values="score", sort=False
+    )
+    table.columns = list(table.columns)
+    table["Mean"] = table.mean(axis=1)
+    return table.sort_values("Mean", ascending=False)
@@ -17,3 +17,34 @@ for path in DIRECTORIES.values():
 
 # Years of data to scrape and parse
 YEARS = range(1991, 2025)
+
+# Only the current season still changes; earlier seasons are pinned once scraped
+CURRENT_SEASON = YEARS[-1]
+
+# HTTP fetch settings shared by the scrapers
+MAX_CONCURRENT_REQUESTS = 4  # Requests in flight at once
+REQUESTS_PER_SECOND = 1.0  # Token bucket refill rate per host
+MAX_RETRIES = 3  # Retries on 429/5xx responses and connection errors
+
+# stats.nba.com (nba_api) fetch settings for the game log
+NBA_API_MAX_CONCURRENT_REQUESTS = 4  # LeagueGameFinder calls in flight at once
+NBA_API_REQUESTS_PER_SECOND = 2.0  # Shared across all teams
+NBA_API_TIMEOUT = 30  # Seconds per LeagueGameFinder call
+
+# Rows per chunk when featurizing a game log that is streamed from disk
+GAME_LOG_CHUNK_SIZE = 250_000
+
+# Parsed datasets are stored as Year-partitioned columnar files ("parquet" or
+# "feather"); EXPORT_CSV also writes the consolidated CSV alongside them
+STORAGE_FORMAT = "parquet"
+EXPORT_CSV = True
+
+# Cached process_data outputs, keyed by the raw game log and FEATURES_VERSION
+FEATURE_STORE = os.path.join(BASE_DIR, "feature_store")
+
+# Completed pipeline stages and the fingerprints of their inputs and outputs
+PIPELINE_STATE = os.path.join(BASE_DIR, "pipeline_state.json")
+
+# Per-stage timing/memory report of the last run, and opt-in stage profiles
+RUN_REPORT = os.path.join(BASE_DIR, "run_report.json")
+PROFILE_DIR = os.path.join(BASE_DIR, "profiles")
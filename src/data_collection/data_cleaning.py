@@ -2,8 +2,12 @@ import os
 import csv
 import shutil
 import logging
+import numpy as np
 import pandas as pd
 
+from .schema import MVP_SCHEMA, PLAYER_SCHEMA, TEAM_SCHEMA, apply_schema, csv_dtypes
+from .storage import move_to_backup, read_csv, read_dataset
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -22,10 +26,11 @@ class DataCleaner:
     # -------------------------------------------------------------------------
     # Helper Methods
     # -------------------------------------------------------------------------
-    def backup_file(self, file_path: str):
+    def backup_file(self, file_path: str, move: bool = False):
         """
         Creates a backup of the file in the same directory with '_backup' suffix.
-        If the file doesn't exist, logs a warning.
+        If the file doesn't exist, logs a warning. With `move`, the file is renamed
+        to the backup instead of copied; use it right before overwriting the file.
         """
         if not os.path.exists(file_path):
             logging.warning(f"Cannot create backup; file not found: {file_path}")
@@ -40,7 +45,34 @@ class DataCleaner:
         else:
             logging.info(f"Creating backup for {file_path} -> {backup_path}")
 
-        shutil.copy2(file_path, backup_path)
+        if move:
+            move_to_backup(file_path)
+        elif os.path.isdir(file_path):
+            # Columnar datasets are directories of Year partitions
+            shutil.rmtree(backup_path, ignore_errors=True)
+            shutil.copytree(file_path, backup_path)
+        else:
+            shutil.copy2(file_path, backup_path)
+
+    def load_frame(
+        self,
+        path: str,
+        columns: list = None,
+        filters: list = None,
+        schema: dict = None,
+    ) -> pd.DataFrame:
+        """
+        Reads a dataset from a CSV file or a Year-partitioned Parquet/Feather
+        directory, optionally projecting `columns` and applying (column, op, value)
+        `filters`. Columnar datasets only read the matching partitions. With a
+        `schema` (see schema.py), columns are loaded as its compact dtypes.
+        """
+        if path.endswith(".csv"):
+            dtype = csv_dtypes(schema) if schema else None
+            df = read_csv(path, columns, filters, dtype)
+        else:
+            df = read_dataset(path, columns, filters)
+        return apply_schema(df, schema) if schema else df
 
     def preview_dataframe(self, df: pd.DataFrame, message: str = ""):
         """
@@ -57,7 +89,6 @@ class DataCleaner:
         """
         Removes the specified columns from the CSV and places 'Team' as the first column if present.
         """
-        self.backup_file(csv_path)
         if not os.path.exists(csv_path):
             logging.warning(f"{csv_path} does not exist.")
             return
@@ -80,6 +111,7 @@ class DataCleaner:
             logging.info("Moved 'Team' to the first column.")
 
         self.preview_dataframe(df, "[remove_columns] - DataFrame after column removal")
+        self.backup_file(csv_path, move=True)
         df.to_csv(csv_path, index=False)
         logging.info(f"Saved updated CSV: {csv_path}\n")
 
@@ -92,13 +124,18 @@ class DataCleaner:
         ['Player', 'Year', 'Pts Won', 'Pts Max', 'Share'].
         Returns the cleaned DataFrame.
         """
-        self.backup_file(csv_path)
         if not os.path.exists(csv_path):
             logging.warning(f"{csv_path} does not exist.")
             return pd.DataFrame()
 
         logging.info(f"Reading {csv_path} for MVP cleaning.")
-        df = pd.read_csv(csv_path)
+        return self.clean_mvp_df(self.load_frame(csv_path, schema=MVP_SCHEMA))
+
+    def clean_mvp_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        In-memory form of `clean_mvp`: keeps only the relevant MVP columns, in
+        the compact dtypes of MVP_SCHEMA.
+        """
         keep_cols = ["Player", "Year", "Pts Won", "Pts Max", "Share"]
 
         # Warn for missing columns
@@ -107,7 +144,7 @@ class DataCleaner:
             logging.warning(f"Missing columns in MVP data: {missing}")
 
         existing = [col for col in keep_cols if col in df.columns]
-        df = df[existing]
+        df = apply_schema(df[existing].copy(), MVP_SCHEMA)
 
         self.preview_dataframe(
             df, "[clean_mvp] - DataFrame after filtering MVP columns"
@@ -148,18 +185,57 @@ class DataCleaner:
                 # No TOT row, fallback to the last row
                 return subdf.iloc[[-1]]
 
-    def clean_players(self, csv_path: str) -> pd.DataFrame:
+    def consolidate_tot(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized equivalent of grouping by (Player, Year) and applying `single_row`.
+        Keeps single rows as-is; in groups with a 'TOT' row keeps the TOT row(s) renamed
+        to the group's first team; otherwise keeps the group's last row. Rows come
+        back ordered by (Player, Year), as groupby would return them.
+        """
+        keys = ["Player", "Year"]
+        df = df.dropna(subset=keys).sort_values(keys, kind="mergesort")
+
+        first = ~df.duplicated(keys, keep="first")
+        last = ~df.duplicated(keys, keep="last")
+        group_id = first.cumsum().to_numpy() - 1
+        multi = np.bincount(group_id)[group_id] > 1
+
+        is_tot = df["Tm"].eq("TOT").to_numpy()
+        group_has_tot = np.bincount(group_id, weights=is_tot)[group_id] > 0
+        keep = ~multi | (group_has_tot & is_tot) | (~group_has_tot & last.to_numpy())
+
+        # TOT rows inherit the team of the first row in their group
+        first_team = df["Tm"].to_numpy()[first.to_numpy()][group_id]
+        result = df[keep].copy()
+        rename = (multi & is_tot)[keep]
+        if rename.any():
+            tm = result["Tm"].to_numpy(copy=True)
+            tm[rename] = first_team[keep][rename]
+            result["Tm"] = tm
+        return result.reset_index(drop=True)
+
+    def clean_players(self, csv_path: str, vectorized: bool = True) -> pd.DataFrame:
         """
         Cleans player data by dropping 'Rk', removing '*' from names,
         grouping by (Player, Year), and consolidating TOT rows.
+        TOT rows are consolidated with `consolidate_tot` unless `vectorized` is False,
+        in which case the per-group `single_row` path is used.
         """
-        self.backup_file(csv_path)
         if not os.path.exists(csv_path):
             logging.warning(f"{csv_path} does not exist.")
             return pd.DataFrame()
 
         logging.info(f"Reading {csv_path} for player cleaning.")
-        df = pd.read_csv(csv_path)
+        df = self.load_frame(csv_path, schema=PLAYER_SCHEMA)
+        return self.clean_players_df(df, vectorized)
+
+    def clean_players_df(self, df: pd.DataFrame, vectorized: bool = True) -> pd.DataFrame:
+        """
+        In-memory form of `clean_players`. Works on a copy of `df` and returns
+        the compact dtypes of PLAYER_SCHEMA (stripping names and renaming TOT
+        rows yield plain strings, so the categoricals are rebuilt at the end).
+        """
+        df = df.copy()
 
         # Check if the necessary columns are present
         required_columns = ["Player", "Year", "Tm"]
@@ -178,14 +254,19 @@ class DataCleaner:
         # Remove asterisks from Player names
         df["Player"] = df["Player"].str.replace("*", "", regex=False)
 
-        # Consolidate TOT rows by grouping on (Player, Year)
-        # Use group_keys=False so the grouped keys do not become a new level in the index
-        grouped = df.groupby(["Player", "Year"], group_keys=False).apply(
-            self.single_row
-        )
+        if vectorized:
+            grouped = self.consolidate_tot(df)
+        else:
+            # Consolidate TOT rows by grouping on (Player, Year)
+            # Use group_keys=False so the grouped keys do not become a new level in the index
+            grouped = df.groupby(["Player", "Year"], group_keys=False).apply(
+                self.single_row
+            )
+
+            # Optionally reset the index if you need a flat DataFrame
+            grouped.reset_index(drop=True, inplace=True)
 
-        # Optionally reset the index if you need a flat DataFrame
-        grouped.reset_index(drop=True, inplace=True)
+        grouped = apply_schema(grouped, PLAYER_SCHEMA)
 
         self.preview_dataframe(
             grouped, "[clean_players] - DataFrame after consolidating TOT"
@@ -199,23 +280,28 @@ class DataCleaner:
         """
         Cleans team data by removing rows with 'Division' in 'W' and removing '*' from team names.
         """
-        self.backup_file(csv_path)
         if not os.path.exists(csv_path):
             logging.warning(f"{csv_path} not found.")
             return pd.DataFrame()
 
         logging.info(f"Reading {csv_path} for team cleaning.")
-        df = pd.read_csv(csv_path)
+        return self.clean_teams_df(self.load_frame(csv_path, schema=TEAM_SCHEMA))
+
+    def clean_teams_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        In-memory form of `clean_teams`, returning the dtypes of TEAM_SCHEMA.
+        """
         if "W" not in df.columns:
-            logging.warning(f"'W' column not found in {csv_path}. Returning DF as is.")
+            logging.warning("'W' column not found in team data. Returning DF as is.")
             return df
 
         # Remove rows that contain 'Division' in the 'W' column
-        df = df[~df["W"].str.contains("Division", na=False)]
+        df = df[~df["W"].astype(str).str.contains("Division", na=False)].copy()
 
         # Remove asterisks in Team column
         if "Team" in df.columns:
             df["Team"] = df["Team"].str.replace("*", "", regex=False)
+        df = apply_schema(df, TEAM_SCHEMA)
 
         self.preview_dataframe(
             df, "[clean_teams] - DataFrame after removing 'Division' rows"
@@ -231,13 +317,13 @@ class DataCleaner:
         and standardizing Abbreviation and Name.
         Overwrites the CSV.
         """
-        self.backup_file(csv_path)
         if not os.path.exists(csv_path):
             logging.warning(f"{csv_path} not found.")
             return
 
         logging.info(f"Cleaning nicknames in {csv_path}...")
-        df = pd.read_csv(csv_path)
+        original = pd.read_csv(csv_path)
+        df = original.copy()
 
         if "prefix_2" in df.columns:
             df.drop(columns=["prefix_2"], inplace=True)
@@ -251,6 +337,10 @@ class DataCleaner:
         df["Name"] = df["Name"].str.title()
 
         self.preview_dataframe(df, "[clean_nick_names] - DataFrame after cleaning")
+        if df.equals(original):
+            logging.info(f"{csv_path} is already clean; leaving it untouched.\n")
+            return
+        self.backup_file(csv_path, move=True)
         df.to_csv(csv_path, index=False)
         logging.info(f"Saved updated nicknames to {csv_path}\n")
 
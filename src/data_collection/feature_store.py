@@ -0,0 +1,69 @@
+# src/data_collection/feature_store.py
+import os
+import json
+import hashlib
+import pandas as pd
+import pyarrow.feather as feather
+
+from .constants import FEATURE_STORE
+from .process_data import process_data
+
+# Bump when process_data's output changes so cached feature matrices are rebuilt
+# (2: compact dtypes from schema.FEATURE_SCHEMA)
+FEATURES_VERSION = 2
+
+
+def input_hash(all_games, team_abbr_to_id):
+    """SHA-256 of a raw game log (columns, dtypes and values) and the team mapping."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(map(str, all_games.columns))).encode("utf-8"))
+    digest.update(json.dumps(list(map(str, all_games.dtypes))).encode("utf-8"))
+    row_hashes = pd.util.hash_pandas_object(all_games, index=True)
+    digest.update(row_hashes.to_numpy().tobytes())
+    digest.update(json.dumps(team_abbr_to_id, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def feature_path(key, store_dir=FEATURE_STORE):
+    """Returns the path of a cached feature matrix, <store_dir>/v<N>-<key>.feather."""
+    return os.path.join(store_dir, f"v{FEATURES_VERSION}-{key}.feather")
+
+
+def save_features(df, path):
+    """
+    Writes a feature matrix as uncompressed Feather (Arrow IPC), the layout that
+    can be memory-mapped on load. Written to a temporary file and moved into place.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    feather.write_feather(df, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def load_features(path):
+    """
+    Loads a cached feature matrix memory-mapped: numeric columns are backed by
+    the mapped file instead of being read into fresh buffers.
+    """
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def cached_process_data(
+    all_games, team_abbr_to_id, store_dir=FEATURE_STORE, build=process_data
+):
+    """
+    Returns `build(all_games, team_abbr_to_id)` (process_data by default),
+    reusing the feature matrix cached for the same raw input and FEATURES_VERSION
+    when there is one. On a miss the features are built on a copy, so
+    `all_games` is never modified, and cached for the next run.
+    """
+    path = feature_path(input_hash(all_games, team_abbr_to_id), store_dir)
+    if os.path.exists(path):
+        print(f"Loading cached features from '{path}'.")
+        return load_features(path)
+
+    features = build(all_games.copy(), team_abbr_to_id)
+    save_features(features, path)
+    print(f"Cached features to '{path}'.")
+    return features
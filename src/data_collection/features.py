@@ -0,0 +1,130 @@
+# src/data_collection/features.py
+import numpy as np
+import pandas as pd
+
+
+class WindowFeature:
+    """
+    A feature computed over each team's previous games, in GAME_DATE order.
+    `column` is a game-log column or one of the base columns derived by
+    `game_features` (WIN, PTS, PTS_AGAINST). `window` is the number of previous
+    games to aggregate, or None for every previous game (an expanding window).
+    `agg` is "mean" or "sum"; rows with fewer than `min_periods` previous
+    values get NaN. The current game is never part of its own window.
+    """
+
+    AGGREGATIONS = ("mean", "sum")
+
+    def __init__(self, name, column, window=None, agg="mean", min_periods=1):
+        if agg not in self.AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation: {agg}")
+        if window is not None and window < 1:
+            raise ValueError(f"Window must be at least one game: {window}")
+        self.name = name
+        self.column = column
+        self.window = window
+        self.agg = agg
+        self.min_periods = min_periods
+
+
+# Features built by default; declare a WindowFeature here to add one
+GAME_FEATURES = [
+    WindowFeature("LAST_GAME_WIN", "WIN", window=1),
+    WindowFeature("WIN_PCT_LAST_10", "WIN", window=10),
+    WindowFeature("PTS_FOR_LAST_5", "PTS", window=5),
+    WindowFeature("PTS_AGAINST_LAST_5", "PTS_AGAINST", window=5),
+    WindowFeature("PTS_FOR_AVG", "PTS"),
+    WindowFeature("PTS_AGAINST_AVG", "PTS_AGAINST"),
+]
+
+
+def base_columns(all_games):
+    """
+    WIN, PTS and PTS_AGAINST for every row. PTS_AGAINST is the other row of
+    the same GAME_ID, and NaN when the opponent's row is not in the log.
+    """
+    pts = all_games["PTS"].astype(float)
+    by_game = pts.groupby(all_games["GAME_ID"])
+    both_sides = by_game.transform("size") == 2
+    return pd.DataFrame(
+        {
+            "WIN": (all_games["WL"] == "W").astype(int),
+            "PTS": pts,
+            "PTS_AGAINST": (by_game.transform("sum") - pts).where(both_sides),
+        },
+        index=all_games.index,
+    )
+
+
+def _window_values(values, group_start, feature):
+    """
+    Aggregates the `feature.window` values before each row of a frame sorted by
+    team and date, using prefix sums so that every window costs O(1).
+    """
+    positions = np.arange(len(values))
+    valid = ~np.isnan(values)
+    sums = np.concatenate([[0.0], np.cumsum(np.where(valid, values, 0.0))])
+    counts = np.concatenate([[0], np.cumsum(valid)])
+
+    start = group_start
+    if feature.window is not None:
+        start = np.maximum(group_start, positions - feature.window)
+    total = sums[positions] - sums[start]
+    count = counts[positions] - counts[start]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = total / count if feature.agg == "mean" else total
+    return np.where(count >= max(feature.min_periods, 1), result, np.nan)
+
+
+def game_features(all_games, features=GAME_FEATURES):
+    """
+    Builds leak-free game features: every value only uses the team's earlier
+    games. The log is sorted once by (TEAM_ID, GAME_DATE), keeping the log's
+    order for games on the same date, and each window is a vectorized prefix-sum
+    difference over that order. Also adds REST_DAYS (days since the team's
+    previous game, NaN for its first) and BACK_TO_BACK. Returns a frame aligned
+    with `all_games`, which is left unchanged.
+    """
+    base = base_columns(all_games)
+    unknown = [
+        f"{feature.name} ({feature.column})"
+        for feature in features
+        if feature.column not in base and feature.column not in all_games
+    ]
+    if unknown:
+        raise ValueError(f"Unknown columns for game features: {', '.join(unknown)}")
+    dates = pd.to_datetime(all_games["GAME_DATE"]).to_numpy()
+    team_codes, _ = pd.factorize(all_games["TEAM_ID"], sort=True)
+    order = np.lexsort((dates, team_codes))
+
+    sorted_codes = team_codes[order]
+    is_start = np.ones(len(order), dtype=bool)
+    is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    group_start = np.maximum.accumulate(np.where(is_start, np.arange(len(order)), 0))
+
+    columns = {}
+    for feature in features:
+        source = (base if feature.column in base else all_games)[feature.column]
+        values = source.to_numpy(dtype=float)[order]
+        columns[feature.name] = _window_values(values, group_start, feature)
+
+    sorted_dates = dates[order]
+    rest_days = np.empty(len(order))
+    rest_days[1:] = (sorted_dates[1:] - sorted_dates[:-1]) / np.timedelta64(1, "D")
+    rest_days[is_start] = np.nan
+    columns["REST_DAYS"] = rest_days
+    columns["BACK_TO_BACK"] = (rest_days == 1).astype(int)
+
+    # Scatter the sorted results back to the log's row order
+    result = {}
+    for name, values in columns.items():
+        unsorted = np.empty_like(values)
+        unsorted[order] = values
+        result[name] = unsorted
+    return pd.DataFrame(result, index=all_games.index)
+
+
+def add_game_features(all_games, features=GAME_FEATURES):
+    """Returns a copy of `all_games` with `game_features` appended as columns."""
+    return pd.concat([all_games, game_features(all_games, features)], axis=1)
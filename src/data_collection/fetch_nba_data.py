@@ -1,29 +1,225 @@
+import asyncio
+import os
+from collections import deque
 import pandas as pd
-from time import sleep
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import leaguegamefinder
 
+from .constants import (
+    MAX_RETRIES,
+    NBA_API_MAX_CONCURRENT_REQUESTS,
+    NBA_API_REQUESTS_PER_SECOND,
+    NBA_API_TIMEOUT,
+)
+from .fetcher import TokenBucket
+from .schema import GAME_SCHEMA, read_csv_schema
+from .storage import append_csv
+
+
+async def _fetch_team_games(
+    team, bucket, semaphore, retries, backoff, endpoint, date_from=None
+):
+    """
+    Fetches one team's game log on a worker thread, retrying any failure with
+    exponential backoff. Every attempt, retries included, takes a token from the
+    shared bucket so that the whole league stays under the rate limit. With
+    `date_from` (MM/DD/YYYY), only games on or after that date are requested.
+    """
+    params = {"team_id_nullable": team["id"], "timeout": NBA_API_TIMEOUT}
+    if date_from:
+        params["date_from_nullable"] = date_from
+    attempt = 0
+    while True:
+        await bucket.acquire()
+        try:
+            async with semaphore:
+                finder = await asyncio.to_thread(endpoint, **params)
+                return finder.get_data_frames()[0]
+        except Exception as e:
+            if attempt >= retries:
+                raise
+            print(f"Retrying {team['full_name']} after error: {e}")
+        await asyncio.sleep(backoff * (2**attempt))
+        attempt += 1
+
+
+async def _team_games(
+    nba_teams,
+    max_concurrency=NBA_API_MAX_CONCURRENT_REQUESTS,
+    rate=NBA_API_REQUESTS_PER_SECOND,
+    burst=1,
+    retries=MAX_RETRIES,
+    backoff=1.0,
+    endpoint=leaguegamefinder.LeagueGameFinder,
+    date_from=None,
+    max_ahead=None,
+):
+    """
+    Fetches the teams' game logs with at most `max_concurrency` endpoint calls
+    in flight and one token bucket shared by all teams, and yields
+    (team, games or exception) in `nba_teams` order as each becomes available.
+    At most `max_ahead` teams (twice `max_concurrency` by default) are started
+    before the consumer takes the next one, so frames that finish early do not
+    pile up behind a slow team. `date_from` optionally maps a team ID to the
+    first date to fetch for it.
+    """
+    bucket = TokenBucket(rate, burst)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    max_ahead = max(max_ahead or 2 * max_concurrency, 1)
+    pending = iter(nba_teams)
+    tasks = deque()
+
+    def start_next():
+        team = next(pending, None)
+        if team is not None:
+            task = asyncio.create_task(
+                _fetch_team_games(
+                    team,
+                    bucket,
+                    semaphore,
+                    retries,
+                    backoff,
+                    endpoint,
+                    (date_from or {}).get(team["id"]),
+                )
+            )
+            tasks.append((team, task))
+
+    try:
+        for _ in range(max_ahead):
+            start_next()
+        while tasks:
+            team, task = tasks[0]
+            try:
+                games = await task
+            except Exception as e:
+                games = e
+            tasks.popleft()
+            start_next()
+            yield team, games
+    finally:
+        for _, task in tasks:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+
+
+def iter_team_games(nba_teams, **options):
+    """
+    Fetches every team's game log concurrently and yields (team, games) pairs in
+    `nba_teams` order, where `games` is the team's DataFrame or the exception
+    that exhausted its retries. Frames are handed over as soon as they arrive,
+    so the caller decides whether to keep them; only a bounded number of teams
+    are fetched ahead of the caller. `options` are passed to
+    `_team_games`; max_concurrency=1 fetches the teams one at a time.
+    """
+    loop = asyncio.new_event_loop()
+    games = _team_games(nba_teams, **options)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(games.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(games.aclose())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
 
 # Function to fetch historical NBA game data for all teams
-def fetch_nba_team_data():
+def fetch_nba_team_data(
+    path="data/nba_game_data.csv", materialize=True, incremental=False, **options
+):
+    """
+    Fetches the full game log of every NBA team and streams each team's rows to
+    `path` as they arrive, without keeping them in memory. With `materialize`,
+    the finished file is read back once in the compact GAME_SCHEMA dtypes;
+    otherwise None is returned in place of the games. With `incremental`, an existing
+    file is brought up to date by `sync_nba_team_data` instead of refetched.
+    `options` are passed to `iter_team_games`. Returns (all_games, team_abbr_to_id).
+    """
+    if incremental and _stored_columns(path):
+        return sync_nba_team_data(path, materialize, **options)
+
     nba_teams = teams.get_teams()
     team_abbr_to_id = {team["abbreviation"]: team["id"] for team in nba_teams}
-    all_games = pd.DataFrame()
 
-    for team in nba_teams:
-        team_id = team["id"]
-        print(f"Fetching data for {team['full_name']} (ID: {team_id})...")
-        try:
-            gamefinder = leaguegamefinder.LeagueGameFinder(team_id_nullable=team_id)
-            games = gamefinder.get_data_frames()[0]
-            all_games = pd.concat([all_games, games], ignore_index=True)
-            print(f"Fetched {len(games)} games for {team['full_name']}.")
-        except Exception as e:
-            print(f"Error fetching data for {team['full_name']}: {e}")
-        sleep(1)  # Rate limiting to avoid API issues
+    print(f"Fetching data for {len(nba_teams)} teams...")
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    columns = None
+    for team, games in iter_team_games(nba_teams, **options):
+        if isinstance(games, Exception):
+            print(f"Error fetching data for {team['full_name']}: {games}")
+            continue
+        print(f"Fetched {len(games)} games for {team['full_name']}.")
+        if not games.empty:
+            append_csv(games, tmp_path, columns)
+            columns = columns if columns is not None else list(games.columns)
+
+    if columns is None:
+        pd.DataFrame().to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    print(f"\nAll game data saved to '{path}'.")
 
-    all_games.to_csv("data/nba_game_data.csv", index=False)
-    print("\nAll game data saved to 'data/nba_game_data.csv'.")
+    all_games = None
+    if materialize:
+        all_games = read_csv_schema(path, GAME_SCHEMA) if columns else pd.DataFrame()
     return all_games, team_abbr_to_id
 
 
+def _stored_columns(path):
+    """Returns the header of a stored game log, or [] if there is none yet."""
+    if not os.path.exists(path):
+        return []
+    try:
+        return list(pd.read_csv(path, nrows=0).columns)
+    except pd.errors.EmptyDataError:
+        return []
+
+
+def sync_nba_team_data(path="data/nba_game_data.csv", materialize=True, **options):
+    """
+    Brings a stored game log up to date. Only the key columns of `path` are
+    read to find each team's last GAME_DATE; LeagueGameFinder is then asked for
+    games from that date on (the full history for teams with no stored games),
+    rows already stored are dropped by (GAME_ID, TEAM_ID), and the rest are
+    appended. Re-running after an interruption is safe for the same reason.
+    Falls back to a full fetch when nothing is stored yet. Returns
+    (all_games, team_abbr_to_id), re-reading the whole log only if `materialize`.
+    """
+    columns = _stored_columns(path)
+    if not columns:
+        return fetch_nba_team_data(path, materialize, **options)
+
+    nba_teams = teams.get_teams()
+    team_abbr_to_id = {team["abbreviation"]: team["id"] for team in nba_teams}
+
+    stored = pd.read_csv(
+        path, usecols=["GAME_ID", "TEAM_ID", "GAME_DATE"], dtype={"GAME_ID": str}
+    )
+    last_played = pd.to_datetime(stored["GAME_DATE"]).groupby(stored["TEAM_ID"]).max()
+    date_from = last_played.dt.strftime("%m/%d/%Y").to_dict()
+    stored_keys = pd.MultiIndex.from_frame(stored[["GAME_ID", "TEAM_ID"]])
+    del stored
+
+    print(f"Syncing new games for {len(nba_teams)} teams...")
+    new_games = 0
+    for team, games in iter_team_games(nba_teams, date_from=date_from, **options):
+        if isinstance(games, Exception):
+            print(f"Error fetching data for {team['full_name']}: {games}")
+            continue
+        if not games.empty:
+            keys = pd.MultiIndex.from_arrays(
+                [games["GAME_ID"].astype(str), games["TEAM_ID"]]
+            )
+            games = games[~keys.isin(stored_keys)]
+        if not games.empty:
+            append_csv(games, path, columns)
+            new_games += len(games)
+            print(f"Fetched {len(games)} new games for {team['full_name']}.")
+
+    print(f"\nAppended {new_games} new games to '{path}'.")
+    all_games = read_csv_schema(path, GAME_SCHEMA) if materialize else None
+    return all_games, team_abbr_to_id
@@ -0,0 +1,111 @@
+# src/data_collection/fetcher.py
+import asyncio
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from .constants import MAX_CONCURRENT_REQUESTS, MAX_RETRIES, REQUESTS_PER_SECOND
+
+# Status codes worth retrying: rate limited or a transient server error
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter. Refills `rate` tokens per second up to
+    `capacity`; each request consumes one token. A rate of None disables limiting.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until a token is available and consumes it."""
+        if not self.rate:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_delay(response, attempt, backoff):
+    """Honors a numeric Retry-After header, otherwise backs off exponentially."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.isdigit():
+            return float(retry_after)
+    return backoff * (2**attempt)
+
+
+async def _fetch(url, bucket, semaphore, retries, backoff, timeout, headers):
+    """Fetches a single URL, retrying on 429/5xx and connection errors."""
+    attempt = 0
+    while True:
+        await bucket.acquire()
+        response = None
+        try:
+            async with semaphore:
+                response = await asyncio.to_thread(
+                    requests.get, url, headers=headers, timeout=timeout
+                )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt >= retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                response.raise_for_status()
+                return response
+
+        await asyncio.sleep(_retry_delay(response, attempt, backoff))
+        attempt += 1
+
+
+async def fetch_pages(
+    urls,
+    max_concurrency=MAX_CONCURRENT_REQUESTS,
+    rate=REQUESTS_PER_SECOND,
+    burst=1,
+    retries=MAX_RETRIES,
+    backoff=1.0,
+    timeout=30,
+    headers=None,
+    url_headers=None,
+):
+    """
+    Fetches all URLs concurrently with at most `max_concurrency` requests in flight
+    and a token bucket per host. `url_headers` optionally maps a URL to extra headers
+    (e.g. cache validators) merged over `headers`. Returns a list aligned with `urls`
+    holding either the response or the exception raised for that URL.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    buckets = {}
+    tasks = []
+    for url in urls:
+        host = urlparse(url).netloc
+        if host not in buckets:
+            buckets[host] = TokenBucket(rate, burst)
+        request_headers = {**(headers or {}), **(url_headers or {}).get(url, {})}
+        tasks.append(
+            _fetch(
+                url, buckets[host], semaphore, retries, backoff, timeout, request_headers
+            )
+        )
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def fetch_all(urls, **options):
+    """Synchronous entry point for `fetch_pages`."""
+    return asyncio.run(fetch_pages(urls, **options))
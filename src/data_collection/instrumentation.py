@@ -0,0 +1,258 @@
+# src/data_collection/instrumentation.py
+import os
+import sys
+import json
+import time
+import cProfile
+import threading
+import functools
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+from .constants import PROFILE_DIR, RUN_REPORT
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+# cProfile and pyinstrument hook the whole interpreter, and from Python 3.12 a
+# second profiler cannot be enabled while one is active. Only one stage is
+# profiled at a time; stages that overlap it run unprofiled.
+_PROFILING = threading.Lock()
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident set size in MiB, or None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _cpu_seconds():
+    """CPU time of this process (all threads) and of its reaped child processes."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def count_rows(result, args=()):
+    """
+    Rows handled by a stage: the length of its result when that is a frame or
+    an array, else of its first frame- or array-like argument, else None.
+    """
+    for value in (result, *args):
+        if hasattr(value, "shape") and len(value.shape):
+            return int(value.shape[0])
+    return None
+
+
+class _Profile:
+    """Wraps cProfile or pyinstrument behind start/stop/save."""
+
+    def __init__(self, profiler):
+        if profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{profiler}'; use one of {PROFILERS}")
+        self.profiler = profiler
+        if profiler == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+            except ImportError as e:
+                raise ImportError(
+                    "pyinstrument profiling needs `pip install pyinstrument`"
+                ) from e
+            self._profile = Profiler()
+        else:
+            self._profile = cProfile.Profile()
+
+    def start(self):
+        if self.profiler == "pyinstrument":
+            self._profile.start()
+        else:
+            self._profile.enable()
+
+    def stop(self):
+        if self.profiler == "pyinstrument":
+            self._profile.stop()
+        else:
+            self._profile.disable()
+
+    def save(self, path_stem):
+        """Writes <stem>.prof (pstats/snakeviz) or <stem>.html; returns the path."""
+        if self.profiler == "pyinstrument":
+            path = f"{path_stem}.html"
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(self._profile.output_html())
+        else:
+            path = f"{path_stem}.prof"
+            self._profile.dump_stats(path)
+        return path
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time, peak RSS and row counts of pipeline stages
+    and writes them as a JSON run report. Stages are timed with the `stage`
+    context manager or the `instrument` decorator; either may run concurrently
+    from several threads. Stages named in `profile` are additionally captured
+    with cProfile (or pyinstrument) into `profile_dir`, one stage at a time: a
+    selected stage that starts while another is being profiled runs unprofiled
+    and its record says so under "profile_skipped".
+
+    CPU time and peak RSS are process-wide, so stages that overlap (e.g. the
+    scheduler's parallel branches) share them; peak RSS is the process's
+    high-water mark when the stage ended, and `rss_growth_mb` how far the stage
+    raised it.
+
+    While `enabled` is False stages run untimed and nothing is recorded;
+    `configure` turns recording on.
+    """
+
+    def __init__(
+        self, profile=(), profiler="cprofile", profile_dir=PROFILE_DIR, enabled=True
+    ):
+        self.configure(profile, profiler, profile_dir)
+        self.enabled = enabled
+        self.started = time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.records = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def configure(self, profile=(), profiler="cprofile", profile_dir=PROFILE_DIR):
+        """
+        Turns recording on and selects the stages to profile (by name, or
+        "all") and the profiler.
+        """
+        if profiler not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{profiler}'; use one of {PROFILERS}")
+        self.profile = set(profile)
+        self.profiler = profiler
+        self.profile_dir = profile_dir
+        self.enabled = True
+
+    def _profiled(self, name):
+        return name in self.profile or "all" in self.profile
+
+    def _start_profile(self, record):
+        """Starts a profiler for a stage, or notes in `record` why it was skipped."""
+        if not _PROFILING.acquire(blocking=False):
+            record["profile_skipped"] = "another stage was being profiled"
+            return None
+        try:
+            profile = _Profile(self.profiler)
+            profile.start()
+        except ValueError as e:  # A profiler outside this module is active
+            _PROFILING.release()
+            record["profile_skipped"] = str(e)
+            return None
+        except BaseException:
+            _PROFILING.release()
+            raise
+        return profile
+
+    @contextmanager
+    def stage(self, name, rows=None, **labels):
+        """
+        Times the enclosed block as stage `name`. Yields the stage's record, a
+        dict whose "rows" (and any other key) the block may fill in; `labels`
+        are stored with it, e.g. the dataset kind.
+        """
+        record = {"stage": name, **labels, "rows": rows}
+        if not self.enabled:
+            yield record
+            return
+        profile = self._start_profile(record) if self._profiled(name) else None
+        peak_before = peak_rss_mb()
+        cpu_start = _cpu_seconds()
+        start = time.perf_counter()
+        try:
+            yield record
+            record["status"] = "ok"
+        except BaseException:
+            record["status"] = "failed"
+            raise
+        finally:
+            if profile:
+                profile.stop()
+                _PROFILING.release()
+            record["wall_seconds"] = time.perf_counter() - start
+            record["cpu_seconds"] = _cpu_seconds() - cpu_start
+            record["peak_rss_mb"] = peak_rss_mb()
+            if peak_before is not None:
+                record["rss_growth_mb"] = record["peak_rss_mb"] - peak_before
+            if profile:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                with self._lock:
+                    stem = os.path.join(
+                        self.profile_dir, f"{name}-{len(self.records) + 1}"
+                    )
+                record["profile"] = profile.save(stem)
+            with self._lock:
+                self.records.append(record)
+
+    def instrument(self, name=None, rows=count_rows):
+        """
+        Decorator form of `stage`, named after the function by default. `rows`
+        maps (result, args) to the row count; by default the result's length,
+        or the first array-like argument's.
+        """
+
+        def decorator(func):
+            stage_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage_name) as record:
+                    result = func(*args, **kwargs)
+                    record["rows"] = rows(result, args)
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def report(self):
+        """The run report: run-level metadata, every stage record, and per-stage totals."""
+        with self._lock:
+            records = list(self.records)
+        totals = {}
+        for record in records:
+            total = totals.setdefault(
+                record["stage"],
+                {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "rows": 0},
+            )
+            total["calls"] += 1
+            total["wall_seconds"] += record["wall_seconds"]
+            total["cpu_seconds"] += record["cpu_seconds"]
+            total["rows"] += record["rows"] or 0
+        return {
+            "started": self.started,
+            "argv": sys.argv,
+            "wall_seconds": time.perf_counter() - self._start,
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": records,
+            "totals": totals,
+        }
+
+    def write_report(self, path=RUN_REPORT):
+        """Writes the run report as JSON to `path` and returns the path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+
+# Shared by every module, like the logging module's root logger. It records
+# nothing until a script calls `configure`, so library use (the benchmark suite,
+# the prediction server) does not accumulate stage records.
+RUN = Instrumentation(enabled=False)
+stage = RUN.stage
+instrument = RUN.instrument
+configure = RUN.configure
+write_report = RUN.write_report
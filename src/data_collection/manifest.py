@@ -0,0 +1,92 @@
+# src/data_collection/manifest.py
+import os
+import json
+import pandas as pd
+
+# Bump when a parser's output changes so stale partitions are re-parsed
+PARSER_VERSION = 2
+
+
+class ParseManifest:
+    """
+    Tracks which season HTML files have been parsed. For each season it records the
+    source file's SHA-256, mtime and size along with a pickled partition holding
+    that season's parsed DataFrame, so unchanged seasons can be reused as-is.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, "manifest.json")
+        self.seasons = {}
+        self.output_years = []
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") == PARSER_VERSION:
+                self.seasons = data.get("seasons", {})
+                self.output_years = data.get("output_years", [])
+
+    def save(self):
+        """Writes the manifest back to disk."""
+        os.makedirs(self.directory, exist_ok=True)
+        data = {
+            "version": PARSER_VERSION,
+            "seasons": self.seasons,
+            "output_years": self.output_years,
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _entry(self, year):
+        """Returns the season's entry, or None if it is missing or its partition is gone."""
+        entry = self.seasons.get(str(year))
+        if not entry:
+            return None
+        partition = entry["partition"]
+        if partition and not os.path.exists(os.path.join(self.directory, partition)):
+            return None
+        return entry
+
+    def is_current(self, year, html_path):
+        """True if the HTML file's mtime and size match what was last parsed."""
+        entry = self._entry(year)
+        if not entry:
+            return False
+        stat = os.stat(html_path)
+        return entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    def matches(self, year, digest):
+        """True if the season was last parsed from content with this hash."""
+        entry = self._entry(year)
+        return bool(entry) and entry["sha256"] == digest
+
+    def touch(self, year, html_path):
+        """Refreshes the stored mtime/size after a content-identical rewrite."""
+        stat = os.stat(html_path)
+        entry = self.seasons[str(year)]
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+
+    def record(self, year, html_path, digest, df):
+        """Stores a freshly parsed season. `df` may be None if no table was found."""
+        os.makedirs(self.directory, exist_ok=True)
+        partition = None
+        if df is not None:
+            partition = f"{year}.pkl"
+            df.to_pickle(os.path.join(self.directory, partition))
+        stat = os.stat(html_path)
+        self.seasons[str(year)] = {
+            "sha256": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "partition": partition,
+        }
+
+    def load(self, year):
+        """Returns the stored partition for a season, or None if it had no table."""
+        partition = self.seasons[str(year)]["partition"]
+        if partition is None:
+            return None
+        return pd.read_pickle(os.path.join(self.directory, partition))
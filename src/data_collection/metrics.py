@@ -0,0 +1,167 @@
+# src/data_collection/metrics.py
+import numpy as np
+import pandas as pd
+
+
+def descending_order(values):
+    """
+    Positions that sort `values` from high to low, NaN last. Ties are broken
+    exactly as DataFrame.sort_values(ascending=False) breaks them, so ranks
+    match the ones the per-season pandas code assigned.
+    """
+    values = np.asarray(values, dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    reversed_valid = valid[::-1]
+    order = reversed_valid[values[reversed_valid].argsort(kind="quicksort")][::-1]
+    return np.concatenate([order, np.flatnonzero(np.isnan(values))])
+
+
+def _groups(combination, group):
+    """
+    Returns (codes, keys): a group code per row and the group keys in order of
+    first appearance. `group` is a column name, an array aligned with the rows,
+    or None for a single group.
+    """
+    if group is None:
+        return np.zeros(len(combination), dtype=int), None
+    if isinstance(group, str):
+        group = combination[group]
+    codes, keys = pd.factorize(np.asarray(group))
+    return codes, keys
+
+
+def _ranked(values, codes):
+    """
+    Sorts rows by group, then by `values` high to low within each group.
+    Returns (order, rank): the row positions in that order and each row's
+    1-based rank within its group.
+    """
+    by_group = np.argsort(codes, kind="stable")
+    bounds = np.flatnonzero(np.diff(codes[by_group])) + 1
+    order = np.concatenate(
+        [
+            rows[descending_order(values[rows])]
+            for rows in np.split(by_group, bounds)
+            if len(rows)
+        ]
+        or [np.array([], dtype=int)]
+    )
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+    rank = np.empty(len(order), dtype=int)
+    rank[order] = np.arange(len(order)) - group_start + 1
+    return order, rank
+
+
+def _by_group(result, keys):
+    """A per-group result as a float when ungrouped, else as a Series by group."""
+    return float(result[0]) if keys is None else pd.Series(result, index=keys)
+
+
+def _group_mean(values, codes, size):
+    """Mean of `values` per group code; NaN for groups with no values."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.bincount(codes, values, minlength=size) / np.bincount(
+            codes, minlength=size
+        )
+
+
+def add_ranks(combination, group=None, actual="Share", predicted="Predictions"):
+    """
+    Adds Rk (rank by `actual`), Predicted_Rk (rank by `predicted`) and their
+    Difference within each group, returning the rows ordered by prediction.
+    Equivalent to calling ml.Add_Ranks on each group and concatenating.
+    """
+    codes, _ = _groups(combination, group)
+    _, actual_rank = _ranked(combination[actual].to_numpy(dtype=float), codes)
+    order, predicted_rank = _ranked(combination[predicted].to_numpy(dtype=float), codes)
+    combination = combination.copy()
+    combination["Rk"] = actual_rank
+    combination["Predicted_Rk"] = predicted_rank
+    combination["Difference"] = actual_rank - predicted_rank
+    return combination.iloc[order]
+
+
+def _hits(combination, codes, order, actual_rank, k, label):
+    """
+    Flags, in predicted order, the rows whose `label` is one of the top-k
+    `label`s by actual value in the same group (so a repeated name counts on
+    every row, as the membership test in ml.Average_Precision did).
+    """
+    labels = combination[label].to_numpy()
+    top = actual_rank <= k
+    top_keys = pd.MultiIndex.from_arrays([codes[top], labels[top]])
+    keys = pd.MultiIndex.from_arrays([codes[order], labels[order]])
+    return keys.isin(top_keys)
+
+
+def average_precision(
+    combination,
+    k=5,
+    group=None,
+    actual="Share",
+    predicted="Predictions",
+    label="Player",
+):
+    """
+    Average precision of the prediction ranking against the top `k` rows by
+    `actual`: the mean, over every hit, of the share of hits among the rows
+    ranked so far. Returns a float, or a Series by group when `group` is given
+    (NaN for groups without hits).
+    """
+    codes, keys = _groups(combination, group)
+    size = 1 if keys is None else len(keys)
+    _, actual_rank = _ranked(combination[actual].to_numpy(dtype=float), codes)
+    order, predicted_rank = _ranked(combination[predicted].to_numpy(dtype=float), codes)
+    hits = _hits(combination, codes, order, actual_rank, k, label)
+
+    # Hits so far within the group: a running count minus the earlier groups' hits
+    sorted_codes = codes[order]
+    hits_before = np.r_[0, np.cumsum(np.bincount(sorted_codes[hits], minlength=size))]
+    found = np.cumsum(hits) - hits_before[sorted_codes]
+    precision = found / predicted_rank[order]
+    return _by_group(_group_mean(precision[hits], sorted_codes[hits], size), keys)
+
+
+def ndcg(combination, k=5, group=None, actual="Share", predicted="Predictions"):
+    """
+    Normalized discounted cumulative gain of the top `k` predicted rows, using
+    `actual` as the gain. Returns a float, or a Series by group (NaN for groups
+    whose top-k gain is zero).
+    """
+    codes, keys = _groups(combination, group)
+    size = 1 if keys is None else len(keys)
+    gains = combination[actual].to_numpy(dtype=float)
+    _, actual_rank = _ranked(gains, codes)
+    _, predicted_rank = _ranked(combination[predicted].to_numpy(dtype=float), codes)
+
+    def dcg(rank):
+        discounted = np.where(rank <= k, gains / np.log2(rank + 1), 0.0)
+        return np.bincount(codes, discounted, minlength=size)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _by_group(dcg(predicted_rank) / dcg(actual_rank), keys)
+
+
+def score_seasons(combination, group, k=5, label="Player"):
+    """
+    Scores every season of a backtest in one call. `combination` holds
+    Player/Share/Predictions rows for all seasons and `group` identifies the
+    season of each row. Returns a frame indexed by season with the
+    Average_Precision and NDCG at `k`, and the mean absolute rank Difference
+    of the top `k` actual rows.
+    """
+    codes, keys = _groups(combination, group)
+    _, actual_rank = _ranked(combination["Share"].to_numpy(dtype=float), codes)
+    _, predicted_rank = _ranked(combination["Predictions"].to_numpy(dtype=float), codes)
+    top = actual_rank <= k
+    difference = np.abs(actual_rank - predicted_rank)[top]
+    return pd.DataFrame(
+        {
+            "Average_Precision": average_precision(combination, k, group, label=label),
+            "NDCG": ndcg(combination, k, group),
+            "Mean_Abs_Difference": _group_mean(difference, codes[top], len(keys)),
+        },
+        index=keys,
+    )
@@ -1,8 +1,14 @@
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import Ridge # Shrinks Linear Regression Coefficient to avoid Overfitting
 from sklearn.metrics import mean_squared_error 
 
-stats = pd.read_csv("player_mvp_stats.csv")
+from .backtest import RidgeModel, grid_back_tests, walk_forward
+from .instrumentation import configure, instrument, write_report
+from .metrics import add_ranks, average_precision
+
+# Seasons scored by Back_Tests; the five before them are only ever training data
+BACKTEST_YEARS = list(range(1991, 2022))[5:]
 
 def Clean_Dataset(stats):
     stats = stats.fillna(0)    
@@ -50,53 +56,48 @@ def Prediction(stats, predictors):
     Back_Testing(stats)
 
 def Add_Ranks(combination):
-    combination = combination.sort_values("Share", ascending=False)
-    combination["Rk"] = list(range(1, combination.shape[0]+1))
-    combination = combination.sort_values("Predictions", ascending=False)
-    combination["Predicted_Rk"] = list(range(1, combination.shape[0]+1))
-    combination["Difference"] = combination["Rk"] - combination["Predicted_Rk"]
-    return combination
+    # Rk by Actual Share, Predicted_Rk by Prediction and their Difference
+    return add_ranks(combination)
 
 def Average_Precision(combination):
-    actual = combination.sort_values("Share", ascending=False).head(5)
-    predicted = combination.sort_values("Predictions", ascending=False)
-    ps = []
-    found = 0
-    seen = 1
-    for index, row in predicted.iterrows():
-        if row["Player"] in actual["Player"].values:
-            found += 1
-            ps.append(found/seen)
-        seen += 1
-    return sum(ps) / len(ps)
+    # Average Precision of the Predicted Ranking against the Top 5 by Share
+    return average_precision(combination, k=5)
 
-def Back_Tests(stats, model, year, predictors):
+@instrument()
+def Back_Tests(stats, predictors, model=None, years=BACKTEST_YEARS):
     print("[+] Running Back-Tests....")
-    years = list(range(1991, 2022))
-    average_precision_scores = []
-    all_predictions = []
-    for year in years[5:]:
+    # Previous NBA Seasons are Training Data for each Year's Predictions; the
+    # walk-forward engine adds one season at a time instead of refitting
+    if model is None:
+        model = RidgeModel(alpha=.1)
+    seasons = []
+    combinations = []
+    for year, combination in walk_forward(stats, predictors, model, years):
         print("Year: ", year)
-        # Previous NBA Seasons will be used as Training Data for Model
-        train = stats[stats["Year"]<year]  
-        # Current Year will be Test Dataset
-        test = stats[stats["Year"]==year]
-        reg = Ridge(alpha=.1)
-        reg.fit(train[predictors], train["Share"])
-        predictions = reg.predict(test[predictors])
-        predictions = pd.DataFrame(predictions, columns=["Predictions"], index=test.index)
+        seasons.append(np.full(len(combination), year))
+        combinations.append(combination)
+
+    # Rank and Score every Season at once
+    combination = pd.concat(combinations)
+    seasons = np.concatenate(seasons)
+    all_predictions = add_ranks(combination, group=seasons)
+    average_precision_scores = average_precision(combination, k=5, group=seasons).tolist()
+    print("Average Precision Scores: ", average_precision_scores)
+    return sum(average_precision_scores)/len(average_precision_scores), average_precision_scores, all_predictions
+
+@instrument()
+def Grid_Back_Tests(stats, predictor_sets, alphas=(.1,), years=BACKTEST_YEARS, n_jobs=-1):
+    # Every (Predictor Set, Alpha, Year) Combination is Backtested in Parallel;
+    # returns a Table of Average Precision per Year and its Mean, Best First
+    print("[+] Running Grid Back-Tests....")
+    return grid_back_tests(
+        stats, predictor_sets, alphas, years, Average_Precision, n_jobs=n_jobs
+    )
 
-        # Compare Actual Values to Predictions
-        combination = pd.concat([test[["Player", "Share"]], predictions], axis=1)
-        combination = Add_Ranks(combination)
-        all_predictions.append(combination)
-        print("All Predictions: ", all_predictions)
-        average_precision_scores.append(Average_Precision(combination))
-        print("Average Precision Scores: ", average_precision_scores)
-    return sum(average_precision_scores)/len(average_precision_scores), average_precision_scores, pd.concat(all_predictions)
 if __name__ == '__main__':
+    configure()
+    stats = pd.read_csv("player_mvp_stats.csv")
     stats, predictors = Clean_Dataset(stats)   
     # Prediction(stats, predictors)
-    Back_Tests(stats)
-
-    
\ No newline at end of file
+    Back_Tests(stats, predictors)
+    print(f"Run report written to {write_report()}")
@@ -0,0 +1,88 @@
+# src/data_collection/page_cache.py
+import os
+import json
+import hashlib
+from datetime import datetime, timezone
+
+from .utils import save_html
+
+
+def content_hash(text):
+    """Returns the SHA-256 hex digest of a page's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PageCache:
+    """
+    Persistent index of scraped pages keyed by URL. Each entry records the page's
+    HTTP validators (ETag, Last-Modified), a SHA-256 of the body, and whether the
+    page is pinned as immutable (never fetched again).
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.entries = {}
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+
+    def save(self):
+        """Writes the index back to disk."""
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def is_fresh(self, url, file_path):
+        """True if the page is pinned and its saved copy is still on disk."""
+        entry = self.entries.get(url)
+        return bool(entry and entry.get("immutable") and os.path.exists(file_path))
+
+    def request_headers(self, url, file_path):
+        """
+        Conditional request headers for a URL. Validators are only sent when the
+        saved copy exists, otherwise a 304 would leave us without the page.
+        """
+        entry = self.entries.get(url)
+        if not entry or not os.path.exists(file_path):
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, response, directory, filename):
+        """
+        Records a fetched page, writing it to disk only if its content changed.
+        A 304 response keeps the existing file. Returns True if the file was written.
+        """
+        file_path = os.path.join(directory, filename)
+        entry = self.entries.setdefault(url, {})
+        entry["checked_at"] = datetime.now(timezone.utc).isoformat()
+
+        if response.status_code == 304:
+            return False
+
+        for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            value = response.headers.get(header)
+            if value:
+                entry[key] = value
+            else:
+                entry.pop(key, None)
+
+        digest = content_hash(response.text)
+        unchanged = entry.get("sha256") == digest and os.path.exists(file_path)
+        entry["sha256"] = digest
+        if unchanged:
+            return False
+
+        save_html(response.text, directory, filename)
+        return True
+
+    def pin(self, url):
+        """Marks a page as immutable so later runs skip it entirely."""
+        if url in self.entries:
+            self.entries[url]["immutable"] = True
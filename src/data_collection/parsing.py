@@ -1,169 +1,230 @@
 import os
+import multiprocessing
 import pandas as pd
-from bs4 import BeautifulSoup
-from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
 
 from .constants import DIRECTORIES, YEARS
+from .manifest import ParseManifest
+from .page_cache import content_hash
+from .storage import output_paths, save_dataset
+from .tables import drop_first_row, parse_document, read_table
 from .utils import load_html
 
-def parse_mvp():
-    """
-    Parses MVP HTML files and generates a CSV file containing all player statistics.
-    The resulting CSV file is saved under /data within the 'mvp' directory.
-    """
-    dfs = []
-    log_messages = []
+# The scheduler parses the MVP, player and team branches from parallel threads,
+# and forking a multi-threaded process can deadlock, so workers are started by
+# a fork server (or spawned, where there is none) instead.
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
 
-    for year in YEARS:
-        try:
-            log_messages.append(f"Parsing MVP data for year {year}...")
-            # Combine directory path for the HTML file
-            page_content = load_html(
-                os.path.join(DIRECTORIES["mvp"], "html"), 
-                f"{year}.html"
-            )
-
-            soup = BeautifulSoup(page_content, "html.parser")
-
-            # Remove optional 'over_header' if present
-            over_header = soup.find("tr", class_="over_header")
-            if over_header:
-                over_header.decompose()
-
-            # Find and parse the MVP table
-            mvp_table = soup.find(id="mvp")
-            if not mvp_table:
-                log_messages.append(f"No MVP table found for year {year}, skipping.")
-                continue
 
-            mvp_df = pd.read_html(StringIO(str(mvp_table)))[0]
+def parse_mvp_page(page_content, year):
+    """Parses the MVP voting table from one season's page, or returns None."""
+    doc = parse_document(page_content)
 
-            # Normalize column names
-            mvp_df.columns = mvp_df.columns.str.strip()
+    # Remove optional 'over_header' if present
+    drop_first_row(doc, "over_header")
 
-            # Add the year column
-            mvp_df["Year"] = year
-            dfs.append(mvp_df)
+    # Find and parse the MVP table
+    mvp_df = read_table(doc, "mvp")
+    if mvp_df is None:
+        return None
 
-        except Exception as e:
-            log_messages.append(f"Failed to parse MVP data for year {year}: {e}")
+    # Normalize column names
+    mvp_df.columns = mvp_df.columns.str.strip()
 
-    if dfs:
-        try:
-            mvps = pd.concat(dfs, ignore_index=True)
+    # Add the year column
+    mvp_df["Year"] = year
+    return mvp_df
 
-            # Ensure the /data directory exists
-            data_dir = os.path.join(DIRECTORIES["mvp"], "data")
-            os.makedirs(data_dir, exist_ok=True)
 
-            csv_path = os.path.join(data_dir, "mvps.csv")
-            mvps.to_csv(csv_path, index=False)
-            log_messages.append("MVP data successfully parsed and saved.")
+def parse_player_page(page_content, year):
+    """Parses the per-game stats table from one season's page, or returns None."""
+    doc = parse_document(page_content)
 
-            print("\nSample of the parsed MVP data:")
-            print(mvps.head())
-        except Exception as e:
-            log_messages.append(f"Failed to save MVP data: {e}")
-    else:
-        log_messages.append("No MVP data was parsed.")
+    # Remove optional row
+    drop_first_row(doc, "thead")
 
-    print("\n".join(log_messages))
+    player_df = read_table(doc, "per_game_stats")
+    if player_df is None:
+        return None
 
+    player_df["Year"] = year
+    return player_df
 
-def parse_player():
-    """
-    Parses player statistics HTML files and generates a CSV file.
-    The resulting CSV file is saved under /data within the 'player' directory.
-    """
-    dfs = []
-    for year in YEARS:
-        try:
-            print(f"Parsing player data for year {year}...")
-            page_content = load_html(
-                os.path.join(DIRECTORIES["player"], "html"), 
-                f"{year}.html"
-            )
-            soup = BeautifulSoup(page_content, "html.parser")
-
-            # Remove optional row
-            thead_row = soup.find("tr", class_="thead")
-            if thead_row:
-                thead_row.decompose()
-
-            player_table = soup.find(id="per_game_stats")
-            if not player_table:
-                print(f"No player stats table found for year {year}, skipping.")
-                continue
 
-            player_df = pd.read_html(StringIO(str(player_table)))[0]
-            player_df["Year"] = year
-            dfs.append(player_df)
+def parse_team_page(page_content, year):
+    """Parses both conference standings tables from one season's page, or returns None."""
+    doc = parse_document(page_content)
 
-        except Exception as e:
-            print(f"Failed to parse player data for year {year}: {e}")
+    # Remove optional row
+    drop_first_row(doc, "thead")
+
+    dfs = []
 
-    if dfs:
-        players = pd.concat(dfs, ignore_index=True)
+    # Parse Eastern Conference standings
+    east_teams = read_table(doc, "divs_standings_E")
+    if east_teams is not None:
+        east_teams["Year"] = year
+        east_teams["Conference"] = "Eastern"
+        dfs.append(east_teams)
 
-        # Ensure the /data directory exists
-        data_dir = os.path.join(DIRECTORIES["player"], "data")
-        os.makedirs(data_dir, exist_ok=True)
+    # Parse Western Conference standings
+    west_teams = read_table(doc, "divs_standings_W")
+    if west_teams is not None:
+        west_teams["Year"] = year
+        west_teams["Conference"] = "Western"
+        dfs.append(west_teams)
 
-        csv_path = os.path.join(data_dir, "players.csv")
-        players.to_csv(csv_path, index=False)
-        print("Player statistics successfully parsed and saved.")
-    else:
-        print("No player data was parsed.")
+    if not dfs:
+        return None
+    return pd.concat(dfs, ignore_index=True)
 
 
-def parse_team():
+def parse_seasons(
+    kind, parse_page, name, label, force=False, workers=1, save=True, backup=False
+):
     """
-    Parses team standings HTML files and generates a CSV file.
-    The resulting CSV file is saved under /data within the 'team' directory.
+    Parses every season's HTML for `kind` and saves the consolidated dataset `name`
+    under /data through the storage layer (columnar files, plus CSV if exported).
+    Each season's parsed frame is kept as a partition in data/partitions alongside a
+    manifest of the source file's hash and mtime, so only seasons whose HTML changed
+    are parsed again before the partitions are spliced back together. `force`
+    re-parses every season. With `workers` > 1 changed seasons are parsed in a
+    process pool; results are merged in year order so the output is identical to a
+    serial run. With `save` off the consolidated dataset is only returned, not
+    written; `backup` moves overwritten outputs aside first. Returns the
+    consolidated DataFrame, or None.
     """
-    dfs = []
+    html_dir = os.path.join(DIRECTORIES[kind], "html")
+    data_dir = os.path.join(DIRECTORIES[kind], "data")
+    manifest = ParseManifest(os.path.join(data_dir, "partitions"))
+
+    # Reuse unchanged seasons and queue the rest for parsing
+    season_dfs = {}
+    pending = []
     for year in YEARS:
         try:
-            print(f"Parsing team data for year {year}...")
-            page_content = load_html(
-                os.path.join(DIRECTORIES["team"], "html"), 
-                f"{year}.html"
-            )
-            soup = BeautifulSoup(page_content, "html.parser")
-
-            # Remove optional row
-            thead_row = soup.find("tr", class_="thead")
-            if thead_row:
-                thead_row.decompose()
-
-            # Parse Eastern Conference standings
-            east_table = soup.find(id="divs_standings_E")
-            if east_table:
-                east_teams = pd.read_html(StringIO(str(east_table)))[0]
-                east_teams["Year"] = year
-                east_teams["Conference"] = "Eastern"
-                dfs.append(east_teams)
-
-            # Parse Western Conference standings
-            west_table = soup.find(id="divs_standings_W")
-            if west_table:
-                west_teams = pd.read_html(StringIO(str(west_table)))[0]
-                west_teams["Year"] = year
-                west_teams["Conference"] = "Western"
-                dfs.append(west_teams)
-
+            filename = f"{year}.html"
+            html_path = os.path.join(html_dir, filename)
+            if not force and manifest.is_current(year, html_path):
+                season_dfs[year] = manifest.load(year)
+                continue
+            page_content = load_html(html_dir, filename)
+            digest = content_hash(page_content)
+            if not force and manifest.matches(year, digest):
+                manifest.touch(year, html_path)
+                season_dfs[year] = manifest.load(year)
+                continue
+            pending.append((year, html_path, digest, page_content))
         except Exception as e:
-            print(f"Failed to parse team data for year {year}: {e}")
+            print(f"Failed to parse {label} for year {year}: {e}")
+
+    parsed_years = []
+    for (year, html_path, digest, _), result in zip(
+        pending, _parse_pages(parse_page, pending, label, workers)
+    ):
+        if isinstance(result, Exception):
+            print(f"Failed to parse {label} for year {year}: {result}")
+            continue
+        manifest.record(year, html_path, digest, result)
+        season_dfs[year] = result
+        parsed_years.append(year)
+
+    dfs = []
+    for year in YEARS:
+        if year not in season_dfs:
+            continue
+        if season_dfs[year] is None:
+            print(f"No {label} table found for year {year}, skipping.")
+            continue
+        dfs.append(season_dfs[year])
+
+    output_years = [int(df["Year"].iloc[0]) for df in dfs if len(df)]
+    if not dfs:
+        manifest.save()
+        print(f"No {label} was parsed.")
+        return None
+
+    combined = pd.concat(dfs, ignore_index=True)
+    if not save:
+        manifest.save()
+        print(f"Parsed {label} in memory ({len(parsed_years)} seasons changed).")
+        return combined
+    if (
+        not parsed_years
+        and all(os.path.exists(path) for path in output_paths(data_dir, name))
+        and manifest.output_years == output_years
+    ):
+        manifest.save()
+        print(f"{name} is up to date; no seasons changed.")
+        return combined
+
+    paths = save_dataset(combined, data_dir, name, backup=backup)
+    manifest.output_years = output_years
+    manifest.save()
+    print(f"Re-parsed {len(parsed_years)} of {len(YEARS)} seasons.")
+    print(f"Saved {label} to {', '.join(paths)}.")
+    return combined
+
+
+def _parse_pages(parse_page, pending, label, workers):
+    """
+    Parses queued (year, html_path, digest, page_content) entries, serially or
+    across a process pool. Returns results aligned with `pending`, each either
+    the season's DataFrame (or None) or the exception raised while parsing it.
+    """
+    for year, *_ in pending:
+        print(f"Parsing {label} for year {year}...")
+
+    if workers <= 1 or len(pending) <= 1:
+        results = []
+        for year, _, _, page_content in pending:
+            try:
+                results.append(parse_page(page_content, year))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=_POOL_CONTEXT
+    ) as executor:
+        futures = [
+            executor.submit(parse_page, page_content, year)
+            for year, _, _, page_content in pending
+        ]
+        return [future.exception() or future.result() for future in futures]
+
+
+def parse_mvp(force=False, workers=1):
+    """
+    Parses MVP HTML files and generates a CSV file containing all player statistics.
+    The resulting CSV file is saved under /data within the 'mvp' directory.
+    """
+    mvps = parse_seasons("mvp", parse_mvp_page, "mvps", "MVP data", force, workers)
+    if mvps is not None:
+        print("\nSample of the parsed MVP data:")
+        print(mvps.head())
+    return mvps
 
-    if dfs:
-        teams = pd.concat(dfs, ignore_index=True)
 
-        # Ensure the /data directory exists
-        data_dir = os.path.join(DIRECTORIES["team"], "data")
-        os.makedirs(data_dir, exist_ok=True)
+def parse_player(force=False, workers=1):
+    """
+    Parses player statistics HTML files and generates a CSV file.
+    The resulting CSV file is saved under /data within the 'player' directory.
+    """
+    return parse_seasons(
+        "player", parse_player_page, "players", "player data", force, workers
+    )
 
-        csv_path = os.path.join(data_dir, "teams.csv")
-        teams.to_csv(csv_path, index=False)
-        print("Team data successfully parsed and saved.")
-    else:
-        print("No team data was parsed.")
\ No newline at end of file
+
+def parse_team(force=False, workers=1):
+    """
+    Parses team standings HTML files and generates a CSV file.
+    The resulting CSV file is saved under /data within the 'team' directory.
+    """
+    return parse_seasons(
+        "team", parse_team_page, "teams", "team data", force, workers
+    )
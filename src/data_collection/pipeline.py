@@ -0,0 +1,173 @@
+# src/data_collection/pipeline.py
+import os
+from functools import partial
+
+from .constants import DIRECTORIES, PIPELINE_STATE, YEARS
+from .data_cleaning import DataCleaner
+from .parsing import parse_mvp_page, parse_player_page, parse_seasons, parse_team_page
+from .scheduler import Scheduler, Stage
+from .scraping import scrape_mvp, scrape_player, scrape_team
+from .storage import load_dataset, output_paths, save_dataset
+
+# Each branch is scrape -> parse -> clean. The parsed DataFrame goes straight
+# to the cleaner in memory; nothing is re-read from disk between stages.
+BRANCHES = {
+    "mvp": {
+        "scrape": scrape_mvp,
+        "parse_page": parse_mvp_page,
+        "name": "mvps",
+        "label": "MVP data",
+        "clean": "clean_mvp_df",
+    },
+    "player": {
+        "scrape": scrape_player,
+        "parse_page": parse_player_page,
+        "name": "players",
+        "label": "player data",
+        "clean": "clean_players_df",
+    },
+    "team": {
+        "scrape": scrape_team,
+        "parse_page": parse_team_page,
+        "name": "teams",
+        "label": "team data",
+        "clean": "clean_teams_df",
+    },
+}
+
+# Intermediate results that can be persisted: "parsed" writes mvps/players/teams
+# (the files the rest of the project reads), "cleaned" writes <name>_clean.
+CHECKPOINTS = ("parsed", "cleaned")
+DEFAULT_CHECKPOINTS = ("parsed",)
+
+NICKNAMES_PATH = os.path.join(DIRECTORIES["team"], "data", "nicknames.csv")
+
+# Scrapers share one rate-limited site, so the scheduler runs them one at a time
+SCRAPE_RESOURCE = "basketball-reference"
+
+
+def build_stages(workers=1, checkpoints=DEFAULT_CHECKPOINTS, cleaner=None, scrape=True):
+    """
+    Returns the pipeline graph: scrape_<kind> -> parse_<kind> -> clean_<kind> for
+    each dataset, plus clean_nicknames. Each stage declares the files it reads
+    and writes so the scheduler can skip it when nothing upstream changed.
+    """
+    unknown = set(checkpoints) - set(CHECKPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown checkpoints: {sorted(unknown)}")
+    cleaner = cleaner or DataCleaner()
+
+    stages = []
+    for kind, branch in BRANCHES.items():
+        html_dir = os.path.join(DIRECTORIES[kind], "html")
+        data_dir = os.path.join(DIRECTORIES[kind], "data")
+        pages = [os.path.join(html_dir, f"{year}.html") for year in YEARS]
+        name = branch["name"]
+        clean_name = f"{name}_clean"
+
+        parse_deps = ()
+        if scrape:
+            stages.append(
+                Stage(
+                    f"scrape_{kind}",
+                    lambda _, scrape_pages=branch["scrape"]: scrape_pages(),
+                    outputs=pages,
+                    resource=SCRAPE_RESOURCE,
+                )
+            )
+            parse_deps = (f"scrape_{kind}",)
+
+        save_parsed = "parsed" in checkpoints
+        stages.append(
+            Stage(
+                f"parse_{kind}",
+                partial(_parse, kind, branch, workers, save_parsed),
+                deps=parse_deps,
+                inputs=pages,
+                outputs=output_paths(data_dir, name) if save_parsed else (),
+                load=partial(load_dataset, data_dir, name),
+            )
+        )
+
+        save_cleaned = "cleaned" in checkpoints
+        stages.append(
+            Stage(
+                f"clean_{kind}",
+                partial(_clean, kind, branch, cleaner, data_dir, save_cleaned),
+                deps=(f"parse_{kind}",),
+                outputs=output_paths(data_dir, clean_name) if save_cleaned else (),
+                load=partial(load_dataset, data_dir, clean_name),
+            )
+        )
+
+    stages.append(
+        Stage("clean_nicknames", lambda _: cleaner.clean_nick_names(NICKNAMES_PATH))
+    )
+    return stages
+
+
+def _parse(kind, branch, workers, save, results):
+    return parse_seasons(
+        kind,
+        branch["parse_page"],
+        branch["name"],
+        branch["label"],
+        workers=workers,
+        save=save,
+        backup=True,
+    )
+
+
+def _clean(kind, branch, cleaner, data_dir, save, results):
+    parsed = results[f"parse_{kind}"]
+    if parsed is None:
+        return None
+    cleaned = getattr(cleaner, branch["clean"])(parsed)
+    if save:
+        paths = save_dataset(cleaned, data_dir, f"{branch['name']}_clean", backup=True)
+        print(f"Saved cleaned {branch['label']} to {', '.join(paths)}.")
+    return cleaned
+
+
+def run_graph(
+    workers=1,
+    checkpoints=DEFAULT_CHECKPOINTS,
+    cleaner=None,
+    scrape=True,
+    force=False,
+    state_path=PIPELINE_STATE,
+):
+    """
+    Runs the pipeline graph with the MVP, player and team branches in parallel
+    and returns the scheduler's run report (stage statuses, timings and the
+    critical path). Stages that completed in an earlier run with unchanged
+    inputs are skipped, so a failed run resumes where it stopped.
+    """
+    stages = build_stages(workers, checkpoints, cleaner, scrape)
+    scheduler = Scheduler(stages, state_path)
+    report = scheduler.run(max_workers=len(BRANCHES), force=force)
+
+    # Hand back every branch's cleaned data, loading it if the stage was skipped
+    for kind in BRANCHES:
+        stage = f"clean_{kind}"
+        if report["stages"][stage]["status"] == "skipped":
+            scheduler.result(stage, report["results"])
+    return report
+
+
+def run_pipeline(
+    workers=1,
+    checkpoints=DEFAULT_CHECKPOINTS,
+    cleaner=None,
+    scrape=True,
+    force=False,
+    state_path=PIPELINE_STATE,
+):
+    """
+    Runs the whole collection pipeline in a single pass: every dataset is
+    scraped, parsed and cleaned with DataFrames handed between stages in
+    memory, then the nicknames file is normalized. Returns a dict of the
+    cleaned DataFrames keyed by dataset ('mvp', 'player', 'team').
+    """
+    report = run_graph(workers, checkpoints, cleaner, scrape, force, state_path)
+    return {kind: report["results"].get(f"clean_{kind}") for kind in BRANCHES}
@@ -1,33 +1,59 @@
+import os
+import numpy as np
 import pandas as pd
 from time import sleep  # To handle rate-limiting
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import leaguegamefinder
 from sklearn.preprocessing import LabelEncoder
-from sklearn.model_selection import train_test_split
 
+from .constants import GAME_LOG_CHUNK_SIZE
+from .features import GAME_FEATURES
+from .instrumentation import instrument
+from .schema import FEATURE_SCHEMA, GAME_SCHEMA, apply_schema, csv_dtypes, downcast
+from .storage import append_csv
 
+
+# Opponent abbreviation: the text after the last " @ " (away) or " vs. " (home)
+AWAY_OPPONENT = r"(?s)^(?:.* @ )?(.*)$"
+HOME_OPPONENT = r"(?s)^(?:.* vs\. )?(.*)$"
+
+
+def opponent_team_ids(matchup, team_ids, team_abbr_to_id):
+    """
+    Maps MATCHUP strings ("LAL vs. BOS", "LAL @ BOS") to the opponent's team ID,
+    falling back to the row's own team ID for unknown abbreviations. The string
+    work runs once per distinct matchup rather than once per game.
+    """
+    codes, uniques = pd.factorize(matchup, use_na_sentinel=False)
+    uniques = pd.Series(uniques, dtype=object)
+    away = uniques.str.contains("@", regex=False, na=False)
+    abbr = uniques.str.extract(AWAY_OPPONENT, expand=False).where(
+        away, uniques.str.extract(HOME_OPPONENT, expand=False)
+    )
+    opponent_ids = abbr.map(team_abbr_to_id).to_numpy()[codes]
+    opponent_ids = pd.Series(opponent_ids, index=matchup.index)
+    return opponent_ids.where(opponent_ids.notna(), team_ids).astype(team_ids.dtype)
+
+
+def home_games(matchup):
+    """1 for home games ("vs." in MATCHUP), else 0."""
+    codes, uniques = pd.factorize(matchup, use_na_sentinel=False)
+    uniques = pd.Series(uniques, dtype=object)
+    is_home = uniques.str.contains("vs.", regex=False, na=False)
+    return pd.Series(is_home.to_numpy(dtype=int)[codes], index=matchup.index)
+
+
+@instrument()
 def process_data(all_games, team_abbr_to_id):
     all_games["GAME_DATE"] = pd.to_datetime(all_games["GAME_DATE"])
-    all_games["WIN"] = all_games["WL"].apply(lambda x: 1 if x == "W" else 0)
-    all_games["PTS"] = all_games["PTS"].astype(float)
+    all_games["WIN"] = (all_games["WL"] == "W").astype(int)
+    all_games["PTS"] = downcast(all_games["PTS"], GAME_SCHEMA["PTS"])
     all_games["Points_Per_Game"] = all_games.groupby("TEAM_ID")["PTS"].transform("mean")
 
-    def get_opponent_team_id(matchup, team_abbr_to_id, team_id):
-        if "@" in matchup:
-            opponent_abbr = matchup.split(" @ ")[-1]
-        else:
-            opponent_abbr = matchup.split(" vs. ")[-1]
-        return team_abbr_to_id.get(opponent_abbr, team_id)
-
-    all_games["OPPONENT_TEAM_ID"] = all_games.apply(
-        lambda row: get_opponent_team_id(
-            row["MATCHUP"], team_abbr_to_id, row["TEAM_ID"]
-        ),
-        axis=1,
-    )
-    all_games["HOME_GAME"] = all_games["MATCHUP"].apply(
-        lambda x: 1 if "vs." in x else 0
+    all_games["OPPONENT_TEAM_ID"] = opponent_team_ids(
+        all_games["MATCHUP"], all_games["TEAM_ID"], team_abbr_to_id
     )
+    all_games["HOME_GAME"] = home_games(all_games["MATCHUP"])
     all_games["LAST_GAME_RESULT"] = (
         all_games.groupby("TEAM_ID")["WIN"].shift(1).fillna(0)
     )
@@ -37,24 +63,220 @@ def process_data(all_games, team_abbr_to_id):
     all_games["TEAM_ID"] = le.fit_transform(all_games["TEAM_ID"])
     all_games["OPPONENT_TEAM_ID"] = le.fit_transform(all_games["OPPONENT_TEAM_ID"])
 
-    return all_games
+    return apply_schema(all_games, FEATURE_SCHEMA)
 
 
-# Function to split the dataset into train and test sets
-def split_data(all_games):
-    features = [
-        "TEAM_ID",
-        "OPPONENT_TEAM_ID",
-        "Points_Per_Game",
-        "HOME_GAME",
-        "LAST_GAME_RESULT",
-    ]
-    target = "WIN"
+def scan_game_log(read_chunks, team_abbr_to_id):
+    """
+    First pass over a chunked game log. Collects the only whole-log state that
+    process_data depends on: PTS sums and game counts per TEAM_ID (for
+    Points_Per_Game) and the sorted team and opponent IDs (for the label
+    encodings).
+    """
+    pts_sum = pd.Series(dtype=float)
+    games = pd.Series(dtype=float)
+    team_ids, opponent_ids = set(), set()
+    for chunk in read_chunks():
+        grouped = chunk["PTS"].astype(float).groupby(chunk["TEAM_ID"])
+        pts_sum = pts_sum.add(grouped.sum(), fill_value=0)
+        games = games.add(grouped.count(), fill_value=0)
+        team_ids.update(chunk["TEAM_ID"].unique())
+        opponent_ids.update(
+            opponent_team_ids(chunk["MATCHUP"], chunk["TEAM_ID"], team_abbr_to_id)
+        )
+    return {
+        "points_per_game": pts_sum / games,
+        "team_encoder": LabelEncoder().fit(sorted(team_ids)),
+        "opponent_encoder": LabelEncoder().fit(sorted(opponent_ids)),
+    }
 
-    X = all_games[features]
-    y = all_games[target]
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
+def iter_process_data(read_chunks, team_abbr_to_id):
+    """
+    Chunked equivalent of process_data for game logs that do not fit in memory.
+    `read_chunks` is a zero-argument callable returning a fresh iterator of raw
+    game-log chunks; it is called twice, once by `scan_game_log` and once to
+    featurize. Chunks can be row ranges or per-team partitions. Across chunk
+    boundaries only the last WIN per team is carried, so LAST_GAME_RESULT
+    matches a whole-frame shift in the same row order. Yields featurized chunks
+    with their original index.
+    """
+    state = scan_game_log(read_chunks, team_abbr_to_id)
+    last_win = {}
+    for chunk in read_chunks():
+        chunk = chunk.copy()
+        chunk["GAME_DATE"] = pd.to_datetime(chunk["GAME_DATE"])
+        chunk["WIN"] = (chunk["WL"] == "W").astype(int)
+        chunk["PTS"] = downcast(chunk["PTS"], GAME_SCHEMA["PTS"])
+        chunk["Points_Per_Game"] = chunk["TEAM_ID"].map(state["points_per_game"])
+
+        chunk["OPPONENT_TEAM_ID"] = opponent_team_ids(
+            chunk["MATCHUP"], chunk["TEAM_ID"], team_abbr_to_id
+        )
+        chunk["HOME_GAME"] = home_games(chunk["MATCHUP"])
+        chunk["LAST_GAME_RESULT"] = (
+            chunk.groupby("TEAM_ID")["WIN"]
+            .shift(1)
+            .fillna(chunk["TEAM_ID"].map(last_win))
+            .fillna(0)
+        )
+        last_win.update(chunk.groupby("TEAM_ID")["WIN"].last())
+
+        chunk["TEAM_ID"] = state["team_encoder"].transform(chunk["TEAM_ID"])
+        chunk["OPPONENT_TEAM_ID"] = state["opponent_encoder"].transform(
+            chunk["OPPONENT_TEAM_ID"]
+        )
+        yield apply_schema(chunk, FEATURE_SCHEMA)
+
+
+def process_data_file(
+    path, team_abbr_to_id, output_path, chunksize=GAME_LOG_CHUNK_SIZE
+):
+    """
+    Featurizes the game log CSV at `path` into `output_path`, holding at most
+    one chunk of `chunksize` rows in memory. Returns the number of rows written.
+    """
+
+    def read_chunks():
+        chunks = pd.read_csv(path, chunksize=chunksize, dtype=csv_dtypes(GAME_SCHEMA))
+        return (apply_schema(chunk, GAME_SCHEMA) for chunk in chunks)
+
+    tmp_path = f"{output_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    rows = 0
+    columns = None
+    for chunk in iter_process_data(read_chunks, team_abbr_to_id):
+        append_csv(chunk, tmp_path, columns)
+        columns = columns if columns is not None else list(chunk.columns)
+        rows += len(chunk)
+    if columns is None:
+        pd.DataFrame().to_csv(tmp_path, index=False)
+    os.replace(tmp_path, output_path)
+    return rows
+
+
+def team_state(all_games, processed_games, team_abbr_to_id):
+    """
+    Per-team inputs for predicting upcoming games, indexed by the raw TEAM_ID:
+    the label-encoded TEAM_CODE and OPPONENT_CODE that process_data assigned,
+    Points_Per_Game, and LAST_GAME_RESULT as the WIN of the team's most recent
+    game by GAME_DATE. `all_games` is the raw log `processed_games` was built
+    from (same index), which still holds the unencoded IDs.
+    """
+    raw_team_ids = all_games["TEAM_ID"]
+    raw_opponent_ids = opponent_team_ids(
+        all_games["MATCHUP"], raw_team_ids, team_abbr_to_id
+    )
+    by_date = processed_games.sort_values("GAME_DATE", kind="mergesort")
+    latest = by_date.groupby(raw_team_ids.loc[by_date.index]).last()
+
+    state = pd.DataFrame(
+        {
+            "TEAM_CODE": latest["TEAM_ID"],
+            "Points_Per_Game": latest["Points_Per_Game"],
+            "LAST_GAME_RESULT": latest["WIN"].astype(float),
+        }
     )
-    return X_train, X_test, y_train, y_test
+    opponent_codes = processed_games["OPPONENT_TEAM_ID"].groupby(raw_opponent_ids)
+    state["OPPONENT_CODE"] = opponent_codes.first().reindex(state.index)
+    abbreviations = {team_id: abbr for abbr, team_id in team_abbr_to_id.items()}
+    state["ABBREVIATION"] = state.index.map(abbreviations)
+    state.index.name = "TEAM_ID"
+    return state
+
+
+# Columns split_data hands to the model, and the target it predicts
+FEATURES = [
+    "TEAM_ID",
+    "OPPONENT_TEAM_ID",
+    "Points_Per_Game",
+    "HOME_GAME",
+    "LAST_GAME_RESULT",
+]
+TARGET = "WIN"
+
+# Opt-in alternative to FEATURES built by features.add_game_features, where
+# every value only uses a team's earlier games. Points_Per_Game is the mean
+# over the team's entire log across all seasons, so it includes the game being
+# predicted and every later one.
+LEAK_FREE_FEATURES = [
+    "TEAM_ID",
+    "OPPONENT_TEAM_ID",
+    "HOME_GAME",
+    *(feature.name for feature in GAME_FEATURES),
+    "REST_DAYS",
+    "BACK_TO_BACK",
+]
+
+
+def chronological_order(all_games):
+    """Row positions ordered by GAME_DATE, keeping the log's order within a date."""
+    dates = pd.to_datetime(all_games["GAME_DATE"]).to_numpy()
+    return np.argsort(dates, kind="stable")
+
+
+def time_split_point(dates, test_size=0.2):
+    """
+    Number of leading rows of date-sorted `dates` that go to training: about
+    1 - `test_size` of them, moved back to the start of a date so that no date
+    (and so no game, whose two rows share it) straddles the split.
+    """
+    split = int(round(len(dates) * (1 - test_size)))
+    if 0 < split < len(dates):
+        split = int(np.searchsorted(dates, dates[split], side="left"))
+    return split
+
+
+# Function to split the dataset into train and test sets
+def split_data(all_games, test_size=0.2, features=FEATURES):
+    """
+    Chronological train/test split of the `features` columns: the latest
+    `test_size` of games (by GAME_DATE) are held out, so no future game is
+    trained on. When the log is already in date order the four results are
+    row-slice views of a single feature frame; otherwise the rows are reordered
+    once first.
+    """
+    order = chronological_order(all_games)
+    X = all_games[features]
+    y = all_games[TARGET]
+    if not np.array_equal(order, np.arange(len(order))):
+        X, y = X.iloc[order], y.iloc[order]
+
+    dates = pd.to_datetime(all_games["GAME_DATE"]).to_numpy()[order]
+    split = time_split_point(dates, test_size)
+    return X.iloc[:split], X.iloc[split:], y.iloc[:split], y.iloc[split:]
+
+
+def rolling_origin_splits(
+    all_games, n_splits=5, period="SEASON_ID", max_train_periods=None
+):
+    """
+    Rolling-origin cross-validation over whole periods (seasons by default, or
+    calendar years of GAME_DATE when `period` is not a column). A season's
+    preseason, regular season, play-in and playoff games form one period. Each
+    of the last `n_splits` periods is a test fold trained on the periods before
+    it; all of them, or only the latest `max_train_periods`. Periods are ordered
+    by their first game. Yields (train, test) arrays of row positions, so the
+    generator can be passed as `cv` to scikit-learn.
+    """
+    dates = pd.to_datetime(all_games["GAME_DATE"])
+    if period == "SEASON_ID" and period in all_games.columns:
+        # A season-type digit (1 preseason, 2 regular season, 4 playoffs,
+        # 5 play-in) followed by the year the season starts
+        periods = all_games[period].astype(str).str[-4:].to_numpy()
+    elif period in all_games.columns:
+        periods = all_games[period].to_numpy()
+    else:
+        periods = dates.dt.year.to_numpy()
+    first_game = pd.Series(dates.to_numpy()).groupby(periods).min()
+    ordered = first_game.sort_values(kind="mergesort").index
+    codes = pd.Index(ordered).get_indexer(periods)
+
+    for test_code in range(max(len(ordered) - n_splits, 1), len(ordered)):
+        first_train = 0
+        if max_train_periods is not None:
+            first_train = max(test_code - max_train_periods, 0)
+        train = np.flatnonzero((codes >= first_train) & (codes < test_code))
+        test = np.flatnonzero(codes == test_code)
+        yield train, test
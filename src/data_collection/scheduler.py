@@ -0,0 +1,237 @@
+# src/data_collection/scheduler.py
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .instrumentation import count_rows, stage as instrumented_stage
+
+
+class Stage:
+    """
+    One node of the pipeline graph. `func` is called with a dict mapping each
+    dependency's name to its result. `inputs` and `outputs` are the files or
+    directories the stage reads and writes; `load` rebuilds the stage's result
+    from its outputs when the stage is skipped but a downstream stage needs it.
+    Stages sharing a `resource` (e.g. a rate-limited website) never run at once.
+    """
+
+    def __init__(
+        self, name, func, deps=(), inputs=(), outputs=(), load=None, resource=None
+    ):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.load = load
+        self.resource = resource
+
+    @property
+    def is_source(self):
+        """Sources (e.g. scrapers) have nothing to compare against and always run."""
+        return not self.deps and not self.inputs
+
+
+def path_fingerprint(path):
+    """Size and mtime of a file, or of every file below a directory."""
+    if not os.path.exists(path):
+        return "missing"
+    if os.path.isfile(path):
+        stat = os.stat(path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    entries = []
+    for root, _, files in os.walk(path):
+        for filename in sorted(files):
+            file_path = os.path.join(root, filename)
+            stat = os.stat(file_path)
+            rel_path = os.path.relpath(file_path, path)
+            entries.append(f"{rel_path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return ";".join(sorted(entries))
+
+
+def _digest(parts):
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class Scheduler:
+    """
+    Runs a graph of stages, starting each one as soon as its dependencies are
+    done so that independent branches proceed concurrently. A stage is skipped
+    when its declared inputs and its dependencies' outputs are unchanged since
+    it last completed and its outputs still exist. Completed stages are
+    recorded in `state_path` after each one finishes, so a run that fails can
+    be resumed: the next run skips everything that already succeeded.
+    """
+
+    def __init__(self, stages, state_path):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_path = state_path
+        self.order = self._topological_order()
+        self.state = {}
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as file:
+                self.state = json.load(file)
+        self._lock = threading.Lock()
+
+    def _topological_order(self):
+        order = []
+        visiting = set()
+        done = set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name not in self.stages:
+                raise ValueError(f"Unknown dependency '{name}' of stage '{path[-1]}'")
+            if name in visiting:
+                raise ValueError(f"Cycle in stage graph: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [name])
+        return order
+
+    def save(self):
+        """Writes the completed-stage state back to disk."""
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self.state, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def _input_key(self, stage):
+        """Fingerprint of what the stage consumes: its inputs and its deps' outputs."""
+        parts = [f"input {path} {path_fingerprint(path)}" for path in stage.inputs]
+        for dep in stage.deps:
+            parts.append(f"dep {dep} {self.state.get(dep, {}).get('output_key')}")
+        return _digest(parts)
+
+    def _output_key(self, stage):
+        return _digest([f"{path} {path_fingerprint(path)}" for path in stage.outputs])
+
+    def _is_current(self, stage, input_key):
+        entry = self.state.get(stage.name)
+        return (
+            not stage.is_source
+            and bool(stage.outputs)
+            and entry is not None
+            and entry["input_key"] == input_key
+            and all(os.path.exists(path) for path in stage.outputs)
+            and entry["output_key"] == self._output_key(stage)
+        )
+
+    def result(self, name, results):
+        """Returns a dependency's result, loading it from disk if the stage was skipped."""
+        if name not in results:
+            stage = self.stages[name]
+            results[name] = stage.load() if stage.load else None
+        return results[name]
+
+    def _execute(self, stage, results, force):
+        """Runs (or skips) one stage. Returns (status, seconds)."""
+        start = time.perf_counter()
+        with self._lock:
+            input_key = self._input_key(stage)
+            if not force and self._is_current(stage, input_key):
+                return "skipped", time.perf_counter() - start
+
+        dep_results = {dep: self.result(dep, results) for dep in stage.deps}
+        with instrumented_stage(stage.name) as record:
+            results[stage.name] = stage.func(dep_results)
+            record["rows"] = count_rows(results[stage.name])
+
+        with self._lock:
+            self.state[stage.name] = {
+                "input_key": input_key,
+                "output_key": self._output_key(stage),
+            }
+            self.save()
+        return "ran", time.perf_counter() - start
+
+    def run(self, max_workers=None, force=False):
+        """
+        Runs the graph and returns a report with each stage's status
+        ('ran', 'skipped', 'failed' or 'blocked') and duration, the wall time, and
+        the critical path: the chain of dependent stages that took longest.
+        A failed stage blocks its descendants; unrelated branches still finish.
+        """
+        results = {}
+        report = {}
+        pending = list(self.order)
+        running = {}
+        busy = set()
+        run_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(self.stages)) as executor:
+            while pending or running:
+                for name in list(pending):
+                    stage = self.stages[name]
+                    statuses = [report.get(dep, {}).get("status") for dep in stage.deps]
+                    if any(status in ("failed", "blocked") for status in statuses):
+                        report[name] = {"status": "blocked", "seconds": 0.0}
+                        pending.remove(name)
+                    elif all(status in ("ran", "skipped") for status in statuses):
+                        if stage.resource and stage.resource in busy:
+                            continue
+                        if stage.resource:
+                            busy.add(stage.resource)
+                        running[executor.submit(self._execute, stage, results, force)] = name
+                        pending.remove(name)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    busy.discard(self.stages[name].resource)
+                    if future.exception() is not None:
+                        print(f"Stage {name} failed: {future.exception()}")
+                        report[name] = {"status": "failed", "seconds": 0.0}
+                    else:
+                        status, seconds = future.result()
+                        report[name] = {"status": status, "seconds": seconds}
+                        print(f"Stage {name} {status} in {seconds:.2f}s.")
+
+        critical_path, critical_seconds = self.critical_path(report)
+        summary = {
+            "stages": {name: report[name] for name in self.order},
+            "wall_seconds": time.perf_counter() - run_start,
+            "critical_path": critical_path,
+            "critical_path_seconds": critical_seconds,
+            "results": results,
+        }
+        print(
+            f"Critical path: {' -> '.join(critical_path)} "
+            f"({critical_seconds:.2f}s of {summary['wall_seconds']:.2f}s wall time)."
+        )
+        return summary
+
+    def critical_path(self, report):
+        """Returns the longest chain of dependent stages and its total time."""
+        finish = {}
+        previous = {}
+        for name in self.order:
+            deps = self.stages[name].deps
+            longest = max(deps, key=lambda dep: finish[dep], default=None)
+            previous[name] = longest
+            finish[name] = report[name]["seconds"] + (finish[longest] if longest else 0.0)
+
+        if not finish:
+            return [], 0.0
+        name = max(self.order, key=lambda stage: finish[stage])
+        total = finish[name]
+        path = []
+        while name:
+            path.append(name)
+            name = previous[name]
+        return path[::-1], total
@@ -0,0 +1,193 @@
+# src/data_collection/schema.py
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+from .constants import DIRECTORIES
+
+CATEGORY = "category"
+
+# Per-game averages and percentages are float32; whole-number columns are
+# int16 (falling back to float32 where values are missing or fractional)
+_PER_GAME_STATS = [
+    "MP", "FG", "FGA", "FG%", "3P", "3PA", "3P%", "2P", "2PA", "2P%", "eFG%",
+    "FT", "FTA", "FT%", "ORB", "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF",
+    "PTS",
+]
+
+# basketball-reference per-game stats (player/data/players.csv)
+PLAYER_SCHEMA = {
+    "Rk": "int16",
+    "Player": CATEGORY,
+    "Age": "int16",
+    "Team": CATEGORY,
+    "Tm": CATEGORY,
+    "Pos": CATEGORY,
+    "G": "int16",
+    "GS": "int16",
+    **{column: "float32" for column in _PER_GAME_STATS},
+    "Awards": CATEGORY,
+    "Year": "int16",
+}
+
+# MVP voting (mvp/data/mvps.csv)
+MVP_SCHEMA = {
+    "Rank": CATEGORY,  # Ties are ranked "2T"
+    "Player": CATEGORY,
+    "Age": "int16",
+    "Tm": CATEGORY,
+    "First": "int16",
+    "Pts Won": "int16",
+    "Pts Max": "int16",
+    "Share": "float32",
+    "Year": "int16",
+}
+
+# Standings (team/data/teams.csv). W/L hold 'Division' header rows until
+# clean_teams drops them, so only the columns that are always clean are typed
+TEAM_SCHEMA = {
+    "Team": CATEGORY,
+    "Year": "int16",
+}
+
+# LeagueGameFinder game log (data/nba_game_data.csv)
+GAME_SCHEMA = {
+    "SEASON_ID": CATEGORY,
+    "TEAM_ID": "int32",  # IDs are ~1.6e9, past int16
+    "TEAM_ABBREVIATION": CATEGORY,
+    "TEAM_NAME": CATEGORY,
+    "GAME_ID": str,
+    "GAME_DATE": CATEGORY,
+    "MATCHUP": CATEGORY,
+    "WL": CATEGORY,
+    "MIN": "int16",
+    **{
+        column: "int16"
+        for column in [
+            "PTS", "FGM", "FGA", "FG3M", "FG3A", "FTM", "FTA", "OREB", "DREB",
+            "REB", "AST", "STL", "BLK", "TOV", "PF",
+        ]
+    },
+    "FG_PCT": "float32",
+    "FG3_PCT": "float32",
+    "FT_PCT": "float32",
+    "PLUS_MINUS": "float32",
+}
+
+# Columns process_data adds (and the label-encoded IDs it replaces)
+FEATURE_SCHEMA = {
+    "TEAM_ID": "int16",
+    "OPPONENT_TEAM_ID": "int16",
+    "WIN": "int8",
+    "Points_Per_Game": "float32",
+    "HOME_GAME": "int8",
+    "LAST_GAME_RESULT": "int8",
+}
+
+
+def downcast(values, dtype):
+    """
+    Casts a Series to a schema dtype without losing information: integer
+    targets fall back to float32 when values are missing or fractional and are
+    skipped when out of range, numeric targets are skipped for text columns,
+    numeric columns with a `str` target become text (missing values stay NaN),
+    and categoricals drop categories no row uses.
+    """
+    if dtype == CATEGORY:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return values.cat.remove_unused_categories()
+        return values.astype(CATEGORY)
+    if not pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(
+        values.dtype
+    ):
+        return values
+
+    target = np.dtype(dtype)
+    if target.kind == "f":
+        return values.astype(target)
+    if target.kind not in "iu":  # e.g. GAME_ID read as a number
+        return values.astype(str).where(values.notna())
+
+    array = values.to_numpy(dtype=float, na_value=np.nan)
+    present = array[~np.isnan(array)]
+    info = np.iinfo(target)
+    if len(present) and (present.min() < info.min or present.max() > info.max):
+        return values
+    if not (array == np.trunc(array)).all():
+        target = np.dtype("float32")
+    return pd.Series(array.astype(target), index=values.index, name=values.name)
+
+
+def apply_schema(df, schema):
+    """Casts the columns of `df` that `schema` names, in place, and returns `df`."""
+    for column, dtype in schema.items():
+        if column in df.columns:
+            df[column] = downcast(df[column], dtype)
+    return df
+
+
+def csv_dtypes(schema):
+    """
+    The `dtype` argument for pd.read_csv that parses categoricals, floats and
+    strings straight into the schema. Integer columns are left to inference
+    (files hold counts both as "82" and as "82.0") and narrowed by
+    `apply_schema` afterwards.
+    """
+    return {
+        column: dtype
+        for column, dtype in schema.items()
+        if not (isinstance(dtype, str) and dtype.startswith("int"))
+    }
+
+
+def read_csv_schema(path, schema, **kwargs):
+    """Reads a CSV into the compact dtypes of `schema`."""
+    return apply_schema(pd.read_csv(path, dtype=csv_dtypes(schema), **kwargs), schema)
+
+
+def memory_report(df, schema):
+    """
+    Per-column memory of `df` as loaded and after `apply_schema`, in bytes
+    (object columns measured deeply), with a Total row. `df` is not modified.
+    """
+    compact = apply_schema(df.copy(), schema)
+    report = pd.DataFrame(
+        {
+            "dtype": df.dtypes.astype(str),
+            "bytes": df.memory_usage(index=False, deep=True),
+            "compact_dtype": compact.dtypes.astype(str),
+            "compact_bytes": compact.memory_usage(index=False, deep=True),
+        }
+    )
+    report.loc["Total"] = ["", report["bytes"].sum(), "", report["compact_bytes"].sum()]
+    report["reduction"] = 1 - report["compact_bytes"] / report["bytes"]
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Memory of the player and game datasets before and after the schema"
+    )
+    parser.add_argument(
+        "--players",
+        default=os.path.join(DIRECTORIES["player"], "data", "players.csv"),
+    )
+    parser.add_argument("--game-log", default="data/nba_game_data.csv")
+    args = parser.parse_args()
+
+    for path, schema, options in (
+        (args.players, PLAYER_SCHEMA, {}),
+        (args.game_log, GAME_SCHEMA, {"dtype": {"GAME_ID": str}}),
+    ):
+        if not os.path.exists(path):
+            print(f"Skipping {path}: not found.\n")
+            continue
+        report = memory_report(pd.read_csv(path, **options), schema)
+        total = report.loc["Total"]
+        print(f"{path}: {len(report) - 1} columns")
+        print(report.to_string(float_format=lambda x: f"{x:.1%}"))
+        print(
+            f"{total['bytes'] / 2**20:.1f} MiB -> "
+            f"{total['compact_bytes'] / 2**20:.1f} MiB ({total['reduction']:.1%} less)\n"
+        )
@@ -1,66 +1,74 @@
 # src/data_collection/scraping.py
 import os
-import requests
-import time
-from .constants import DIRECTORIES, YEARS
-from .utils import save_html
+from .constants import CURRENT_SEASON, DIRECTORIES, YEARS
+from .fetcher import fetch_all
+from .page_cache import PageCache
 from .driver import get_chrome_driver
 
 
-def scrape_mvp():
+def scrape_pages(kind, url_template, label, force=False, **fetch_options):
+    """
+    Fetches one page per season concurrently and saves each as html/<year>.html
+    under the directory for `kind`. Pages are tracked in html/cache.json: pinned
+    seasons are skipped, the rest are requested conditionally and only rewritten
+    when their content changed. `force` ignores the cache. Extra keyword
+    arguments are passed to `fetch_all`.
+    """
+    html_dir = os.path.join(DIRECTORIES[kind], "html")
+    os.makedirs(html_dir, exist_ok=True)
+    cache = PageCache(os.path.join(html_dir, "cache.json"))
+
+    pending = []
+    for year in YEARS:
+        url = url_template.format(year)
+        file_path = os.path.join(html_dir, f"{year}.html")
+        if not force and cache.is_fresh(url, file_path):
+            continue
+        pending.append((year, url, file_path))
+
+    print(
+        f"Scraping {label} for {len(pending)} seasons "
+        f"({len(YEARS) - len(pending)} pinned)..."
+    )
+    urls = [url for _, url, _ in pending]
+    url_headers = {}
+    if not force:
+        url_headers = {
+            url: cache.request_headers(url, file_path) for _, url, file_path in pending
+        }
+    responses = fetch_all(urls, url_headers=url_headers, **fetch_options)
+
+    for (year, url, _), response in zip(pending, responses):
+        if isinstance(response, Exception):
+            print(f"Failed to scrape {label} for year {year}: {response}")
+            continue
+        if cache.store(url, response, html_dir, f"{year}.html"):
+            print(f"Saved {label} for year {year}.")
+        else:
+            print(f"No changes to {label} for year {year}.")
+        if year < CURRENT_SEASON:
+            cache.pin(url)
+
+    cache.save()
+
+
+def scrape_mvp(**fetch_options):
     """Scrapes MVP award data and saves HTML files."""
     url_template = "https://www.basketball-reference.com/awards/awards_{}.html"
-    for year in YEARS:
-        try:
-            print(f"Scraping MVP data for year {year}...")
-            url = url_template.format(year)
-            response = requests.get(url)
-            response.raise_for_status()
-            save_html(
-                response.text, os.path.join(DIRECTORIES["mvp"], "html"), f"{year}.html"
-            )
-            time.sleep(1)
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to scrape year {year}: {e}")
+    scrape_pages("mvp", url_template, "MVP data", **fetch_options)
 
 
-def scrape_player():
+def scrape_player(**fetch_options):
     """
     Scrapes player statistics data and saves HTML files using Requests.
     """
     url_template = "https://www.basketball-reference.com/leagues/NBA_{}_per_game.html"
-    for year in YEARS:
-        try:
-            print(f"Scraping player data for year {year}...")
-            url = url_template.format(year)
-            response = requests.get(url)
-            response.raise_for_status()
-            save_html(
-                response.text,
-                os.path.join(DIRECTORIES["player"], "html"),
-                f"{year}.html",
-            )
-            time.sleep(1)  # Pause to avoid rate limiting
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to scrape player data for year {year}: {e}")
+    scrape_pages("player", url_template, "player data", **fetch_options)
 
 
-def scrape_team():
+def scrape_team(**fetch_options):
     """
     Scrapes team standings data and saves HTML files using Requests.
     """
     url_template = "https://www.basketball-reference.com/leagues/NBA_{}_standings.html"
-    for year in YEARS:
-        try:
-            print(f"Scraping team data for year {year}...")
-            url = url_template.format(year)
-            response = requests.get(url)
-            response.raise_for_status()
-            # Updated so all path components are joined in one call:
-            save_html(
-                response.text, os.path.join(DIRECTORIES["team"], "html"), f"{year}.html"
-            )
-            time.sleep(1)  # Pause to avoid rate limiting
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to scrape team data for year {year}: {e}")
-
+    scrape_pages("team", url_template, "team data", **fetch_options)
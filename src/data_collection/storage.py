@@ -0,0 +1,205 @@
+# src/data_collection/storage.py
+import os
+import shutil
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .constants import EXPORT_CSV, STORAGE_FORMAT
+
+# Columnar formats and the compression used for each
+FORMATS = {
+    "parquet": lambda: ds.ParquetFileFormat().make_write_options(compression="zstd"),
+    "feather": lambda: ds.IpcFileFormat().make_write_options(compression="zstd"),
+}
+
+PARTITION_COLUMN = "Year"
+
+
+def dataset_path(data_dir, name, fmt=STORAGE_FORMAT):
+    """Returns the path of a dataset, e.g. player/data/players.parquet."""
+    return os.path.join(data_dir, f"{name}.{fmt}")
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int64())]), flavor="hive")
+
+
+def write_dataset(df, path, fmt=STORAGE_FORMAT):
+    """
+    Writes a DataFrame as a compressed columnar dataset partitioned by Year
+    (path/Year=<year>/part-0.<fmt>), replacing any existing dataset at `path`.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported storage format: {fmt}")
+
+    table = _to_arrow(df)
+    tmp_path = f"{path}.tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    ds.write_dataset(
+        table,
+        tmp_path,
+        format="ipc" if fmt == "feather" else fmt,
+        partitioning=_partitioning(),
+        basename_template=f"part-{{i}}.{fmt}",
+        file_options=FORMATS[fmt](),
+    )
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+
+
+def _to_arrow(df):
+    """
+    Converts a DataFrame to an Arrow table. Object columns mixing strings and
+    numbers (e.g. standings with 'Division' rows concatenated to purely numeric
+    ones) are stored as strings, as a CSV round trip would have read them.
+    """
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def read_dataset(path, columns=None, filters=None):
+    """
+    Reads a columnar dataset written by `write_dataset`. Only the requested
+    `columns` are read, and `filters` (DNF tuples such as
+    [("Year", "in", [2024, 2025])]) are pushed down so that non-matching Year
+    partitions are never opened. Rows come back ordered by Year.
+    """
+    fmt = os.path.splitext(path)[1].lstrip(".")
+    dataset = ds.dataset(
+        path,
+        format="ipc" if fmt == "feather" else fmt,
+        partitioning=_partitioning(),
+    )
+    expression = pq.filters_to_expression(filters) if filters else None
+
+    # Restore the column order of the original frame; Year is appended by the partitioning
+    pandas_metadata = dataset.schema.pandas_metadata or {}
+    order = [col["name"] for col in pandas_metadata.get("columns", [])]
+    order = [name for name in order if name in dataset.schema.names]
+    if columns is not None:
+        order = [name for name in order if name in columns]
+
+    fragments = sorted(
+        dataset.get_fragments(filter=expression), key=lambda fragment: fragment.path
+    )
+    tables = [
+        fragment.to_table(columns=order, filter=expression, schema=dataset.schema)
+        for fragment in fragments
+    ]
+    if not tables:
+        return pd.DataFrame(columns=order)
+
+    df = pa.concat_tables(tables).to_pandas()
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def output_paths(data_dir, name, fmt=STORAGE_FORMAT, export_csv=EXPORT_CSV):
+    """Returns the paths `save_dataset` writes for a dataset."""
+    paths = []
+    if fmt != "csv":
+        paths.append(dataset_path(data_dir, name, fmt))
+    if export_csv or fmt == "csv":
+        paths.append(dataset_path(data_dir, name, "csv"))
+    return paths
+
+
+def save_dataset(
+    df, data_dir, name, fmt=STORAGE_FORMAT, export_csv=EXPORT_CSV, backup=False
+):
+    """
+    Persists a dataset under `data_dir` in the configured columnar format and,
+    if `export_csv` is set, as <name>.csv as well. Returns the paths written.
+    With `backup`, any file about to be overwritten is first moved aside to
+    <name>_backup.<ext>; nothing is copied and new files get no backup.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    paths = output_paths(data_dir, name, fmt, export_csv)
+    for path in paths:
+        if backup and os.path.exists(path):
+            move_to_backup(path)
+        if path.endswith(".csv"):
+            df.to_csv(path, index=False)
+        else:
+            write_dataset(df, path, fmt)
+    return paths
+
+
+def move_to_backup(path):
+    """Renames a file or dataset directory to <name>_backup<ext>, replacing an old backup."""
+    root, ext = os.path.splitext(path)
+    backup_path = f"{root}_backup{ext}"
+    if os.path.isdir(backup_path):
+        shutil.rmtree(backup_path)
+    os.replace(path, backup_path)
+    return backup_path
+
+
+def load_dataset(
+    data_dir, name, columns=None, filters=None, fmt=STORAGE_FORMAT, dtype=None
+):
+    """
+    Loads a dataset from `data_dir`, preferring the columnar copy and falling
+    back to <name>.csv. Projection and filters are applied either way; `dtype`
+    only applies to the CSV fallback, as columnar files keep their types.
+    """
+    path = dataset_path(data_dir, name, fmt)
+    if fmt != "csv" and os.path.exists(path):
+        return read_dataset(path, columns, filters)
+    return read_csv(dataset_path(data_dir, name, "csv"), columns, filters, dtype)
+
+
+def read_csv(path, columns=None, filters=None, dtype=None):
+    """
+    Reads a CSV with the same projection/filter semantics as `read_dataset`,
+    parsing columns as `dtype` (a pd.read_csv dtype mapping) when given.
+    """
+    filter_columns = [col for col, _, _ in filters or []]
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys([*columns, *filter_columns]))
+    df = pd.read_csv(path, usecols=usecols, dtype=dtype)
+    if filters:
+        df = df[filter_mask(df, filters)].reset_index(drop=True)
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    return df
+
+
+def append_csv(df, path, columns=None):
+    """
+    Appends a frame to a CSV, writing the header only when the file is new.
+    Rows are aligned to `columns` (the header already written) when given.
+    """
+    header = not os.path.exists(path)
+    if columns is not None:
+        df = df.reindex(columns=columns)
+    df.to_csv(path, mode="a", header=header, index=False)
+
+
+def filter_mask(df, filters):
+    """Evaluates a conjunction of (column, op, value) filters against a DataFrame."""
+    ops = {
+        "==": lambda s, v: s == v,
+        "=": lambda s, v: s == v,
+        "!=": lambda s, v: s != v,
+        "<": lambda s, v: s < v,
+        "<=": lambda s, v: s <= v,
+        ">": lambda s, v: s > v,
+        ">=": lambda s, v: s >= v,
+        "in": lambda s, v: s.isin(v),
+        "not in": lambda s, v: ~s.isin(v),
+    }
+    mask = pd.Series(True, index=df.index)
+    for col, op, value in filters:
+        mask &= ops[op](df[col], value)
+    return mask
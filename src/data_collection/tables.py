@@ -0,0 +1,247 @@
+# src/data_collection/tables.py
+import re
+import numpy as np
+import pandas as pd
+from collections import defaultdict
+from lxml import etree
+
+# Cell text pandas.read_csv/read_html treat as missing by default
+NA_VALUES = {
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+}
+TRUE_VALUES = {"True", "TRUE", "true"}
+FALSE_VALUES = {"False", "FALSE", "false"}
+
+# Same whitespace collapsing and thousands-separated number pattern as pd.read_html
+WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+THOUSANDS_NUMBER = re.compile(
+    r"^[\-\+]?([0-9]+,|[0-9])*(\.[0-9]*)?([0-9]?(E|e)\-?[0-9]+)?$"
+)
+
+_HTML_PARSER = etree.HTMLParser(encoding="utf-8")
+
+
+def parse_document(page_content):
+    """
+    Parses a page once with lxml's C parser. Returns the document root, or None
+    for an empty page. Tables are then pulled out of the tree with `read_table`.
+    """
+    if not page_content or not page_content.strip():
+        return None
+    return etree.fromstring(page_content.encode("utf-8"), parser=_HTML_PARSER)
+
+
+def drop_first_row(doc, css_class):
+    """Removes the first <tr> in the document carrying `css_class`, if any."""
+    if doc is None:
+        return
+    rows = doc.xpath(
+        "//tr[contains(concat(' ', normalize-space(@class), ' '), $cls)][1]",
+        cls=f" {css_class} ",
+    )
+    if rows:
+        _drop_tree(rows[0])
+
+
+def read_table(doc, element_id):
+    """
+    Builds a DataFrame from the table with the given id, or returns None if the
+    page has no such element. Output matches `pd.read_html(str(table))[0]`:
+    thead rows become the header, colspan/rowspan text is repeated, hidden
+    elements are dropped, and each column is typed the way read_csv would.
+    """
+    if doc is None:
+        return None
+    matches = doc.xpath("//*[@id=$id]", id=element_id)
+    if not matches:
+        return None
+    table = matches[0]
+    if table.tag != "table":
+        nested = table.xpath(".//table")
+        if not nested:
+            return None
+        table = nested[0]
+
+    _drop_hidden(table)
+
+    header_rows = [
+        row for thead in table.xpath(".//thead") for row in thead.xpath("./tr")
+    ]
+    body_rows = table.xpath(".//tbody//tr") + table.xpath("./tr")
+    footer_rows = table.xpath(".//tfoot//tr")
+    if not header_rows:
+        # Without a <thead>, leading all-<th> rows form the header
+        while body_rows and all(cell.tag == "th" for cell in _cells(body_rows[0])):
+            header_rows.append(body_rows.pop(0))
+
+    head = _expand_spans(header_rows)
+    rows = head + _expand_spans(body_rows) + _expand_spans(footer_rows)
+    if not rows:
+        return None
+
+    width = max(len(row) for row in rows)
+    for row in rows:
+        row.extend([""] * (width - len(row)))
+
+    if not head:
+        header_index = []
+    elif len(head) == 1:
+        header_index = [0]
+    else:
+        header_index = [i for i, row in enumerate(head) if any(row)]
+
+    body = rows[header_index[-1] + 1 :] if header_index else rows
+    # A single blank cell is a blank line to read_csv
+    body = [row for row in body if width > 1 or row[0].strip()]
+
+    columns = _column_names([rows[i] for i in header_index], width)
+    data = {}
+    for i in range(width):
+        data[i] = _infer_column([row[i] for row in body])
+    df = pd.DataFrame(data, index=pd.RangeIndex(len(body)))
+    df.columns = columns
+    return df
+
+
+def _drop_hidden(table):
+    """Drops <style> tags and display:none elements, as read_html does."""
+    for elem in table.xpath(".//style"):
+        _drop_tree(elem)
+    for elem in table.xpath(".//*[@style]"):
+        if "display:none" in elem.attrib.get("style", "").replace(" ", ""):
+            _drop_tree(elem)
+
+
+def _drop_tree(elem):
+    """Removes an element and its children, keeping the text that follows it."""
+    parent = elem.getparent()
+    if parent is None:
+        return
+    if elem.tail:
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
+
+def _cells(row):
+    return [cell for cell in row if cell.tag == "td" or cell.tag == "th"]
+
+
+def _expand_spans(rows):
+    """Returns the text of each row, copying colspan/rowspan cells into place."""
+    all_texts = []
+    remainder = []  # (column index, text, rows still spanned)
+
+    for tr in rows:
+        texts = []
+        next_remainder = []
+        index = 0
+        for td in _cells(tr):
+            while remainder and remainder[0][0] <= index:
+                prev_i, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+                index += 1
+
+            text = WHITESPACE.sub(" ", "".join(td.itertext()).strip())
+            rowspan = int(td.get("rowspan") or 1)
+            colspan = int(td.get("colspan") or 1)
+            for _ in range(colspan):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    while remainder:
+        next_remainder = []
+        texts = []
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    return all_texts
+
+
+def _column_names(header_rows, width):
+    """Names columns like read_csv: 'Unnamed: i' for blanks, '.N' suffixes for dupes."""
+    if not header_rows:
+        return pd.RangeIndex(width)
+
+    if len(header_rows) > 1:
+        levels = [
+            [name or f"Unnamed: {i}_level_{level}" for i, name in enumerate(row)]
+            for level, row in enumerate(header_rows)
+        ]
+        return pd.MultiIndex.from_arrays(levels)
+
+    names = [name or f"Unnamed: {i}" for i, name in enumerate(header_rows[0])]
+    counts = defaultdict(int)
+    for i, name in enumerate(names):
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts[name]
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _infer_column(values):
+    """Types one column of cell text: numeric if possible, then bool, else object."""
+    cleaned = np.empty(len(values), dtype=object)
+    missing = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        if value in NA_VALUES:
+            cleaned[i] = np.nan
+            missing[i] = True
+        elif "," in value and THOUSANDS_NUMBER.search(value.strip()):
+            cleaned[i] = value.replace(",", "")
+        else:
+            cleaned[i] = value
+
+    if not len(cleaned):
+        return cleaned
+    try:
+        return pd.to_numeric(cleaned)
+    except (ValueError, TypeError):
+        pass
+
+    present = cleaned[~missing]
+    if not missing.any() and len(present):
+        if all(value in TRUE_VALUES or value in FALSE_VALUES for value in present):
+            return np.array([value in TRUE_VALUES for value in present])
+    return cleaned
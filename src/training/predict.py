@@ -0,0 +1,272 @@
+import json
+import time
+import queue
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from .registry import MODEL_REGISTRY, load_model
+
+# Per-team state (process_data.team_state) saved next to the registry by train.py
+TEAM_STATE = "data/team_state.csv"
+
+
+def save_team_state(state, path=TEAM_STATE):
+    state.to_csv(path)
+
+
+def load_team_state(path=TEAM_STATE):
+    return pd.read_csv(path, index_col="TEAM_ID")
+
+
+class PredictionService:
+    """
+    Predicts win probabilities for batches of upcoming matchups. The model is
+    loaded once; each matchup (team, opponent, home) is turned into the
+    features split_data trains on by looking both teams up in the cached team
+    state, and the whole batch goes through one predict_proba call.
+    """
+
+    # The features `features` can build from the team state
+    SERVED_FEATURES = (
+        "TEAM_ID",
+        "OPPONENT_TEAM_ID",
+        "Points_Per_Game",
+        "HOME_GAME",
+        "LAST_GAME_RESULT",
+    )
+
+    def __init__(self, artifact, state):
+        unserved = sorted(set(artifact.features) - set(self.SERVED_FEATURES))
+        if unserved:
+            raise ValueError(f"Model features the service cannot build: {unserved}")
+        self.artifact = artifact
+        self.state = state
+        # Teams can be given by abbreviation or by NBA team ID
+        self.team_ids = {int(team_id): int(team_id) for team_id in state.index}
+        self.team_ids.update(
+            {
+                abbr: int(team_id)
+                for team_id, abbr in state["ABBREVIATION"].dropna().items()
+            }
+        )
+
+    @classmethod
+    def from_registry(
+        cls, version=None, registry_dir=MODEL_REGISTRY, state_path=TEAM_STATE
+    ):
+        """Loads a registered model version (latest by default) and the team state."""
+        return cls(load_model(version, registry_dir), load_team_state(state_path))
+
+    def _lookup(self, teams):
+        ids = [self.team_ids.get(team) for team in teams]
+        unknown = [team for team, team_id in zip(teams, ids) if team_id is None]
+        if unknown:
+            raise ValueError(f"Unknown teams: {sorted(set(map(str, unknown)))}")
+        return self.state.loc[ids]
+
+    def features(self, matchups):
+        """Builds the model's feature frame for a frame of team/opponent/home rows."""
+        team = self._lookup(matchups["team"].tolist())
+        opponent = self._lookup(matchups["opponent"].tolist())
+        if opponent["OPPONENT_CODE"].isna().any():
+            raise ValueError("Opponent never appears as one in the training data")
+        return pd.DataFrame(
+            {
+                "TEAM_ID": team["TEAM_CODE"].to_numpy(),
+                "OPPONENT_TEAM_ID": opponent["OPPONENT_CODE"].to_numpy(),
+                "Points_Per_Game": team["Points_Per_Game"].to_numpy(),
+                "HOME_GAME": matchups["home"].astype(int).to_numpy(),
+                "LAST_GAME_RESULT": team["LAST_GAME_RESULT"].to_numpy(),
+            },
+            index=matchups.index,
+        )
+
+    def predict(self, matchups):
+        """Returns the probability that `team` wins, one per matchup row."""
+        if len(matchups) == 0:
+            return np.array([])
+        probabilities = self.artifact.predict_proba(self.features(matchups))
+        win = list(self.artifact.model.classes_).index(1)
+        return probabilities[:, win]
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests. A worker thread waits for the
+    first request, then keeps collecting for up to `max_wait` seconds or
+    `max_batch` matchups and answers all of them with one `predict` call. If a
+    batch fails, its requests are retried one by one so that a bad request
+    only fails itself.
+    """
+
+    def __init__(self, predict, max_batch=256, max_wait=0.002):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, matchups):
+        """Queues a frame of matchups; returns a Future of its probabilities."""
+        future = Future()
+        self._queue.put((matchups, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self):
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            self.batches += 1
+            try:
+                combined = pd.concat([matchups for matchups, _ in batch])
+                probabilities = self.predict(combined.reset_index(drop=True))
+            except Exception:
+                for matchups, future in batch:
+                    try:
+                        future.set_result(self.predict(matchups.reset_index(drop=True)))
+                    except Exception as e:
+                        future.set_exception(e)
+                continue
+            offset = 0
+            for matchups, future in batch:
+                future.set_result(probabilities[offset : offset + len(matchups)])
+                offset += len(matchups)
+
+
+class LatencyRecorder:
+    """Keeps the most recent request latencies and reports their percentiles."""
+
+    def __init__(self, size=10_000):
+        self.latencies = deque(maxlen=size)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        with self._lock:
+            self.latencies.append(seconds)
+            self.count += 1
+
+    def summary(self):
+        with self._lock:
+            latencies = np.array(self.latencies)
+            count = self.count
+        if not len(latencies):
+            return {"requests": count, "p50_ms": None, "p99_ms": None}
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        return {"requests": count, "p50_ms": round(p50, 3), "p99_ms": round(p99, 3)}
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """
+    POST /predict  {"matchups": [{"team": "LAL", "opponent": "BOS", "home": true}]}
+                   -> {"win_probability": [0.61]}
+    GET  /stats    -> request count and p50/p99 latency in milliseconds
+    """
+
+    def do_POST(self):
+        start = time.perf_counter()
+        if self.path != "/predict":
+            return self._respond(404, {"error": "not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            matchups = pd.DataFrame(
+                json.loads(self.rfile.read(length))["matchups"],
+                columns=["team", "opponent", "home"],
+            )
+            probabilities = self.server.batcher.submit(matchups).result()
+            status, body = 200, {"win_probability": probabilities.tolist()}
+        except (ValueError, KeyError, TypeError) as e:
+            status, body = 400, {"error": str(e)}
+        except Exception as e:  # A model or batching failure, not a bad request
+            status, body = 500, {"error": f"{type(e).__name__}: {e}"}
+        self.server.latency.record(time.perf_counter() - start)
+        self._respond(status, body)
+
+    def do_GET(self):
+        if self.path != "/stats":
+            return self._respond(404, {"error": "not found"})
+        stats = self.server.latency.summary()
+        self._respond(200, {**stats, "batches": self.server.batcher.batches})
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PredictionServer(ThreadingHTTPServer):
+    # Bursts of concurrent clients are the point, so allow a deeper accept queue
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def make_server(service, host="127.0.0.1", port=8000, max_batch=256, max_wait=0.002):
+    """Builds (but does not start) the HTTP prediction server for `service`."""
+    server = PredictionServer((host, port), PredictionHandler)
+    server.batcher = MicroBatcher(service.predict, max_batch, max_wait)
+    server.latency = LatencyRecorder()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve game win probabilities")
+    parser.add_argument(
+        "--version", type=int, default=None, help="model version (default: latest)"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--state", default=TEAM_STATE, help="team state CSV")
+    args = parser.parse_args()
+
+    service = PredictionService.from_registry(args.version, state_path=args.state)
+    server = make_server(service, args.host, args.port)
+    print(
+        f"Serving model version {service.artifact.version} "
+        f"on http://{args.host}:{args.port}"
+    )
+    try:
+        server.serve_forever()
+    finally:
+        print(f"Latency: {server.latency.summary()}")
+        server.batcher.close()
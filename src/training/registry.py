@@ -0,0 +1,123 @@
+import os
+import json
+import time
+import hashlib
+import joblib
+import pandas as pd
+import sklearn
+
+# Each version is stored as data/models/v<N>/{model.joblib, metadata.json}
+MODEL_REGISTRY = "data/models"
+MODEL_FILE = "model.joblib"
+METADATA_FILE = "metadata.json"
+
+
+def data_hash(X, y):
+    """SHA-256 of a training set (feature names, values and target)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(map(str, X.columns))).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def list_versions(registry_dir=MODEL_REGISTRY):
+    """Returns the stored model versions in ascending order."""
+    if not os.path.isdir(registry_dir):
+        return []
+    versions = []
+    for name in os.listdir(registry_dir):
+        path = os.path.join(registry_dir, name, METADATA_FILE)
+        if name.startswith("v") and name[1:].isdigit() and os.path.exists(path):
+            versions.append(int(name[1:]))
+    return sorted(versions)
+
+
+def version_dir(version, registry_dir=MODEL_REGISTRY):
+    return os.path.join(registry_dir, f"v{version}")
+
+
+def save_model(
+    model, features, training_hash, metrics, registry_dir=MODEL_REGISTRY, compress=0
+):
+    """
+    Stores `model` as the next version with its feature list, training data
+    hash and evaluation metrics. Artifacts are written uncompressed by default
+    so that `load_model` can memory-map their arrays; any joblib `compress`
+    level trades that for a smaller file. Returns the new version number.
+    """
+    versions = list_versions(registry_dir)
+    version = versions[-1] + 1 if versions else 1
+    directory = version_dir(version, registry_dir)
+    tmp_directory = f"{directory}.tmp"
+    os.makedirs(tmp_directory, exist_ok=True)
+
+    joblib.dump(model, os.path.join(tmp_directory, MODEL_FILE), compress=compress)
+    metadata = {
+        "version": version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "model": type(model).__name__,
+        "features": list(features),
+        "training_data_hash": training_hash,
+        "metrics": metrics,
+        "compress": compress,
+        "sklearn_version": sklearn.__version__,
+    }
+    metadata_path = os.path.join(tmp_directory, METADATA_FILE)
+    with open(metadata_path, "w", encoding="utf-8") as file:
+        json.dump(metadata, file, indent=2, sort_keys=True)
+    # The version only becomes visible once both files are complete
+    os.replace(tmp_directory, directory)
+    return version
+
+
+class ModelArtifact:
+    """
+    A registered model. Its metadata is read up front, but the estimator is
+    only loaded on first use, memory-mapping the arrays of uncompressed
+    artifacts instead of reading them into memory, so opening an artifact
+    costs a JSON read.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        metadata_path = os.path.join(directory, METADATA_FILE)
+        with open(metadata_path, "r", encoding="utf-8") as file:
+            self.metadata = json.load(file)
+        self._model = None
+
+    @property
+    def version(self):
+        return self.metadata["version"]
+
+    @property
+    def features(self):
+        return self.metadata["features"]
+
+    @property
+    def model(self):
+        if self._model is None:
+            mmap_mode = None if self.metadata.get("compress") else "r"
+            self._model = joblib.load(
+                os.path.join(self.directory, MODEL_FILE), mmap_mode=mmap_mode
+            )
+        return self._model
+
+    def predict(self, X):
+        return self.model.predict(X[self.features])
+
+    def predict_proba(self, X):
+        return self.model.predict_proba(X[self.features])
+
+
+def load_model(version=None, registry_dir=MODEL_REGISTRY):
+    """Opens a stored model version (the latest when `version` is None)."""
+    if version is None:
+        versions = list_versions(registry_dir)
+        if not versions:
+            raise FileNotFoundError(f"No models registered in '{registry_dir}'")
+        version = versions[-1]
+    directory = version_dir(version, registry_dir)
+    if not os.path.exists(os.path.join(directory, METADATA_FILE)):
+        raise FileNotFoundError(f"No model version {version} in '{registry_dir}'")
+    return ModelArtifact(directory)
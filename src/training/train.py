@@ -1,10 +1,21 @@
-import pickle
+import argparse
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score
 from data_collection.fetch_nba_data import fetch_nba_team_data
-from data_collection.process_data import process_data, split_data
+from data_collection.feature_store import cached_process_data
+from data_collection.features import add_game_features
+from data_collection.instrumentation import configure, instrument, write_report
+from data_collection.process_data import (
+    FEATURES,
+    LEAK_FREE_FEATURES,
+    split_data,
+    team_state,
+)
+from training.predict import save_team_state
+from training.registry import data_hash, save_model
 
 
+@instrument()
 def train_model(X_train, y_train):
     # Initialize RandomForestClassifier with 100 trees
     model = RandomForestClassifier(n_estimators=100, random_state=42)
@@ -17,23 +28,46 @@ def evaluate_model(model, X_test, y_test):
     predictions = model.predict(X_test)
     accuracy = accuracy_score(y_test, predictions)
     print(f"Model Accuracy: {accuracy:.2%}")
+    return accuracy
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train and register the game model")
+    parser.add_argument(
+        "--leak-free",
+        action="store_true",
+        help="train on rolling features built only from earlier games "
+        "(the prediction service cannot serve this model yet)",
+    )
+    args = parser.parse_args()
+    configure()
+
     # Fetch and process data
     all_games, team_abbr_to_id = fetch_nba_team_data()
-    processed_games = process_data(all_games, team_abbr_to_id)
+    processed_games = cached_process_data(all_games, team_abbr_to_id)
+    features = FEATURES
+    if args.leak_free:
+        processed_games = add_game_features(processed_games)
+        features = LEAK_FREE_FEATURES
 
     # Split data into training and testing sets
-    X_train, X_test, y_train, y_test = split_data(processed_games)
+    X_train, X_test, y_train, y_test = split_data(processed_games, features=features)
 
     # Train the model
     model = train_model(X_train, y_train)
 
     # Evaluate the model
-    evaluate_model(model, X_test, y_test)
+    accuracy = evaluate_model(model, X_test, y_test)
+
+    # Register the trained model
+    version = save_model(
+        model,
+        features=list(X_train.columns),
+        training_hash=data_hash(X_train, y_train),
+        metrics={"accuracy": accuracy},
+    )
+    print(f"Model registered as version {version}.")
 
-    # Save the trained model
-    with open("data/nba_model.pkl", "wb") as f:
-        pickle.dump(model, f)
-    print("Model saved to 'data/nba_model.pkl'.")
\ No newline at end of file
+    # Save the per-team state the prediction service builds features from
+    save_team_state(team_state(all_games, processed_games, team_abbr_to_id))
+    print(f"Run report written to {write_report()}")
\ No newline at end of file
@@ -0,0 +1,43 @@
+# tests/reference_metrics.py
+"""
+Reference implementations the metrics tests check src/data_collection/metrics.py
+against: the original ml.Add_Ranks and ml.Average_Precision, and the
+Player/Share/Predictions rows they are scored on. benchmarks/bench_metrics.py
+times the vectorized module against these.
+"""
+import numpy as np
+
+from benchmarks.fixtures import make_mvp_stats
+
+
+def legacy_add_ranks(combination):
+    """The original ml.Add_Ranks: two sorts to assign Rk and Predicted_Rk."""
+    combination = combination.sort_values("Share", ascending=False)
+    combination["Rk"] = list(range(1, combination.shape[0] + 1))
+    combination = combination.sort_values("Predictions", ascending=False)
+    combination["Predicted_Rk"] = list(range(1, combination.shape[0] + 1))
+    combination["Difference"] = combination["Rk"] - combination["Predicted_Rk"]
+    return combination
+
+
+def legacy_average_precision(combination):
+    """The original ml.Average_Precision: a membership test per predicted row."""
+    actual = combination.sort_values("Share", ascending=False).head(5)
+    predicted = combination.sort_values("Predictions", ascending=False)
+    ps = []
+    found = 0
+    seen = 1
+    for index, row in predicted.iterrows():
+        if row["Player"] in actual["Player"].values:
+            found += 1
+            ps.append(found / seen)
+        seen += 1
+    return sum(ps) / len(ps)
+
+
+def make_predictions(players_per_season, seed=0):
+    """Backtest-style Player/Share/Predictions rows with the season of each row."""
+    stats = make_mvp_stats(players_per_season=players_per_season, seed=seed)
+    rng = np.random.default_rng(seed)
+    stats["Predictions"] = stats["Share"] + rng.normal(0, 0.2, len(stats))
+    return stats[["Player", "Share", "Predictions"]], stats["Year"].to_numpy()
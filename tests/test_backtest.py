@@ -0,0 +1,76 @@
+# tests/test_backtest.py
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import Ridge
+
+from benchmarks.bench_backtest import legacy_back_tests
+from benchmarks.fixtures import MVP_PREDICTORS, make_mvp_stats
+from src.data_collection.backtest import RefitModel, RidgeModel, walk_forward
+from src.data_collection.ml import Back_Tests, Grid_Back_Tests
+
+
+@pytest.fixture(scope="module")
+def stats():
+    return make_mvp_stats(years=range(1991, 2003), players_per_season=120)
+
+
+def test_back_tests_match_per_year_refit(stats):
+    years = range(1996, 2003)
+    expected = legacy_back_tests(stats, MVP_PREDICTORS, years)
+    actual = Back_Tests(stats, MVP_PREDICTORS, years=years)
+
+    assert actual[1] == expected[1]
+    assert actual[0] == pytest.approx(expected[0])
+    pd.testing.assert_frame_equal(actual[2], expected[2], rtol=1e-7)
+
+
+@pytest.mark.parametrize("alpha", [0.1, 10.0])
+def test_ridge_model_matches_sklearn(stats, alpha):
+    model = RidgeModel(alpha)
+    for year, combination in walk_forward(stats, MVP_PREDICTORS, model, [1995, 2002]):
+        train = stats[stats["Year"] < year]
+        reg = Ridge(alpha=alpha).fit(train[MVP_PREDICTORS], train["Share"])
+        test = stats.loc[combination.index, MVP_PREDICTORS]
+        np.testing.assert_allclose(combination["Predictions"], reg.predict(test))
+
+
+def test_each_season_is_added_once_in_order(stats):
+    class Recorder(RefitModel):
+        def __init__(self):
+            super().__init__(lambda: Ridge(alpha=0.1))
+            self.seasons = []
+
+        def update(self, X, y):
+            self.seasons.append(int(X[0, MVP_PREDICTORS.index("Year")]))
+            super().update(X, y)
+
+    model = Recorder()
+    results = list(walk_forward(stats, MVP_PREDICTORS, model, [1994, 1996, 1999]))
+    assert [year for year, _ in results] == [1994, 1996, 1999]
+    assert model.seasons == list(range(1991, 1999))
+
+
+def test_skips_years_without_rows(stats):
+    results = list(walk_forward(stats, MVP_PREDICTORS, RidgeModel(), [1995, 2030]))
+    assert [year for year, _ in results] == [1995]
+
+
+def test_grid_matches_walk_forward(stats):
+    years = list(range(1996, 2003))
+    reduced = [col for col in MVP_PREDICTORS if col not in ("PTS", "AST")]
+    table = Grid_Back_Tests(
+        stats,
+        {"all": MVP_PREDICTORS, "reduced": reduced},
+        alphas=(0.1, 10.0),
+        years=years,
+        n_jobs=2,
+    )
+
+    assert len(table) == 4
+    assert list(table.columns) == [*years, "Mean"]
+    assert table["Mean"].is_monotonic_decreasing
+    for (name, alpha), row in table.iterrows():
+        predictors = MVP_PREDICTORS if name == "all" else reduced
+        _, expected, _ = Back_Tests(stats, predictors, RidgeModel(alpha), years)
+        np.testing.assert_allclose(row[years].to_numpy(dtype=float), expected)
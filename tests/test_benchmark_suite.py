@@ -0,0 +1,63 @@
+# tests/test_benchmark_suite.py
+import json
+
+import pytest
+
+from benchmarks.fixtures import make_players
+from benchmarks.suite import compare, main, scale_players, time_case
+
+
+def results(**medians):
+    return {
+        "machine": {"python": "3"},
+        "cases": {name: {"median": median} for name, median in medians.items()},
+    }
+
+
+def test_compare_flags_only_slowdowns_above_threshold():
+    baselines = results(parse_player=1.0, process_data=1.0, back_tests=1.0)
+    current = results(parse_player=1.2, process_data=1.3, back_tests=0.5, new=9.0)
+
+    table = compare(current, baselines, threshold=0.25)
+
+    assert table.index.tolist() == ["parse_player", "process_data", "back_tests"]
+    assert table["regressed"].tolist() == [False, True, False]
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    baselines, current = tmp_path / "baselines.json", tmp_path / "current.json"
+    baselines.write_text(json.dumps(results(process_data=1.0)))
+    current.write_text(json.dumps(results(process_data=1.5)))
+
+    assert main(["compare", str(current), "--baselines", str(baselines)]) == 1
+    assert "process_data" in capsys.readouterr().out.splitlines()[-1]
+    assert (
+        main(
+            [
+                "compare",
+                str(current),
+                "--baselines",
+                str(baselines),
+                "--threshold",
+                "0.6",
+            ]
+        )
+        == 0
+    )
+
+
+def test_scaled_players_stay_distinct():
+    players = make_players(500)
+
+    scaled = scale_players(players, 3)
+
+    assert len(scaled) == 3 * len(players)
+    groups = players.groupby(["Player", "Year"]).ngroups
+    assert scaled.groupby(["Player", "Year"]).ngroups == 3 * groups
+
+
+@pytest.mark.parametrize("name", ["back_tests", "compute_mvp_score"])
+def test_cases_run_offline(name):
+    result = time_case(name, rounds=1)
+
+    assert result["rounds"] == 1 and result["median"] > 0
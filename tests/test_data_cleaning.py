@@ -4,6 +4,9 @@ import shutil
 import pandas as pd
 import pytest
 from src.data_collection.data_cleaning import DataCleaner
+from src.data_collection.constants import DIRECTORIES
+
+PLAYERS_CSV = os.path.join(DIRECTORIES["player"], "data", "players.csv")
 
 @pytest.fixture
 def cleaner():
@@ -80,6 +83,33 @@ def test_clean_players(cleaner, tmp_csv):
     row_jane = df[df["Player"] == "Jane Smith"].iloc[0]
     assert row_jane["Tm"] == "LAC"
 
+@pytest.mark.parametrize("tmp_csv", [
+    "Rk,Player,Year,Tm\n"
+    "1,John Doe,2001,TOT\n2,John Doe,2001,LAL\n3,John Doe,2001,BOS\n"
+    "4,Jane Smith,2001,LAC\n5,Jane Smith,2001,SAC\n"
+    "6,Al Jones*,2002,TOT\n"
+    "7,Al Jones,2001,NYK\n8,Al Jones,2001,TOT\n9,Al Jones,2001,TOT\n"
+    "10,,2001,MIA\n",
+], indirect=True)
+def test_clean_players_vectorized_matches_single_row(cleaner, tmp_csv):
+    file_path = str(tmp_csv)
+    expected = cleaner.clean_players(file_path, vectorized=False)
+    actual = cleaner.clean_players(file_path)
+    pd.testing.assert_frame_equal(actual, expected)
+
+def test_clean_players_vectorized_matches_single_row_on_players_csv(cleaner, tmp_path):
+    """Regression check on the full dataset, converted to the Tm/TOT layout."""
+    if not os.path.exists(PLAYERS_CSV):
+        pytest.skip("players.csv not available")
+    df = pd.read_csv(PLAYERS_CSV).rename(columns={"Team": "Tm"})
+    df["Tm"] = df["Tm"].str.replace(r"^\dTM$", "TOT", regex=True)
+    file_path = str(tmp_path / "players.csv")
+    df.to_csv(file_path, index=False)
+
+    expected = cleaner.clean_players(file_path, vectorized=False)
+    actual = cleaner.clean_players(file_path)
+    pd.testing.assert_frame_equal(actual, expected)
+
 # -----------------------------------------------------------------------------
 # 5. Test clean_teams
 # -----------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+# tests/test_feature_store.py
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import make_game_log
+from src.data_collection.feature_store import FEATURES_VERSION, cached_process_data
+from src.data_collection.process_data import process_data
+
+
+class CountingBuild:
+    """Wraps process_data and counts how often features are actually built."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, all_games, team_abbr_to_id):
+        self.calls += 1
+        return process_data(all_games, team_abbr_to_id)
+
+
+@pytest.fixture
+def game_log():
+    return make_game_log(2_000)
+
+
+def test_second_run_loads_cached_features(tmp_path, game_log):
+    games, team_abbr_to_id = game_log
+    build = CountingBuild()
+    first = cached_process_data(games, team_abbr_to_id, tmp_path, build)
+    second = cached_process_data(games, team_abbr_to_id, tmp_path, build)
+
+    assert build.calls == 1
+    pd.testing.assert_frame_equal(second, first)
+    pd.testing.assert_frame_equal(first, process_data(games.copy(), team_abbr_to_id))
+
+
+def test_leaves_raw_games_unchanged(tmp_path, game_log):
+    games, team_abbr_to_id = game_log
+    original = games.copy()
+    cached_process_data(games, team_abbr_to_id, tmp_path)
+    pd.testing.assert_frame_equal(games, original)
+
+
+def test_changed_input_rebuilds(tmp_path, game_log):
+    games, team_abbr_to_id = game_log
+    build = CountingBuild()
+    cached_process_data(games, team_abbr_to_id, tmp_path, build)
+
+    changed = games.copy()
+    changed.loc[0, "PTS"] += 1
+    cached_process_data(changed, team_abbr_to_id, tmp_path, build)
+    assert build.calls == 2
+
+
+def test_feature_version_bump_rebuilds(tmp_path, game_log):
+    games, team_abbr_to_id = game_log
+    build = CountingBuild()
+    cached_process_data(games, team_abbr_to_id, tmp_path, build)
+    with patch(
+        "src.data_collection.feature_store.FEATURES_VERSION", FEATURES_VERSION + 1
+    ):
+        cached_process_data(games, team_abbr_to_id, tmp_path, build)
+    assert build.calls == 2
+    assert sorted(path.name.split("-")[0] for path in tmp_path.iterdir()) == [
+        f"v{FEATURES_VERSION}",
+        f"v{FEATURES_VERSION + 1}",
+    ]
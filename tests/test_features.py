@@ -0,0 +1,103 @@
+# tests/test_features.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import make_game_log
+from src.data_collection.features import (
+    GAME_FEATURES,
+    WindowFeature,
+    add_game_features,
+    game_features,
+)
+
+
+def reference_features(all_games, features):
+    """Straightforward per-team sort + shift + rolling, one feature at a time."""
+    games = all_games.copy()
+    games["GAME_DATE"] = pd.to_datetime(games["GAME_DATE"])
+    games["WIN"] = (games["WL"] == "W").astype(int)
+    games["PTS"] = games["PTS"].astype(float)
+    opponents = games[["GAME_ID", "TEAM_ID", "PTS"]].rename(
+        columns={"TEAM_ID": "OPP", "PTS": "PTS_AGAINST"}
+    )
+    merged = games.reset_index().merge(opponents, on="GAME_ID")
+    merged = merged[merged["TEAM_ID"] != merged["OPP"]].set_index("index")
+    games["PTS_AGAINST"] = merged["PTS_AGAINST"]
+
+    games = games.sort_values(["TEAM_ID", "GAME_DATE"], kind="mergesort")
+    grouped = games.groupby("TEAM_ID")
+    result = pd.DataFrame(index=games.index)
+    for feature in features:
+        previous = grouped[feature.column].shift(1)
+        by_team = previous.groupby(games["TEAM_ID"])
+        if feature.window is None:
+            window = by_team.expanding(min_periods=feature.min_periods)
+        else:
+            window = by_team.rolling(feature.window, min_periods=feature.min_periods)
+        result[feature.name] = getattr(window, feature.agg)().droplevel(0)
+    result["REST_DAYS"] = grouped["GAME_DATE"].diff().dt.days.astype(float)
+    result["BACK_TO_BACK"] = (result["REST_DAYS"] == 1).astype(int)
+    return result.loc[all_games.index]
+
+
+@pytest.fixture
+def games():
+    games, _ = make_game_log(4_000)
+    # Shuffle so that correctness cannot rely on the log already being in date order
+    return games.sample(frac=1, random_state=0)
+
+
+def test_matches_reference(games):
+    features = [*GAME_FEATURES, WindowFeature("PTS_SUM_LAST_3", "PTS", 3, "sum", 3)]
+    expected = reference_features(games, features)
+    pd.testing.assert_frame_equal(game_features(games, features), expected)
+
+
+def test_does_not_leak_future_games(games):
+    dates = pd.to_datetime(games["GAME_DATE"])
+    cutoff = dates.quantile(0.5)
+    past = dates <= cutoff
+    altered = games.copy()
+    altered.loc[~past, "PTS"] = 0
+    altered.loc[~past, "WL"] = "L"
+    pd.testing.assert_frame_equal(
+        game_features(altered)[past], game_features(games)[past]
+    )
+
+
+def test_rest_days_and_back_to_backs():
+    games = pd.DataFrame(
+        {
+            "TEAM_ID": [1, 1, 1, 2],
+            "GAME_ID": ["a", "c", "b", "a"],
+            "GAME_DATE": ["2024-10-22", "2024-10-26", "2024-10-23", "2024-10-22"],
+            "WL": ["W", "L", "W", "L"],
+            "PTS": [110, 95, 101, 100],
+        }
+    )
+    features = game_features(games)
+    np.testing.assert_array_equal(features["REST_DAYS"], [np.nan, 3, 1, np.nan])
+    np.testing.assert_array_equal(features["BACK_TO_BACK"], [0, 0, 1, 0])
+    np.testing.assert_array_equal(features["LAST_GAME_WIN"], [np.nan, 1, 1, np.nan])
+    # Game "b" has no opponent row, so only game "a" counts towards the average
+    np.testing.assert_array_equal(
+        features["PTS_AGAINST_AVG"], [np.nan, 100, 100, np.nan]
+    )
+
+
+def test_add_game_features_leaves_input_unchanged(games):
+    original = games.copy()
+    result = add_game_features(games)
+    pd.testing.assert_frame_equal(games, original)
+    assert list(result.columns[: len(games.columns)]) == list(games.columns)
+
+
+def test_rejects_unknown_aggregation():
+    with pytest.raises(ValueError):
+        WindowFeature("PTS_MAX", "PTS", agg="max")
+
+
+def test_unknown_column_fails_clearly(games):
+    with pytest.raises(ValueError, match="PTS_LAST_5 \\(POINTS\\)"):
+        game_features(games, [WindowFeature("PTS_LAST_5", "POINTS", 5)])
@@ -0,0 +1,252 @@
+# tests/test_fetch_nba_data.py
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.data_collection.fetch_nba_data import (
+    fetch_nba_team_data,
+    iter_team_games,
+    sync_nba_team_data,
+)
+from src.data_collection.schema import GAME_SCHEMA, read_csv_schema
+
+NBA_TEAMS = [
+    {"id": 1610612737 + i, "abbreviation": f"T{i:02d}", "full_name": f"Team {i}"}
+    for i in range(30)
+]
+
+
+class StandInEndpoint:
+    """
+    Stand-in for LeagueGameFinder: returns two games per team after a short
+    delay, tracking concurrent calls. Teams in `failures` raise that many times
+    before succeeding.
+    """
+
+    def __init__(self, delay=0.05, failures=None):
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, team_id_nullable, timeout):
+        with self.lock:
+            self.calls[team_id_nullable] = self.calls.get(team_id_nullable, 0) + 1
+            calls = self.calls[team_id_nullable]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if calls <= self.failures.get(team_id_nullable, 0):
+                raise ConnectionError("stats.nba.com timed out")
+            games = pd.DataFrame(
+                {
+                    "TEAM_ID": [team_id_nullable] * 2,
+                    "GAME_ID": [f"{team_id_nullable}-1", f"{team_id_nullable}-2"],
+                    "PTS": [100, 110],
+                }
+            )
+            return _Result(games)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class _Result:
+    def __init__(self, games):
+        self.games = games
+
+    def get_data_frames(self):
+        return [self.games]
+
+
+@pytest.fixture(autouse=True)
+def nba_teams():
+    with patch("src.data_collection.fetch_nba_data.teams.get_teams", return_value=NBA_TEAMS):
+        yield
+
+
+def test_fetches_every_team_in_order(tmp_path):
+    endpoint = StandInEndpoint()
+    path = tmp_path / "nba_game_data.csv"
+    all_games, team_abbr_to_id = fetch_nba_team_data(
+        path=path, endpoint=endpoint, rate=None
+    )
+    assert all_games["TEAM_ID"].unique().tolist() == [team["id"] for team in NBA_TEAMS]
+    assert len(all_games) == 60
+    assert team_abbr_to_id["T00"] == 1610612737
+    pd.testing.assert_frame_equal(read_csv_schema(path, GAME_SCHEMA), all_games)
+
+
+def test_bounded_concurrency_beats_serial(tmp_path):
+    """30 calls of 50ms with 6 in flight take far less than the serial 1.5s."""
+    endpoint = StandInEndpoint(delay=0.05)
+    start = time.monotonic()
+    fetch_nba_team_data(
+        path=tmp_path / "games.csv", endpoint=endpoint, rate=None, max_concurrency=6
+    )
+    elapsed = time.monotonic() - start
+    assert 1 < endpoint.max_in_flight <= 6
+    assert elapsed < 0.75
+
+
+def test_shared_rate_limit(tmp_path):
+    """All teams draw from one bucket: 10 teams at 40/s need at least 9 refills."""
+    with patch(
+        "src.data_collection.fetch_nba_data.teams.get_teams", return_value=NBA_TEAMS[:10]
+    ):
+        start = time.monotonic()
+        fetch_nba_team_data(
+            path=tmp_path / "games.csv",
+            endpoint=StandInEndpoint(delay=0),
+            rate=40,
+            max_concurrency=10,
+        )
+    assert time.monotonic() - start >= 9 / 40 * 0.9
+
+
+def test_retries_failed_team(tmp_path):
+    endpoint = StandInEndpoint(failures={NBA_TEAMS[3]["id"]: 2})
+    all_games, _ = fetch_nba_team_data(
+        path=tmp_path / "games.csv", endpoint=endpoint, rate=None, backoff=0
+    )
+    assert endpoint.calls[NBA_TEAMS[3]["id"]] == 3
+    assert len(all_games) == 60
+
+
+def test_skips_team_after_retries(tmp_path):
+    endpoint = StandInEndpoint(failures={NBA_TEAMS[3]["id"]: 10})
+    all_games, _ = fetch_nba_team_data(
+        path=tmp_path / "games.csv", endpoint=endpoint, rate=None, retries=2, backoff=0
+    )
+    assert endpoint.calls[NBA_TEAMS[3]["id"]] == 3
+    assert NBA_TEAMS[3]["id"] not in all_games["TEAM_ID"].values
+    assert len(all_games) == 58
+
+
+def test_yields_team_frames_in_order():
+    """Teams come back in request order even when later ones finish first."""
+    endpoint = StandInEndpoint(delay=0.01)
+    results = list(iter_team_games(NBA_TEAMS[:8], endpoint=endpoint, rate=None))
+    assert [team["id"] for team, _ in results] == [team["id"] for team in NBA_TEAMS[:8]]
+    assert all(games["TEAM_ID"].eq(team["id"]).all() for team, games in results)
+
+
+class SlowFirstTeam(StandInEndpoint):
+    """The first team takes 0.2s; the rest are fast and count their completions."""
+
+    def __init__(self):
+        super().__init__(delay=0.005)
+        self.completed = 0
+
+    def __call__(self, team_id_nullable, timeout):
+        if team_id_nullable == NBA_TEAMS[0]["id"]:
+            time.sleep(0.2)
+        result = super().__call__(team_id_nullable, timeout)
+        with self.lock:
+            self.completed += 1
+        return result
+
+
+def test_fetches_a_bounded_number_of_teams_ahead():
+    """Frames finished behind a slow team are capped at `max_ahead`."""
+    endpoint = SlowFirstTeam()
+    held = []
+    for yielded, _ in enumerate(
+        iter_team_games(
+            NBA_TEAMS, endpoint=endpoint, rate=None, max_concurrency=2, max_ahead=4
+        ),
+        start=1,
+    ):
+        held.append(endpoint.completed - yielded)
+    assert max(held) <= 4
+    assert len(held) == len(NBA_TEAMS)
+
+
+def test_stops_early_without_fetching_the_rest():
+    endpoint = StandInEndpoint(delay=0.01)
+    results = iter_team_games(NBA_TEAMS, endpoint=endpoint, rate=None, max_concurrency=1)
+    next(results)
+    results.close()
+    assert sum(endpoint.calls.values()) < len(NBA_TEAMS)
+
+
+def test_streams_to_disk_without_materializing(tmp_path):
+    path = tmp_path / "nba_game_data.csv"
+    all_games, _ = fetch_nba_team_data(
+        path=path, endpoint=StandInEndpoint(delay=0), rate=None, materialize=False
+    )
+    assert all_games is None
+    stored = pd.read_csv(path)
+    assert len(stored) == 60
+    assert stored["TEAM_ID"].unique().tolist() == [team["id"] for team in NBA_TEAMS]
+    assert not (tmp_path / "nba_game_data.csv.tmp").exists()
+
+
+class SeasonEndpoint:
+    """
+    Stand-in for LeagueGameFinder over a fixed league history: one game per
+    team per day, filtered by `date_from_nullable` like the real endpoint.
+    """
+
+    def __init__(self, days):
+        self.days = days
+        self.requests = []
+        self.rows_returned = 0
+
+    def __call__(self, team_id_nullable, timeout, date_from_nullable=None):
+        self.requests.append((team_id_nullable, date_from_nullable))
+        days = pd.RangeIndex(self.days)
+        dates = pd.Timestamp("2024-10-22") + pd.to_timedelta(days, unit="D")
+        if date_from_nullable:
+            keep = dates >= pd.to_datetime(date_from_nullable, format="%m/%d/%Y")
+            days, dates = days[keep], dates[keep]
+        games = pd.DataFrame(
+            {
+                "TEAM_ID": team_id_nullable,
+                "GAME_ID": [f"00224{day:05d}" for day in days],
+                "GAME_DATE": dates.strftime("%Y-%m-%d"),
+                "PTS": 100,
+            }
+        )
+        self.rows_returned += len(games)
+        return _Result(games)
+
+
+def test_sync_fetches_only_new_games(tmp_path):
+    path = tmp_path / "nba_game_data.csv"
+    fetch_nba_team_data(path=path, endpoint=SeasonEndpoint(days=10), rate=None)
+
+    endpoint = SeasonEndpoint(days=12)
+    all_games, _ = sync_nba_team_data(path=path, endpoint=endpoint, rate=None)
+
+    # Each team is asked only from its last stored game on
+    assert {date for _, date in endpoint.requests} == {"10/31/2024"}
+    # The last stored day is refetched once and deduplicated, not appended again
+    assert endpoint.rows_returned == 3 * len(NBA_TEAMS)
+    assert len(all_games) == 12 * len(NBA_TEAMS)
+    assert not all_games.duplicated(["GAME_ID", "TEAM_ID"]).any()
+    assert all_games["GAME_ID"].str.startswith("00224").all()
+    pd.testing.assert_frame_equal(read_csv_schema(path, GAME_SCHEMA), all_games)
+
+
+def test_sync_is_idempotent(tmp_path):
+    path = tmp_path / "nba_game_data.csv"
+    fetch_nba_team_data(path=path, endpoint=SeasonEndpoint(days=5), rate=None)
+    sync_nba_team_data(path=path, endpoint=SeasonEndpoint(days=5), rate=None)
+    assert len(pd.read_csv(path)) == 5 * len(NBA_TEAMS)
+
+
+def test_incremental_without_stored_data_fetches_everything(tmp_path):
+    path = tmp_path / "nba_game_data.csv"
+    endpoint = SeasonEndpoint(days=3)
+    all_games, _ = fetch_nba_team_data(
+        path=path, endpoint=endpoint, rate=None, incremental=True
+    )
+    assert {date for _, date in endpoint.requests} == {None}
+    assert len(all_games) == 3 * len(NBA_TEAMS)
@@ -0,0 +1,125 @@
+# tests/test_fetcher.py
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.data_collection.fetcher import TokenBucket, fetch_all
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Local stand-in for basketball-reference. Paths:
+      /ok/<n>    -> 200 with body "page <n>"
+      /flaky     -> 429 on the first request, then 200
+      /broken    -> always 503
+      /slow/<n>  -> 200 after a short delay, tracking concurrent requests
+    """
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if self.path.startswith("/slow/"):
+                time.sleep(0.1)
+            if self.path == "/flaky" and hits == 1:
+                self._respond(429, "slow down", {"Retry-After": "0"})
+            elif self.path == "/broken":
+                self._respond(503, "unavailable")
+            else:
+                self._respond(200, f"page {self.path.rsplit('/', 1)[-1]}")
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _respond(self, status, body, headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFetcher(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.lock = threading.Lock()
+        self.server.hits = {}
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_results_align_with_urls(self):
+        """Responses come back in the same order as the requested URLs."""
+        urls = [f"{self.base_url}/ok/{i}" for i in range(10)]
+        responses = fetch_all(urls, rate=None, max_concurrency=5)
+        self.assertEqual([r.text for r in responses], [f"page {i}" for i in range(10)])
+
+    def test_bounded_concurrency(self):
+        """No more than `max_concurrency` requests are in flight at once."""
+        urls = [f"{self.base_url}/slow/{i}" for i in range(12)]
+        fetch_all(urls, rate=None, max_concurrency=3)
+        self.assertLessEqual(self.server.max_in_flight, 3)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_retries_on_429(self):
+        """A 429 is retried and the second attempt succeeds."""
+        responses = fetch_all([f"{self.base_url}/flaky"], rate=None, backoff=0)
+        self.assertEqual(responses[0].status_code, 200)
+        self.assertEqual(self.server.hits["/flaky"], 2)
+
+    def test_gives_up_after_retries(self):
+        """Persistent 5xx responses surface as an exception after the retry budget."""
+        responses = fetch_all(
+            [f"{self.base_url}/broken"], rate=None, retries=2, backoff=0
+        )
+        self.assertIsInstance(responses[0], Exception)
+        self.assertEqual(self.server.hits["/broken"], 3)
+
+    def test_rate_limit_sets_wall_clock(self):
+        """Wall-clock time follows the token bucket rate, not request latency."""
+        urls = [f"{self.base_url}/ok/{i}" for i in range(6)]
+        start = time.monotonic()
+        fetch_all(urls, rate=20, burst=1, max_concurrency=6)
+        elapsed = time.monotonic() - start
+        # 6 requests at 20/s with a burst of 1 need at least 5 refill intervals
+        self.assertGreaterEqual(elapsed, 5 / 20)
+        self.assertLess(elapsed, 2.0)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_throttle(self):
+        """The bucket allows `capacity` immediate acquisitions, then throttles."""
+
+        async def run():
+            bucket = TokenBucket(rate=50, capacity=3)
+            start = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            burst_elapsed = time.monotonic() - start
+            await bucket.acquire()
+            return burst_elapsed, time.monotonic() - start
+
+        burst_elapsed, total_elapsed = asyncio.run(run())
+        self.assertLess(burst_elapsed, 0.01)
+        self.assertGreaterEqual(total_elapsed, 1 / 50 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# tests/test_instrumentation.py
+import json
+import pstats
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_collection.instrumentation import RUN, Instrumentation, count_rows
+from src.data_collection.scheduler import Scheduler, Stage
+
+
+def busy(seconds):
+    """Spins the CPU for about `seconds`."""
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+def test_stage_records_time_memory_and_rows():
+    run = Instrumentation()
+
+    with run.stage("parse", kind="player") as record:
+        busy(0.05)
+        data = np.ones(5_000_000)  # 40 MB
+        record["rows"] = len(data)
+
+    (record,) = run.report()["stages"]
+    assert record["stage"] == "parse" and record["kind"] == "player"
+    assert record["status"] == "ok"
+    assert record["rows"] == 5_000_000
+    assert record["wall_seconds"] > 0.04 and record["cpu_seconds"] > 0.04
+    assert record["peak_rss_mb"] > 0
+    assert "profile" not in record
+
+
+def test_failed_stage_is_recorded_and_reraised():
+    run = Instrumentation()
+
+    with pytest.raises(KeyError):
+        with run.stage("clean_team"):
+            raise KeyError("W")
+
+    assert run.report()["stages"][0]["status"] == "failed"
+
+
+def test_decorator_counts_result_or_input_rows():
+    run = Instrumentation()
+
+    @run.instrument()
+    def process(frame):
+        return frame.head(3)
+
+    @run.instrument("fit")
+    def train(X, y):
+        return object()
+
+    frame = pd.DataFrame({"x": range(10)})
+    assert len(process(frame)) == 3
+    train(frame, frame["x"])
+    train(frame, frame["x"])
+
+    report = run.report()
+    assert [r["rows"] for r in report["stages"]] == [3, 10, 10]
+    assert report["totals"]["fit"]["calls"] == 2
+    assert report["totals"]["fit"]["rows"] == 20
+    assert process.__name__ == "process"
+
+
+def test_count_rows_ignores_scalars():
+    assert count_rows(0.5, ({"a": 1},)) is None
+    assert count_rows((0.5, [1]), (np.zeros((4, 2)),)) == 4
+
+
+def test_only_selected_stages_are_profiled(tmp_path):
+    run = Instrumentation(profile=["parse_player"], profile_dir=str(tmp_path))
+
+    with run.stage("parse_player"):
+        busy(0.01)
+    with run.stage("parse_team"):
+        pass
+
+    profiled, plain = run.report()["stages"]
+    assert "profile" not in plain
+    assert profiled["profile"].endswith(".prof")
+    assert pstats.Stats(profiled["profile"]).total_calls > 0
+
+
+def test_overlapping_profiled_stages_take_turns(tmp_path):
+    run = Instrumentation(profile=["all"], profile_dir=str(tmp_path))
+    barrier = threading.Barrier(2, timeout=5)
+
+    def work(kind):
+        with run.stage("parse", kind=kind):
+            barrier.wait()
+            busy(0.01)
+
+    threads = [threading.Thread(target=work, args=(k,)) for k in ("mvp", "team")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    records = run.report()["stages"]
+    assert [r["status"] for r in records] == ["ok", "ok"]
+    assert sum("profile" in r for r in records) == 1
+    assert sum("profile_skipped" in r for r in records) == 1
+
+    # The profiler is free again once the profiled stage ends
+    with run.stage("clean") as record:
+        pass
+    assert "profile" in record
+
+
+def test_concurrent_stages_and_json_report(tmp_path):
+    run = Instrumentation()
+    barrier = threading.Barrier(4, timeout=5)
+
+    def work(i):
+        with run.stage(f"stage_{i}"):
+            barrier.wait()
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    path = run.write_report(str(tmp_path / "reports" / "run.json"))
+    with open(path) as f:
+        report = json.load(f)
+    assert sorted(report["totals"]) == [f"stage_{i}" for i in range(4)]
+    assert report["wall_seconds"] >= max(r["wall_seconds"] for r in report["stages"])
+
+
+def test_scheduler_stages_are_instrumented(tmp_path):
+    stages = [
+        Stage("parse_mvp", lambda _: pd.DataFrame({"Player": ["A", "B"]})),
+        Stage("clean_mvp", lambda results: results["parse_mvp"], deps=["parse_mvp"]),
+    ]
+    before = len(RUN.records)
+
+    with patch.object(RUN, "enabled", True):
+        Scheduler(stages, str(tmp_path / "state.json")).run()
+
+    records = {r["stage"]: r for r in RUN.records[before:]}
+    assert records["parse_mvp"]["rows"] == 2
+    assert records["clean_mvp"]["status"] == "ok"
+
+
+def test_shared_run_records_nothing_until_configured():
+    run = Instrumentation(enabled=False)
+
+    @run.instrument()
+    def predict(frame):
+        return frame
+
+    with run.stage("parse") as record:
+        record["rows"] = 3
+    predict(pd.DataFrame({"x": range(4)}))
+    assert run.records == [] and not RUN.enabled
+
+    run.configure()
+    predict(pd.DataFrame({"x": range(4)}))
+    assert [r["rows"] for r in run.records] == [4]
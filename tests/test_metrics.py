@@ -0,0 +1,86 @@
+# tests/test_metrics.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_collection.metrics import (
+    add_ranks,
+    average_precision,
+    ndcg,
+    score_seasons,
+)
+from tests.reference_metrics import (
+    legacy_add_ranks,
+    legacy_average_precision,
+    make_predictions,
+)
+
+
+@pytest.fixture(scope="module")
+def predictions():
+    return make_predictions(players_per_season=200)
+
+
+def test_add_ranks_matches_legacy_per_season(predictions):
+    combination, seasons = predictions
+    expected = pd.concat(
+        legacy_add_ranks(combination[seasons == year]) for year in pd.unique(seasons)
+    )
+    # Most Shares are tied at zero, so this also pins the tie order
+    pd.testing.assert_frame_equal(add_ranks(combination, group=seasons), expected)
+
+
+def test_average_precision_matches_legacy(predictions):
+    combination, seasons = predictions
+    expected = [
+        legacy_average_precision(combination[seasons == year])
+        for year in pd.unique(seasons)
+    ]
+    actual = average_precision(combination, group=seasons)
+    assert list(actual.index) == list(pd.unique(seasons))
+    np.testing.assert_allclose(actual.to_numpy(), expected)
+
+    season = combination[seasons == seasons[0]]
+    assert average_precision(season) == pytest.approx(legacy_average_precision(season))
+
+
+def test_average_precision_counts_repeated_names():
+    combination = pd.DataFrame(
+        {
+            "Player": ["A", "B", "A", "C", "D", "E", "F"],
+            "Share": [0.9, 0.8, 0.0, 0.7, 0.6, 0.5, 0.0],
+            "Predictions": [0.1, 0.9, 0.8, 0.7, 0.2, 0.3, 0.6],
+        }
+    )
+    assert average_precision(combination) == pytest.approx(
+        legacy_average_precision(combination)
+    )
+
+
+def test_ndcg():
+    combination = pd.DataFrame(
+        {"Share": [3.0, 2.0, 1.0, 0.0], "Predictions": [0.1, 0.9, 0.5, 0.7]}
+    )
+    # Predicted order: 2.0, 0.0, 1.0, 3.0
+    dcg = 2 / np.log2(2) + 0 / np.log2(3) + 1 / np.log2(4)
+    ideal = 3 / np.log2(2) + 2 / np.log2(3) + 1 / np.log2(4)
+    assert ndcg(combination, k=3) == pytest.approx(dcg / ideal)
+    perfect = combination.assign(Predictions=combination["Share"])
+    assert ndcg(perfect, k=3) == pytest.approx(1.0)
+
+
+def test_score_seasons(predictions):
+    combination, seasons = predictions
+    scores = score_seasons(combination, seasons)
+    assert list(scores.columns) == ["Average_Precision", "NDCG", "Mean_Abs_Difference"]
+    assert list(scores.index) == list(pd.unique(seasons))
+
+    year = seasons[0]
+    ranked = legacy_add_ranks(combination[seasons == year])
+    top = ranked[ranked["Rk"] <= 5]
+    assert scores.loc[year, "Mean_Abs_Difference"] == pytest.approx(
+        top["Difference"].abs().mean()
+    )
+    assert scores.loc[year, "NDCG"] == pytest.approx(
+        ndcg(combination[seasons == year])
+    )
@@ -0,0 +1,132 @@
+# tests/test_page_cache.py
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from src.data_collection.page_cache import PageCache, content_hash
+from src.data_collection.scraping import scrape_pages
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serves /season/<year> with an ETag derived from the server's page bodies."""
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("If-None-Match")))
+        body = self.server.pages[self.path.rsplit("/", 1)[-1]]
+        etag = f'"{content_hash(body)[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestScrapeWithCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        self.server.requests = []
+        self.server.pages = {
+            "2022": "<html>2022</html>",
+            "2023": "<html>2023</html>",
+            "2024": "<html>2024 v1</html>",
+        }
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url_template = (
+            f"http://127.0.0.1:{self.server.server_address[1]}/season/{{}}"
+        )
+        self.patches = [
+            patch("src.data_collection.scraping.DIRECTORIES", {"mvp": self.tmp_dir}),
+            patch("src.data_collection.scraping.YEARS", [2022, 2023, 2024]),
+            patch("src.data_collection.scraping.CURRENT_SEASON", 2024),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp_dir)
+
+    def scrape(self, **options):
+        self.server.requests.clear()
+        scrape_pages("mvp", self.url_template, "MVP data", rate=None, **options)
+        return list(self.server.requests)
+
+    def test_historical_seasons_are_pinned(self):
+        """After the first run only the current season is requested again."""
+        first = self.scrape()
+        self.assertEqual(len(first), 3)
+
+        second = self.scrape()
+        self.assertEqual([path for path, _ in second], ["/season/2024"])
+        self.assertIsNotNone(second[0][1], "Current season should be conditional.")
+
+    def test_unchanged_page_is_not_rewritten(self):
+        """A 304 for the current season leaves the saved file untouched."""
+        self.scrape()
+        html_path = os.path.join(self.tmp_dir, "html", "2024.html")
+        os.utime(html_path, (0, 0))
+
+        self.scrape()
+        self.assertEqual(os.path.getmtime(html_path), 0)
+
+    def test_changed_page_is_rewritten(self):
+        """A new body for the current season replaces the saved file."""
+        self.scrape()
+        self.server.pages["2024"] = "<html>2024 v2</html>"
+
+        self.scrape()
+        with open(os.path.join(self.tmp_dir, "html", "2024.html")) as f:
+            self.assertEqual(f.read(), "<html>2024 v2</html>")
+
+    def test_missing_file_is_refetched(self):
+        """Deleting a pinned page's file forces an unconditional re-fetch."""
+        self.scrape()
+        os.remove(os.path.join(self.tmp_dir, "html", "2022.html"))
+
+        requests = self.scrape()
+        self.assertIn(("/season/2022", None), requests)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp_dir, "html", "2022.html")))
+
+    def test_force_ignores_cache(self):
+        """`force=True` re-requests every season without validators."""
+        self.scrape()
+        requests = self.scrape(force=True)
+        self.assertEqual(len(requests), 3)
+        self.assertTrue(all(etag is None for _, etag in requests))
+
+
+class TestPageCache(unittest.TestCase):
+    def test_index_round_trip(self):
+        """Validators and pins survive a save/load cycle."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        index_path = os.path.join(tmp_dir, "cache.json")
+
+        cache = PageCache(index_path)
+        cache.entries["http://x/1"] = {"etag": '"abc"', "immutable": True}
+        cache.save()
+
+        reloaded = PageCache(index_path)
+        self.assertEqual(reloaded.entries["http://x/1"]["etag"], '"abc"')
+        self.assertTrue(reloaded.entries["http://x/1"]["immutable"])
+
+
+if __name__ == "__main__":
+    unittest.main()
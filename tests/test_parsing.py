@@ -1,9 +1,17 @@
 import unittest
 from unittest.mock import patch
 import os
+import shutil
+import tempfile
 import pandas as pd
 
-from src.data_collection.parsing import parse_mvp, parse_player, parse_team
+from src.data_collection import parsing
+from src.data_collection.parsing import (
+    parse_mvp,
+    parse_player,
+    parse_player_page,
+    parse_team,
+)
 from src.data_collection.constants import DIRECTORIES
 
 
@@ -122,6 +130,15 @@ class TestParsingBase(unittest.TestCase):
         if os.path.exists(team_csv):
             os.remove(team_csv)
 
+        # Remove the columnar datasets and parse partitions written alongside them
+        for data_dir, name in [
+            (self.mvp_data_dir, "mvps"),
+            (self.player_data_dir, "players"),
+            (self.team_data_dir, "teams"),
+        ]:
+            shutil.rmtree(os.path.join(data_dir, f"{name}.parquet"), ignore_errors=True)
+            shutil.rmtree(os.path.join(data_dir, "partitions"), ignore_errors=True)
+
 
 class TestParsingMVP(TestParsingBase):
     """Test cases for parsing MVP data."""
@@ -230,5 +247,88 @@ class TestParsingTeam(TestParsingBase):
         )
 
 
+class TestIncrementalParsing(unittest.TestCase):
+    """Only seasons whose HTML changed are parsed again."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.html_dir = os.path.join(self.tmp_dir, "html")
+        os.makedirs(self.html_dir)
+        self.template = """
+        <html><table id="per_game_stats">
+            <thead><tr><th>Player</th><th>PPG</th></tr></thead>
+            <tbody><tr><td>{player}</td><td>{ppg}</td></tr></tbody>
+        </table></html>
+        """
+        self.write_season(1991, "Jane Smith", 25.4)
+        self.write_season(1992, "John Doe", 19.1)
+        self.patches = [
+            patch("src.data_collection.parsing.DIRECTORIES", {"player": self.tmp_dir}),
+            patch("src.data_collection.parsing.YEARS", [1991, 1992]),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def write_season(self, year, player, ppg):
+        with open(os.path.join(self.html_dir, f"{year}.html"), "w") as f:
+            f.write(self.template.format(player=player, ppg=ppg))
+
+    def parse_counting_years(self):
+        """Runs parse_player and returns the seasons that were actually parsed."""
+        with patch(
+            "src.data_collection.parsing.parse_player_page",
+            side_effect=parse_player_page,
+        ) as mock_parse:
+            parse_player()
+        return [c.args[1] for c in mock_parse.call_args_list]
+
+    def test_only_changed_season_is_reparsed(self):
+        self.assertEqual(self.parse_counting_years(), [1991, 1992])
+        self.assertEqual(self.parse_counting_years(), [])
+
+        self.write_season(1992, "John Doe", 21.7)
+        self.assertEqual(self.parse_counting_years(), [1992])
+
+        df = pd.read_csv(os.path.join(self.tmp_dir, "data", "players.csv"))
+        self.assertEqual(list(df["Year"]), [1991, 1992])
+        self.assertEqual(df.iloc[1]["PPG"], 21.7)
+
+    def test_rewrite_with_same_content_is_not_reparsed(self):
+        self.parse_counting_years()
+        self.write_season(1991, "Jane Smith", 25.4)
+        self.assertEqual(self.parse_counting_years(), [])
+
+    def test_matches_full_parse(self):
+        self.parse_counting_years()
+        self.write_season(1991, "Jane Smith", 30.0)
+        self.parse_counting_years()
+        csv_path = os.path.join(self.tmp_dir, "data", "players.csv")
+        with open(csv_path) as f:
+            incremental = f.read()
+
+        parse_player(force=True)
+        with open(csv_path) as f:
+            self.assertEqual(f.read(), incremental)
+
+    def test_parallel_matches_serial(self):
+        csv_path = os.path.join(self.tmp_dir, "data", "players.csv")
+        parse_player(force=True)
+        with open(csv_path, "rb") as f:
+            serial = f.read()
+
+        parse_player(force=True, workers=2)
+        with open(csv_path, "rb") as f:
+            self.assertEqual(f.read(), serial)
+
+    def test_workers_are_not_forked(self):
+        # Parse stages run on scheduler threads, which fork would copy mid-lock
+        self.assertNotEqual(parsing._POOL_CONTEXT.get_start_method(), "fork")
+
+
 if __name__ == "__main__":
     unittest.main()
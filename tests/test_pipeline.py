@@ -0,0 +1,136 @@
+import unittest
+from unittest.mock import patch
+import os
+import shutil
+import tempfile
+import pandas as pd
+
+from src.data_collection.data_cleaning import DataCleaner
+from src.data_collection.pipeline import run_pipeline
+
+PAGES = {
+    "mvp": """
+    <html><table id="mvp">
+        <thead><tr><th>Player</th><th>Pts Won</th><th>Pts Max</th><th>Share</th><th>Age</th></tr></thead>
+        <tbody><tr><td>Jane Smith</td><td>891</td><td>960</td><td>0.928</td><td>27</td></tr></tbody>
+    </table></html>
+    """,
+    "player": """
+    <html><table id="per_game_stats">
+        <thead><tr><th>Rk</th><th>Player</th><th>Tm</th><th>PTS</th></tr></thead>
+        <tbody>
+            <tr><td>1</td><td>Jane Smith*</td><td>TOT</td><td>25.0</td></tr>
+            <tr><td>1</td><td>Jane Smith*</td><td>CHI</td><td>20.0</td></tr>
+            <tr><td>1</td><td>Jane Smith*</td><td>BOS</td><td>30.0</td></tr>
+            <tr><td>2</td><td>John Doe</td><td>LAL</td><td>19.1</td></tr>
+        </tbody>
+    </table></html>
+    """,
+    "team": """
+    <html>
+    <table id="divs_standings_E">
+        <thead><tr><th>Team</th><th>W</th><th>L</th></tr></thead>
+        <tbody>
+            <tr><td>Atlantic Division</td><td>Atlantic Division</td><td>Atlantic Division</td></tr>
+            <tr><td>Boston Celtics*</td><td>56</td><td>26</td></tr>
+        </tbody>
+    </table>
+    <table id="divs_standings_W">
+        <thead><tr><th>Team</th><th>W</th><th>L</th></tr></thead>
+        <tbody><tr><td>Denver Nuggets*</td><td>57</td><td>25</td></tr></tbody>
+    </table>
+    </html>
+    """,
+}
+
+
+class TestPipeline(unittest.TestCase):
+    """The single-pass pipeline hands DataFrames between stages in memory."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.directories = {}
+        for kind, page in PAGES.items():
+            directory = os.path.join(self.tmp_dir, kind)
+            os.makedirs(os.path.join(directory, "html"))
+            os.makedirs(os.path.join(directory, "data"))
+            with open(os.path.join(directory, "html", "1991.html"), "w") as f:
+                f.write(page)
+            self.directories[kind] = directory
+
+        self.state_path = os.path.join(self.tmp_dir, "pipeline_state.json")
+        self.nicknames_path = os.path.join(self.directories["team"], "data", "nicknames.csv")
+        pd.DataFrame({"prefix_1": ["chi"], "name": ["chicago bulls"]}).to_csv(
+            self.nicknames_path, index=False
+        )
+
+        self.patches = [
+            patch("src.data_collection.parsing.DIRECTORIES", self.directories),
+            patch("src.data_collection.pipeline.DIRECTORIES", self.directories),
+            patch("src.data_collection.parsing.YEARS", [1991]),
+            patch("src.data_collection.pipeline.YEARS", [1991]),
+            patch("src.data_collection.pipeline.NICKNAMES_PATH", self.nicknames_path),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    def data_files(self, kind):
+        return sorted(
+            name
+            for name in os.listdir(os.path.join(self.directories[kind], "data"))
+            if name != "partitions"
+        )
+
+    def test_matches_file_based_cleaning(self):
+        results = run_pipeline(state_path=self.state_path, scrape=False)
+        cleaner = DataCleaner()
+
+        expected_mvp = cleaner.clean_mvp(
+            os.path.join(self.directories["mvp"], "data", "mvps.csv")
+        )
+        pd.testing.assert_frame_equal(results["mvp"], expected_mvp)
+
+        expected_players = cleaner.clean_players(
+            os.path.join(self.directories["player"], "data", "players.csv")
+        )
+        pd.testing.assert_frame_equal(results["player"], expected_players)
+        self.assertEqual(list(results["player"]["Player"]), ["Jane Smith", "John Doe"])
+        self.assertEqual(list(results["team"]["Team"]), ["Boston Celtics", "Denver Nuggets"])
+
+    def test_only_requested_checkpoints_are_written(self):
+        run_pipeline(state_path=self.state_path, scrape=False, checkpoints=())
+        self.assertEqual(self.data_files("player"), [])
+
+        run_pipeline(state_path=self.state_path, scrape=False, checkpoints=("cleaned",))
+        self.assertEqual(
+            self.data_files("player"),
+            ["players_clean.csv", "players_clean.parquet"],
+        )
+
+    def test_backups_only_on_overwrite(self):
+        run_pipeline(state_path=self.state_path, scrape=False)
+        self.assertEqual(self.data_files("mvp"), ["mvps.csv", "mvps.parquet"])
+
+        # Nothing changed: outputs are not rewritten, so no backups appear
+        run_pipeline(state_path=self.state_path, scrape=False)
+        self.assertEqual(self.data_files("mvp"), ["mvps.csv", "mvps.parquet"])
+
+        page = PAGES["mvp"].replace("891", "900")
+        with open(os.path.join(self.directories["mvp"], "html", "1991.html"), "w") as f:
+            f.write(page)
+        run_pipeline(state_path=self.state_path, scrape=False)
+        self.assertEqual(
+            self.data_files("mvp"),
+            ["mvps.csv", "mvps.parquet", "mvps_backup.csv", "mvps_backup.parquet"],
+        )
+        backup = pd.read_csv(os.path.join(self.directories["mvp"], "data", "mvps_backup.csv"))
+        self.assertEqual(backup["Pts Won"].iloc[0], 891)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# tests/test_predict.py
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from benchmarks.fixtures import TEAM_ABBR_TO_ID, make_game_log
+from src.data_collection.process_data import process_data, split_data, team_state
+from src.training.predict import (
+    MicroBatcher,
+    PredictionService,
+    load_team_state,
+    make_server,
+    save_team_state,
+)
+from src.training.registry import data_hash, load_model, save_model
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("serving")
+    games, team_abbr_to_id = make_game_log(4_000)
+    processed = process_data(games.copy(), team_abbr_to_id)
+    X_train, _, y_train, _ = split_data(processed)
+    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model.fit(X_train, y_train)
+
+    save_model(model, list(X_train.columns), data_hash(X_train, y_train), {}, directory)
+    state_path = directory / "team_state.csv"
+    save_team_state(team_state(games, processed, team_abbr_to_id), state_path)
+    return PredictionService.from_registry(
+        registry_dir=directory, state_path=state_path
+    )
+
+
+# Teams can be given by abbreviation or by team ID
+MATCHUPS = pd.DataFrame(
+    {
+        "team": ["LAL", "BOS", TEAM_ABBR_TO_ID["LAL"]],
+        "opponent": ["BOS", "LAL", "NYK"],
+        "home": [1, 0, 0],
+    }
+)
+
+UNKNOWN = pd.DataFrame({"team": ["XYZ"], "opponent": ["BOS"], "home": [1]})
+
+
+def test_predictions_match_model_on_team_state(service):
+    state = service.state
+    lal, bos, nyk = (TEAM_ABBR_TO_ID[abbr] for abbr in ("LAL", "BOS", "NYK"))
+    expected_features = pd.DataFrame(
+        {
+            "TEAM_ID": state.loc[[lal, bos, lal], "TEAM_CODE"].to_numpy(),
+            "OPPONENT_TEAM_ID": state.loc[[bos, lal, nyk], "OPPONENT_CODE"].to_numpy(),
+            "Points_Per_Game": state.loc[[lal, bos, lal], "Points_Per_Game"].to_numpy(),
+            "HOME_GAME": [1, 0, 0],
+            "LAST_GAME_RESULT": state.loc[
+                [lal, bos, lal], "LAST_GAME_RESULT"
+            ].to_numpy(),
+        }
+    )
+    pd.testing.assert_frame_equal(
+        service.features(MATCHUPS), expected_features, check_dtype=False
+    )
+    np.testing.assert_allclose(
+        service.predict(MATCHUPS),
+        service.artifact.model.predict_proba(expected_features)[:, 1],
+    )
+
+
+def test_team_state_round_trip(service, tmp_path):
+    save_team_state(service.state, tmp_path / "state.csv")
+    pd.testing.assert_frame_equal(load_team_state(tmp_path / "state.csv"), service.state)
+
+
+def test_unknown_team_is_rejected(service):
+    with pytest.raises(ValueError, match="XYZ"):
+        service.predict(UNKNOWN)
+
+
+def test_micro_batcher_isolates_bad_requests(service):
+    batcher = MicroBatcher(service.predict, max_wait=0.05)
+    good = batcher.submit(MATCHUPS)
+    bad = batcher.submit(UNKNOWN)
+    np.testing.assert_allclose(good.result(), service.predict(MATCHUPS))
+    with pytest.raises(ValueError):
+        bad.result()
+    batcher.close()
+
+
+def post(url, body):
+    request = urllib.request.Request(
+        url, json.dumps(body).encode("utf-8"), {"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def test_http_endpoint_batches_concurrent_requests(service):
+    server = make_server(service, port=0, max_wait=0.02)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    body = {"matchups": MATCHUPS.to_dict(orient="records")}
+    expected = service.predict(MATCHUPS)
+    try:
+        results = [None] * 16
+
+        def call(i):
+            results[i] = post(f"{base_url}/predict", body)["win_probability"]
+
+        callers = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        for result in results:
+            np.testing.assert_allclose(result, expected)
+        with urllib.request.urlopen(f"{base_url}/stats") as response:
+            stats = json.loads(response.read())
+        assert stats["requests"] == 16
+        assert stats["batches"] < 16
+        assert 0 < stats["p50_ms"] <= stats["p99_ms"]
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post(f"{base_url}/predict", {"matchups": UNKNOWN.to_dict("records")})
+        assert error.value.code == 400
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.close()
+
+
+def test_service_rejects_models_with_unserved_features(service, tmp_path):
+    X = pd.DataFrame({"TEAM_ID": [0, 1, 0, 1], "REST_DAYS": [1.0, 2.0, 3.0, 1.0]})
+    y = pd.Series([0, 1, 1, 0])
+    model = RandomForestClassifier(n_estimators=2, random_state=0).fit(X, y)
+    save_model(model, list(X.columns), data_hash(X, y), {}, tmp_path)
+
+    with pytest.raises(ValueError, match="REST_DAYS"):
+        PredictionService(load_model(registry_dir=tmp_path), service.state)
+
+
+class FailingService:
+    def predict(self, matchups):
+        raise IndexError("index 2 is out of bounds")
+
+
+def test_http_endpoint_reports_internal_errors_as_json():
+    server = make_server(FailingService(), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post(f"{base_url}/predict", {"matchups": MATCHUPS.to_dict("records")})
+        assert error.value.code == 500
+        assert "IndexError" in json.loads(error.value.read())["error"]
+
+        with urllib.request.urlopen(f"{base_url}/stats") as response:
+            assert json.loads(response.read())["requests"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.close()
@@ -0,0 +1,159 @@
+# tests/test_process_data.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_process_data import legacy_features, legacy_process_data
+from benchmarks.fixtures import make_game_log
+from src.data_collection.features import add_game_features
+from src.data_collection.process_data import (
+    LEAK_FREE_FEATURES,
+    home_games,
+    iter_process_data,
+    opponent_team_ids,
+    process_data,
+    process_data_file,
+    rolling_origin_splits,
+    split_data,
+)
+from src.data_collection.schema import FEATURE_SCHEMA, GAME_SCHEMA, apply_schema
+
+TEAM_ABBR_TO_ID = {"LAL": 1610612747, "BOS": 1610612738, "NYK": 1610612752}
+
+# The dtypes process_data leaves the columns it touches in
+OUTPUT_SCHEMA = {**FEATURE_SCHEMA, "PTS": GAME_SCHEMA["PTS"]}
+
+
+def test_matches_row_wise_apply_on_game_log():
+    games, team_abbr_to_id = make_game_log(5_000)
+    expected = legacy_process_data(games.copy(), team_abbr_to_id)
+    expected = apply_schema(expected, OUTPUT_SCHEMA)
+    actual = process_data(games.copy(), team_abbr_to_id)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected)
+
+
+def test_chunked_file_matches_in_memory(tmp_path):
+    games, team_abbr_to_id = make_game_log(5_000)
+    path, output_path = tmp_path / "games.csv", tmp_path / "features.csv"
+    games.to_csv(path, index=False)
+
+    rows = process_data_file(path, team_abbr_to_id, output_path, chunksize=700)
+
+    expected = process_data(pd.read_csv(path, dtype={"GAME_ID": str}), team_abbr_to_id)
+    actual = pd.read_csv(output_path, dtype={"GAME_ID": str}, parse_dates=["GAME_DATE"])
+    actual = apply_schema(actual, OUTPUT_SCHEMA)
+    assert rows == len(games)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_per_team_partitions_match_in_memory():
+    games, team_abbr_to_id = make_game_log(5_000)
+    partitions = [team for _, team in games.groupby("TEAM_ID", sort=False)]
+
+    chunks = list(iter_process_data(lambda: iter(partitions), team_abbr_to_id))
+
+    expected = process_data(games.copy(), team_abbr_to_id)
+    pd.testing.assert_frame_equal(pd.concat(chunks).sort_index(), expected)
+    # The raw partitions are left untouched
+    assert partitions[0]["GAME_DATE"].dtype == object
+
+
+@pytest.mark.parametrize(
+    "matchup",
+    [
+        "LAL vs. BOS",
+        "LAL @ BOS",
+        "BOS @ LAL",
+        "LAL vs. SEA",  # Unknown opponent falls back to the team's own ID
+        "LAL@BOS",  # '@' without spaces is not split
+        "LAL vs. BOS @ NYK",  # '@' wins over 'vs.'
+        "LAL vs. BOS vs. NYK",  # Last separator wins
+        "LAL vs.BOS",
+        "NYK",
+    ],
+)
+def test_matchup_edge_cases(matchup):
+    games = pd.DataFrame(
+        {"TEAM_ID": [1610612747, 1610612752], "MATCHUP": [matchup, "NYK vs. LAL"]}
+    )
+    expected = legacy_features(games.assign(WL="W"), TEAM_ABBR_TO_ID)
+
+    opponents = opponent_team_ids(games["MATCHUP"], games["TEAM_ID"], TEAM_ABBR_TO_ID)
+    pd.testing.assert_series_equal(
+        opponents, expected["OPPONENT_TEAM_ID"], check_names=False
+    )
+    pd.testing.assert_series_equal(
+        home_games(games["MATCHUP"]), expected["HOME_GAME"], check_names=False
+    )
+
+
+def test_split_data_holds_out_the_latest_games():
+    games, team_abbr_to_id = make_game_log(5_000)
+    processed = process_data(games, team_abbr_to_id)
+    shuffled = processed.sample(frac=1, random_state=0)
+
+    X_train, X_test, y_train, y_test = split_data(shuffled)
+
+    dates = pd.to_datetime(shuffled["GAME_DATE"])
+    assert len(X_train) + len(X_test) == len(shuffled)
+    assert abs(len(X_test) - 0.2 * len(shuffled)) < 50
+    # Every training game is strictly older than every test game
+    assert dates[X_train.index].max() < dates[X_test.index].min()
+    assert X_train.index.equals(y_train.index) and X_test.index.equals(y_test.index)
+
+
+def test_split_data_slices_sorted_logs_without_copying():
+    games, team_abbr_to_id = make_game_log(5_000)
+    processed = process_data(games, team_abbr_to_id).sort_values(
+        "GAME_DATE", kind="mergesort"
+    )
+
+    X_train, X_test, _, _ = split_data(processed)
+
+    train = X_train["Points_Per_Game"].to_numpy()
+    test = X_test["Points_Per_Game"].to_numpy()
+    assert train.base is not None and train.base is test.base
+
+
+def test_split_data_on_leak_free_features():
+    games, team_abbr_to_id = make_game_log(5_000)
+    processed = add_game_features(process_data(games, team_abbr_to_id))
+
+    X_train, X_test, _, _ = split_data(processed, features=LEAK_FREE_FEATURES)
+
+    assert list(X_train.columns) == LEAK_FREE_FEATURES
+    assert "Points_Per_Game" not in X_test and len(X_train) + len(X_test) == 5_000
+
+
+def test_rolling_origin_splits_train_on_earlier_seasons_only():
+    games, team_abbr_to_id = make_game_log(5_000)
+    processed = process_data(games, team_abbr_to_id)
+    dates = pd.to_datetime(processed["GAME_DATE"]).to_numpy()
+
+    folds = list(rolling_origin_splits(processed, n_splits=3, max_train_periods=2))
+
+    assert len(folds) == 3
+    for train, test in folds:
+        assert len(np.intersect1d(train, test)) == 0
+        assert dates[train].max() < dates[test].min()
+        assert processed["SEASON_ID"].iloc[test].nunique() == 1
+        assert processed["SEASON_ID"].iloc[train].nunique() == 2
+    first_test = [dates[test].min() for _, test in folds]
+    assert first_test == sorted(first_test)
+
+
+def test_rolling_origin_splits_group_season_types_into_one_season():
+    games, team_abbr_to_id = make_game_log(5_000)
+    processed = process_data(games, team_abbr_to_id)
+    # Preseason, regular season and playoff rows of the same seasons
+    prefixes = np.random.default_rng(0).choice(["1", "2", "4"], len(processed))
+    years = processed["SEASON_ID"].astype(str).str[-4:]
+    processed["SEASON_ID"] = prefixes + years.to_numpy()
+
+    folds = list(rolling_origin_splits(processed, n_splits=3, max_train_periods=2))
+
+    assert len(folds) == 3
+    for train, test in folds:
+        (year,) = years.iloc[test].unique()
+        np.testing.assert_array_equal(test, np.flatnonzero(years == year))
+        assert years.iloc[train].nunique() == 2
@@ -0,0 +1,77 @@
+# tests/test_registry.py
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from src.training.registry import (
+    data_hash,
+    list_versions,
+    load_model,
+    save_model,
+)
+
+FEATURES = ["TEAM_ID", "OPPONENT_TEAM_ID", "Points_Per_Game", "HOME_GAME"]
+
+
+@pytest.fixture(scope="module")
+def training_set():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((500, len(FEATURES))), columns=FEATURES)
+    y = pd.Series((X["Points_Per_Game"] > 0.5).astype(int), name="WIN")
+    model = RandomForestClassifier(n_estimators=10, random_state=42).fit(X, y)
+    return X, y, model
+
+
+@pytest.mark.parametrize("compress", [0, 3])
+def test_round_trip(tmp_path, training_set, compress):
+    X, y, model = training_set
+    version = save_model(
+        model, FEATURES, data_hash(X, y), {"accuracy": 0.9}, tmp_path, compress
+    )
+    artifact = load_model(version, tmp_path)
+
+    assert artifact.version == 1
+    assert artifact.features == FEATURES
+    assert artifact.metadata["training_data_hash"] == data_hash(X, y)
+    assert artifact.metadata["metrics"] == {"accuracy": 0.9}
+    # Columns are selected by the stored feature list, whatever their order
+    np.testing.assert_array_equal(
+        artifact.predict_proba(X[FEATURES[::-1]]), model.predict_proba(X)
+    )
+
+
+def test_model_loads_lazily(tmp_path, training_set):
+    X, y, model = training_set
+    save_model(model, FEATURES, data_hash(X, y), {}, tmp_path)
+    artifact = load_model(registry_dir=tmp_path)
+    assert artifact._model is None
+    artifact.predict(X)
+    assert artifact._model is not None
+
+
+def test_versions_increment_and_latest_is_default(tmp_path, training_set):
+    X, y, model = training_set
+    for accuracy in (0.6, 0.7, 0.8):
+        save_model(model, FEATURES, data_hash(X, y), {"accuracy": accuracy}, tmp_path)
+
+    assert list_versions(tmp_path) == [1, 2, 3]
+    assert load_model(registry_dir=tmp_path).metadata["metrics"]["accuracy"] == 0.8
+    assert load_model(2, tmp_path).metadata["metrics"]["accuracy"] == 0.7
+    with open(tmp_path / "v1" / "metadata.json", encoding="utf-8") as file:
+        assert json.load(file)["model"] == "RandomForestClassifier"
+
+
+def test_missing_versions(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_model(registry_dir=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        load_model(7, tmp_path)
+
+
+def test_data_hash_tracks_training_data(training_set):
+    X, y, _ = training_set
+    assert data_hash(X, y) == data_hash(X.copy(), y.copy())
+    assert data_hash(X, y) != data_hash(X, 1 - y)
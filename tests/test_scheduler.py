@@ -0,0 +1,141 @@
+# tests/test_scheduler.py
+import os
+import threading
+import time
+
+import pytest
+
+from src.data_collection.scheduler import Scheduler, Stage
+
+
+def write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def copy_stage(name, source, target, calls, deps=()):
+    """A stage that copies `source` to `target` and records that it ran."""
+
+    def run(results):
+        calls.append(name)
+        with open(source) as f:
+            text = f.read()
+        write(target, text)
+        return text
+
+    def load():
+        with open(target) as f:
+            return f.read()
+
+    return Stage(name, run, deps=deps, inputs=[source], outputs=[target], load=load)
+
+
+def test_independent_branches_run_concurrently(tmp_path):
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [
+        Stage("a", lambda _: barrier.wait()),
+        Stage("b", lambda _: barrier.wait()),
+        Stage("c", lambda results: sorted(results), deps=["a", "b"]),
+    ]
+    report = Scheduler(stages, str(tmp_path / "state.json")).run()
+    assert [report["stages"][name]["status"] for name in "abc"] == ["ran"] * 3
+    assert report["results"]["c"] == ["a", "b"]
+
+
+def test_shared_resource_runs_one_at_a_time(tmp_path):
+    active = []
+    overlap = []
+
+    def scrape(_):
+        active.append(1)
+        overlap.append(len(active))
+        time.sleep(0.05)
+        active.pop()
+
+    stages = [Stage(name, scrape, resource="site") for name in ("x", "y", "z")]
+    Scheduler(stages, str(tmp_path / "state.json")).run()
+    assert overlap == [1, 1, 1]
+
+
+def test_unchanged_stages_are_skipped(tmp_path):
+    raw, parsed, cleaned = (str(tmp_path / name) for name in ("raw", "parsed", "cleaned"))
+    write(raw, "v1")
+    calls = []
+    state = str(tmp_path / "state.json")
+
+    def stages():
+        return [
+            copy_stage("parse", raw, parsed, calls),
+            copy_stage("clean", parsed, cleaned, calls, deps=["parse"]),
+        ]
+
+    Scheduler(stages(), state).run()
+    assert calls == ["parse", "clean"]
+
+    report = Scheduler(stages(), state).run()
+    assert calls == ["parse", "clean"]
+    assert report["stages"]["clean"]["status"] == "skipped"
+
+    # A changed input re-runs its stage and everything downstream of it
+    write(raw, "version 2")
+    Scheduler(stages(), state).run()
+    assert calls == ["parse", "clean"] * 2
+    with open(cleaned) as f:
+        assert f.read() == "version 2"
+
+    # A deleted output re-runs only the stage that produced it
+    os.remove(cleaned)
+    Scheduler(stages(), state).run()
+    assert calls == ["parse", "clean"] * 2 + ["clean"]
+
+
+def test_resume_after_failure(tmp_path):
+    raw, parsed = str(tmp_path / "raw"), str(tmp_path / "parsed")
+    write(raw, "rows")
+    calls = []
+    state = str(tmp_path / "state.json")
+    fail = [True]
+
+    def clean(results):
+        calls.append("clean")
+        if fail[0]:
+            raise RuntimeError("bad row")
+        return results["parse"].upper()
+
+    def stages():
+        return [
+            copy_stage("parse", raw, parsed, calls),
+            Stage("clean", clean, deps=["parse"]),
+            Stage("report", lambda results: results["clean"] + "!", deps=["clean"]),
+        ]
+
+    report = Scheduler(stages(), state).run()
+    assert report["stages"]["clean"]["status"] == "failed"
+    assert report["stages"]["report"]["status"] == "blocked"
+
+    fail[0] = False
+    report = Scheduler(stages(), state).run()
+    assert calls == ["parse", "clean", "clean"]
+    assert report["stages"]["parse"]["status"] == "skipped"
+    assert report["results"]["report"] == "ROWS!"
+
+
+def test_critical_path(tmp_path):
+    stages = [
+        Stage("scrape", lambda _: time.sleep(0.05)),
+        Stage("parse", lambda _: time.sleep(0.1), deps=["scrape"]),
+        Stage("quick", lambda _: None),
+        Stage("merge", lambda _: None, deps=["parse", "quick"]),
+    ]
+    report = Scheduler(stages, str(tmp_path / "state.json")).run()
+    assert report["critical_path"] == ["scrape", "parse", "merge"]
+    assert report["critical_path_seconds"] >= 0.15
+
+
+def test_cycles_are_rejected(tmp_path):
+    stages = [
+        Stage("a", lambda _: None, deps=["b"]),
+        Stage("b", lambda _: None, deps=["a"]),
+    ]
+    with pytest.raises(ValueError, match="Cycle"):
+        Scheduler(stages, str(tmp_path / "state.json"))
@@ -0,0 +1,112 @@
+# tests/test_schema.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import make_game_log
+from src.data_collection.data_cleaning import DataCleaner
+from src.data_collection.schema import (
+    GAME_SCHEMA,
+    PLAYER_SCHEMA,
+    apply_schema,
+    downcast,
+    memory_report,
+    read_csv_schema,
+)
+
+
+@pytest.mark.parametrize(
+    "values, dtype, expected",
+    [
+        ([82.0, 41.0], "int16", "int16"),
+        ([82.0, np.nan], "int16", "float32"),  # Missing values keep a float
+        ([82.5, 41.0], "int16", "float32"),  # Fractions are not truncated
+        ([1610612747, 1], "int16", "int64"),  # Out of range is left alone
+        ([31.5, 7.25], "float32", "float32"),
+        (["12", "Division"], "int16", "object"),  # Text is left alone
+    ],
+)
+def test_downcast_never_loses_values(values, dtype, expected):
+    original = pd.Series(values, name="G")
+
+    result = downcast(original, dtype)
+
+    assert result.dtype == expected
+    pd.testing.assert_series_equal(result, original, check_dtype=False)
+
+
+def test_str_target_keeps_missing_values():
+    ids = pd.Series([22300001.0, np.nan], name="GAME_ID")
+
+    result = downcast(ids, str)
+
+    assert isinstance(result.iloc[0], str) and pd.isna(result.iloc[1])
+
+
+def test_apply_game_schema_to_numeric_game_ids():
+    games, _ = make_game_log(100)
+    games["GAME_ID"] = games["GAME_ID"].astype("int64")
+
+    result = apply_schema(games, GAME_SCHEMA)
+
+    assert result["GAME_ID"].dtype == object
+    assert isinstance(result["GAME_ID"].iloc[0], str)
+
+
+def test_categoricals_drop_unused_categories():
+    teams = pd.Series(["LAL", "BOS", "LAL"], dtype="category")
+
+    result = downcast(teams[teams == "LAL"], "category")
+
+    assert list(result.cat.categories) == ["LAL"]
+
+
+def test_read_csv_schema_parses_compact_dtypes(tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_text(
+        "Rk,Player,Age,Team,Pos,G,PTS,Year\n"
+        "1.0,Michael Jordan,27.0,CHI,SG,82.0,31.5,1991\n"
+        "2.0,Karl Malone,,UTA,PF,82.0,29.0,1991\n"
+    )
+
+    df = read_csv_schema(path, PLAYER_SCHEMA)
+
+    assert df.dtypes.to_dict() == {
+        "Rk": "int16",
+        "Player": "category",
+        "Age": "float32",
+        "Team": "category",
+        "Pos": "category",
+        "G": "int16",
+        "PTS": "float32",
+        "Year": "int16",
+    }
+    assert np.isnan(df["Age"].iloc[1])
+
+
+def test_clean_players_returns_compact_dtypes(tmp_path):
+    path = tmp_path / "players.csv"
+    path.write_text(
+        "Rk,Player,Year,Tm,PTS\n"
+        "1,John Doe*,2001,LAL,10.5\n2,John Doe,2001,TOT,11.0\n3,Jane Smith,2001,LAC,8.0\n"
+    )
+
+    df = DataCleaner().clean_players(str(path))
+
+    assert df["Player"].tolist() == ["Jane Smith", "John Doe"]
+    assert df["Tm"].tolist() == ["LAC", "LAL"]
+    assert isinstance(df["Player"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["Tm"].dtype, pd.CategoricalDtype)
+    assert df["PTS"].dtype == "float32" and df["Year"].dtype == "int16"
+
+
+def test_memory_report_on_game_log():
+    games, _ = make_game_log(20_000)
+
+    report = memory_report(games, GAME_SCHEMA)
+
+    assert report.loc["MATCHUP", "compact_dtype"] == "category"
+    assert report.loc["PTS", "compact_dtype"] == "int16"
+    assert report.loc["Total", "compact_bytes"] < report.loc["Total", "bytes"] / 2
+    # The frame that was measured is left as loaded
+    assert games["MATCHUP"].dtype == object
@@ -2,10 +2,12 @@
 import unittest
 from unittest.mock import patch
 import os
+import shutil
+import tempfile
 import logging
 
 from src.data_collection.scraping import scrape_mvp, scrape_player, scrape_team
-from src.data_collection.constants import DIRECTORIES, YEARS
+from src.data_collection.constants import YEARS
 
 # Configure logging for the test module
 logging.basicConfig(
@@ -16,11 +18,25 @@ logging.basicConfig(
 
 
 class TestScraping(unittest.TestCase):
-    @patch("src.data_collection.scraping.requests.get")
+    def setUp(self):
+        # Scrape into a temporary tree so pages and html/cache.json stay out of src/
+        self.tmp_dir = tempfile.mkdtemp()
+        self.directories = {
+            kind: os.path.join(self.tmp_dir, kind) for kind in ("mvp", "player", "team")
+        }
+        self.patch = patch("src.data_collection.scraping.DIRECTORIES", self.directories)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.tmp_dir)
+
+    @patch("src.data_collection.fetcher.requests.get")
     def test_scrape_mvp(self, mock_get):
         """Test scraping MVP data with mocked HTTP requests."""
         logging.info("[TEST] Starting test for scrape_mvp...")
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
         mock_get.return_value.text = "<html><body>Mock Data</body></html>"
 
         logging.info("[TEST] Calling scrape_mvp()...")
@@ -28,7 +44,7 @@ class TestScraping(unittest.TestCase):
 
         # Verify that files were created for all years
         for year in range(1991, 2024):
-            file_path = os.path.join(DIRECTORIES["mvp"], "html", f"{year}.html")
+            file_path = os.path.join(self.directories["mvp"], "html", f"{year}.html")
             logging.info(f"[TEST] Checking file: {file_path}")
             self.assertTrue(os.path.exists(file_path))
             logging.info(f"[TEST] File found for year {year}. Removing file...")
@@ -36,11 +52,12 @@ class TestScraping(unittest.TestCase):
 
         logging.info("[TEST] scrape_mvp test completed successfully.\n")
 
-    @patch("src.data_collection.scraping.requests.get")
+    @patch("src.data_collection.fetcher.requests.get")
     def test_scrape_player(self, mock_get):
         """Test scraping Player data with mocked HTTP requests."""
         logging.info("[TEST] Starting test for scrape_player...")
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
         mock_get.return_value.text = "<html><body>Mock Player Data</body></html>"
 
         logging.info("[TEST] Calling scrape_player()...")
@@ -48,7 +65,7 @@ class TestScraping(unittest.TestCase):
 
         # Verify that files were created for all years
         for year in YEARS:
-            file_path = os.path.join(DIRECTORIES["player"], "html", f"{year}.html")
+            file_path = os.path.join(self.directories["player"], "html", f"{year}.html")
             logging.info(f"[TEST] Checking file: {file_path}")
             self.assertTrue(os.path.exists(file_path))
             logging.info(f"[TEST] File found for year {year}. Removing file...")
@@ -56,11 +73,12 @@ class TestScraping(unittest.TestCase):
 
         logging.info("[TEST] scrape_player test completed successfully.\n")
 
-    @patch("src.data_collection.scraping.requests.get")
+    @patch("src.data_collection.fetcher.requests.get")
     def test_scrape_team(self, mock_get):
         """Test scraping team data with mocked HTTP requests."""
         logging.info("[TEST] Starting test for scrape_team...")
         mock_get.return_value.status_code = 200
+        mock_get.return_value.headers = {}
         mock_get.return_value.text = "<html><body>Mock Team Data</body></html>"
 
         logging.info("[TEST] Calling scrape_team()...")
@@ -68,7 +86,7 @@ class TestScraping(unittest.TestCase):
 
         # Verify that files were created for all years
         for year in YEARS:
-            file_path = os.path.join(DIRECTORIES["team"], "html", f"{year}.html")
+            file_path = os.path.join(self.directories["team"], "html", f"{year}.html")
             logging.info(f"[TEST] Checking file: {file_path}")
             self.assertTrue(os.path.exists(file_path))
             logging.info(f"[TEST] File found for year {year}. Removing file...")
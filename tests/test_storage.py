@@ -0,0 +1,67 @@
+# tests/test_storage.py
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_collection.storage import (
+    dataset_path,
+    load_dataset,
+    read_dataset,
+    save_dataset,
+    write_dataset,
+)
+
+
+@pytest.fixture
+def players():
+    """A small player frame spanning three seasons, with missing values."""
+    return pd.DataFrame({
+        "Player": ["Michael Jordan", "Karl Malone", "Luka Doncic", "Joel Embiid", "Nikola Jokic"],
+        "Team": ["CHI", "UTA", "DAL", "PHI", np.nan],
+        "PTS": [31.5, 29.0, 33.9, 34.7, 26.4],
+        "G": [82, 82, 70, 39, 79],
+        "Year": [1991, 1991, 2024, 2024, 2025],
+        "Awards": ["MVP-1,AS", np.nan, "MVP-3", "AS", "MVP-1"],
+    })
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_round_trip(tmp_path, players, fmt):
+    path = str(tmp_path / f"players.{fmt}")
+    write_dataset(players, path, fmt)
+    assert sorted(os.listdir(path)) == ["Year=1991", "Year=2024", "Year=2025"]
+    pd.testing.assert_frame_equal(read_dataset(path), players)
+
+
+def test_projection_and_pushdown(tmp_path, players):
+    path = str(tmp_path / "players.parquet")
+    write_dataset(players, path)
+
+    # Corrupt a partition the filter excludes; it must never be opened
+    stale = os.path.join(path, "Year=2025", "part-0.parquet")
+    with open(stale, "wb") as f:
+        f.write(b"not parquet")
+
+    df = read_dataset(
+        path, columns=["Player", "Year"], filters=[("Year", "in", [1991, 2024])]
+    )
+    assert list(df.columns) == ["Player", "Year"]
+    assert df["Player"].tolist() == [
+        "Michael Jordan", "Karl Malone", "Luka Doncic", "Joel Embiid"
+    ]
+
+
+def test_csv_export_and_fallback(tmp_path, players):
+    data_dir = str(tmp_path)
+    paths = save_dataset(players, data_dir, "players", export_csv=True)
+    assert paths == [
+        dataset_path(data_dir, "players"),
+        dataset_path(data_dir, "players", "csv"),
+    ]
+    pd.testing.assert_frame_equal(pd.read_csv(paths[1]), players)
+
+    filters = [("Year", "==", 2024)]
+    columnar = load_dataset(data_dir, "players", ["Player", "PTS"], filters)
+    from_csv = load_dataset(data_dir, "players", ["Player", "PTS"], filters, fmt="csv")
+    pd.testing.assert_frame_equal(columnar, from_csv)
@@ -0,0 +1,102 @@
+# tests/test_tables.py
+from io import StringIO
+
+import pandas as pd
+import pytest
+from bs4 import BeautifulSoup
+
+from src.data_collection.tables import drop_first_row, parse_document, read_table
+
+PLAYER_PAGE = """
+<html><body>
+<div><a href="#">Nav</a></div>
+<table id="per_game_stats">
+  <thead><tr><th>Rk</th><th>Player</th><th>Age</th><th>Team</th><th>PTS</th><th>Awards</th></tr></thead>
+  <tbody>
+    <tr><th scope="row">1</th><td><a href="/p/1">Michael Jordan*</a></td><td>27</td><td>CHI</td><td>31.5</td><td>MVP-1,DPOY-7,AS</td></tr>
+    <tr><th scope="row">2</th><td>Karl Malone</td><td>27</td><td>UTA</td><td>29.0</td><td></td></tr>
+    <tr class="thead"><th>Rk</th><th>Player</th><th>Age</th><th>Team</th><th>PTS</th><th>Awards</th></tr>
+    <tr><th scope="row"></th><td>League Average</td><td>26.6</td><td></td><td>12.1</td><td></td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+STANDINGS_PAGE = """
+<html><body>
+<table id="divs_standings_E">
+  <thead><tr><th>Eastern Conference</th><th>W</th><th>L</th><th>W/L%</th><th>GB</th></tr></thead>
+  <tbody>
+    <tr class="thead"><th colspan="5">Atlantic Division</th></tr>
+    <tr><th>Boston Celtics*</th><td>56</td><td>26</td><td>.683</td><td>—</td></tr>
+    <tr><th>Philadelphia 76ers*</th><td>44</td><td>38</td><td>.537</td><td>12.0</td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+EDGE_CASES = [
+    # Thousands separators, NA tokens and a column that is entirely empty
+    """<table id="t"><thead><tr><th>Pts</th><th>Note</th><th>Empty</th></tr></thead>
+    <tbody><tr><td>1,210</td><td>N/A</td><td></td></tr>
+    <tr><td>987</td><td>first, place</td><td></td></tr></tbody></table>""",
+    # Duplicate and blank header names
+    """<table id="t"><thead><tr><th>G</th><th>G</th><th></th></tr></thead>
+    <tbody><tr><td>1</td><td>2</td><td>x</td></tr></tbody></table>""",
+    # No <thead>: leading all-<th> rows become the header; rowspan is copied down
+    """<table id="t"><tr><th>Team</th><th>Seed</th></tr>
+    <tr><td rowspan="2">LAL</td><td>1</td></tr><tr><td>2</td></tr></table>""",
+    # Two header rows, one of them empty, and whitespace to collapse
+    """<table id="t"><thead><tr></tr><tr><th>Team</th><th>W</th></tr></thead>
+    <tbody><tr><td>  Los   Angeles
+    Lakers </td><td>48</td></tr></tbody></table>""",
+    # Hidden cells are ignored, ragged rows are padded
+    """<table id="t"><thead><tr><th>A</th><th>B</th><th>C</th></tr></thead>
+    <tbody><tr><td>1</td><td style="display: none">x</td><td>2</td></tr>
+    <tr><td>3</td></tr></tbody></table>""",
+]
+
+
+def read_html_reference(page, table_id, drop_class=None):
+    """The previous BeautifulSoup + pd.read_html path."""
+    soup = BeautifulSoup(page, "html.parser")
+    if drop_class:
+        row = soup.find("tr", class_=drop_class)
+        if row:
+            row.decompose()
+    return pd.read_html(StringIO(str(soup.find(id=table_id))))[0]
+
+
+def read_table_fast(page, table_id, drop_class=None):
+    doc = parse_document(page)
+    if drop_class:
+        drop_first_row(doc, drop_class)
+    return read_table(doc, table_id)
+
+
+@pytest.mark.parametrize(
+    "page, table_id, drop_class",
+    [
+        (PLAYER_PAGE, "per_game_stats", "thead"),
+        (PLAYER_PAGE, "per_game_stats", None),
+        (STANDINGS_PAGE, "divs_standings_E", None),
+    ]
+    + [(page, "t", None) for page in EDGE_CASES],
+)
+def test_matches_read_html(page, table_id, drop_class):
+    expected = read_html_reference(page, table_id, drop_class)
+    actual = read_table_fast(page, table_id, drop_class)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_missing_table_returns_none():
+    assert read_table(parse_document(PLAYER_PAGE), "mvp") is None
+    assert read_table(parse_document(""), "mvp") is None
+
+
+def test_drop_first_row_removes_only_first():
+    doc = parse_document(PLAYER_PAGE)
+    drop_first_row(doc, "thead")
+    df = read_table(doc, "per_game_stats")
+    assert "Rk" not in df["Rk"].astype(str).values
+    assert len(df) == 3